@@ -37,6 +37,8 @@
   {ref}``get_available_plugin_names` <nonebot.plugin.get_available_plugin_names>`
 - `get_plugin_config` => {ref}``get_plugin_config` <nonebot.plugin.get_plugin_config>`
 - `require` => {ref}``require` <nonebot.plugin.load.require>`
+- `get_dispatch_stats` =>
+  {ref}``get_dispatch_stats` <nonebot.message.get_dispatch_stats>`
 
 FrontMatter:
     mdx:
@@ -56,7 +58,12 @@ from nonebot.compat import model_dump
 from nonebot.config import DOTENV_TYPE, Config, Env
 from nonebot.drivers import ASGIMixin, Driver, combine_driver
 from nonebot.log import logger as logger
-from nonebot.utils import escape_tag, resolve_dot_notation
+from nonebot.utils import (
+    escape_tag,
+    resolve_dot_notation,
+    set_executors,
+    set_inline_single_task,
+)
 
 try:
     __version__ = version("nonebot2")
@@ -310,6 +317,8 @@ def init(*, _env_file: DOTENV_TYPE | None = None, **kwargs: Any) -> None:
         logger.configure(
             extra={"nonebot_log_level": config.log_level}, patcher=_log_patcher
         )
+        set_inline_single_task(config.inline_single_task)
+        set_executors(config.sync_executors)
         logger.opt(colors=True).info(
             f"Current <y><b>Env: {escape_tag(env.environment)}</b></y>"
         )
@@ -337,6 +346,7 @@ def run(*args: Any, **kwargs: Any) -> None:
     get_driver().run(*args, **kwargs)
 
 
+from nonebot.message import get_dispatch_stats as get_dispatch_stats
 from nonebot.plugin import CommandGroup as CommandGroup
 from nonebot.plugin import MatcherGroup as MatcherGroup
 from nonebot.plugin import get_available_plugin_names as get_available_plugin_names
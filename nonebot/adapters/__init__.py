@@ -10,11 +10,18 @@ FrontMatter:
 """
 
 from nonebot.internal.adapter import Adapter as Adapter
+from nonebot.internal.adapter import ApiCache as ApiCache
+from nonebot.internal.adapter import ApiCacheRule as ApiCacheRule
+from nonebot.internal.adapter import ApiGovernor as ApiGovernor
 from nonebot.internal.adapter import Bot as Bot
 from nonebot.internal.adapter import Event as Event
+from nonebot.internal.adapter import GovernorStatistics as GovernorStatistics
 from nonebot.internal.adapter import Message as Message
+from nonebot.internal.adapter import MessageBuilder as MessageBuilder
 from nonebot.internal.adapter import MessageSegment as MessageSegment
 from nonebot.internal.adapter import MessageTemplate as MessageTemplate
+from nonebot.internal.adapter import SendBuffer as SendBuffer
+from nonebot.internal.adapter import TokenBucket as TokenBucket
 
 __autodoc__ = {
     "Bot": True,
@@ -28,4 +35,11 @@ __autodoc__ = {
     "MessageSegment.__str__": True,
     "MessageSegment.__add__": True,
     "MessageTemplate": True,
+    "MessageBuilder": True,
+    "ApiGovernor": True,
+    "GovernorStatistics": True,
+    "TokenBucket": True,
+    "ApiCache": True,
+    "ApiCacheRule": True,
+    "SendBuffer": True,
 }
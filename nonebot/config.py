@@ -20,7 +20,7 @@ from ipaddress import IPv4Address
 import json
 import os
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, TypeAlias, get_args, get_origin
+from typing import TYPE_CHECKING, Any, Literal, TypeAlias, get_args, get_origin
 
 from dotenv import dotenv_values
 from pydantic import BaseModel, Field
@@ -480,6 +480,200 @@ class Config(BaseSettings):
         SESSION_EXPIRE_TIMEOUT=[±]P[DD]DT[HH]H[MM]M[SS]S  # ISO 8601
         ```
     """
+    session_continuation: bool = False
+    """是否使用会话续体保存等待用户回复的会话。
+
+    启用后 `got`、`reject`、`pause` 等会话控制将不再为每一轮对话创建新的临时事件响应器，
+    而是将剩余的事件处理函数与会话状态保存至 {ref}`nonebot.matcher.continuations`，
+    由事件分发时以优先级 `0` 恢复运行。
+
+    用法:
+        ```conf
+        SESSION_CONTINUATION=true
+        ```
+    """
+
+    # event dispatch configs
+    event_queue_size: int = Field(default=0, ge=0)
+    """事件分发队列容量，分发模式为 `session` 时为每个处理通道的队列容量。
+
+    为 `0` 时不启用事件分发队列，适配器提交的事件将立即并发处理。
+
+    :::tip[提示]
+    事件分发队列仅处理适配器通过 {ref}`nonebot.drivers.Driver.submit_event`
+    提交的事件，直接调用 {ref}`nonebot.message.handle_event` 的适配器
+    不受队列相关配置影响。
+    :::
+    """
+    event_queue_workers: int = Field(default=16, ge=1)
+    """事件分发队列的处理协程数量，即同时处理的事件数量上限。
+
+    分发模式为 `session` 时为处理通道数量，每个通道拥有一个处理协程。
+    """
+    event_queue_mode: Literal["shared", "session"] = "shared"
+    """事件分发队列的分发模式。
+
+    - `shared`: 所有处理协程共享同一个队列
+    - `session`: 根据会话 ID 将事件分配至固定的处理通道，
+      同一会话的事件按顺序依次处理，不同会话的事件并行处理
+
+    :::warning[警告]
+    `session` 模式下同一会话的事件在同一通道中串行处理，
+    在事件处理函数内等待同一会话的下一个事件 (如 waiter 等待用户回复)
+    将导致该通道死锁，分配至同一通道的其他会话也将一并停滞。
+    请使用 `got`、`reject`、`pause` 等会话控制代替。
+
+    通道队列已满时仍将按照 `event_queue_overflow` 处理，
+    溢出策略为 `drop_oldest` 或 `drop_newest` 时同一会话的事件可能被丢弃，
+    需要保证事件不丢失时请使用 `block`。
+    :::
+
+    用法:
+        ```conf
+        EVENT_QUEUE_SIZE=100
+        EVENT_QUEUE_MODE=session
+        ```
+    """
+    event_queue_overflow: Literal["block", "drop_oldest", "drop_newest"] = "block"
+    """事件分发队列已满时的处理策略。
+
+    - `block`: 阻塞事件提交方直至队列有空位
+    - `drop_oldest`: 丢弃队列中最早的事件
+    - `drop_newest`: 丢弃新提交的事件
+
+    用法:
+        ```conf
+        EVENT_QUEUE_SIZE=1000
+        EVENT_QUEUE_OVERFLOW=drop_oldest
+        ```
+    """
+    event_queue_close_timeout: timedelta | None = timedelta(seconds=10)
+    """关闭时等待事件分发队列中剩余事件处理完成的最长时间。
+
+    超时后仍未处理的事件将被丢弃，为 `None` 时无限等待。
+
+    用法:
+        ```conf
+        EVENT_QUEUE_CLOSE_TIMEOUT=[-][DD]D[,][HH:MM:]SS[.ffffff]
+        EVENT_QUEUE_CLOSE_TIMEOUT=[±]P[DD]DT[HH]H[MM]M[SS]S  # ISO 8601
+        ```
+    """
+
+    inline_single_task: bool = False
+    """是否在只有一个任务时直接在当前任务中运行，而不创建任务组。
+
+    启用后，事件分发、规则与权限检查、依赖注入在仅有一个子任务时将直接等待，
+    简单的注入参数也将直接解析，以减少任务创建的开销。
+    此时子任务将与调用方共享上下文变量。
+    """
+    dispatch_profiler: bool = False
+    """是否统计各事件响应器的检查与运行耗时。
+
+    统计信息可以通过 {ref}`nonebot.message.get_dispatch_stats` 获取。
+    """
+    sync_executors: dict[str, int] = {}
+    """同步函数执行器配置。
+
+    键为执行器名称，值为最大并发线程数，为 `0` 时在事件循环中直接运行，
+    适用于极轻量的同步函数。
+
+    名称为 `default` 的执行器将替代 anyio 默认线程限制作为默认执行器；
+    与插件名称相同的执行器将用于该插件中的同步函数。
+    同步函数可以通过 {ref}`nonebot.utils.sync_executor` 或
+    `Depends(..., executor=...)` 指定执行器。
+
+    名称为 `process` 的执行器为进程池执行器，值为最大工作进程数，
+    配置后将在启动时预热工作进程，未配置时使用 CPU 核心数并在首次使用时创建。
+    CPU 密集型同步函数可以通过 {ref}`nonebot.utils.run_in_process` 在进程池中运行。
+
+    统计信息可以通过 {ref}`nonebot.utils.get_executor_statistics` 获取。
+
+    用法:
+        ```conf
+        SYNC_EXECUTORS={"default": 20, "image_plugin": 4, "cheap": 0, "process": 2}
+        ```
+    """
+
+    # api call configs
+    api_rate_limits: dict[str, float] = {}
+    """API 调用频率限制。
+
+    键为 API 名称，`*` 表示未单独配置的 API，值为每个机器人每秒允许的调用次数。
+
+    用法:
+        ```conf
+        API_RATE_LIMITS={"send_msg": 5, "*": 20}
+        ```
+    """
+    api_target_rate_limit: float = Field(default=0, ge=0)
+    """同一调用目标 (群组、用户等) 的 API 调用频率限制，为每秒允许的调用次数，
+    为 `0` 时不限制。
+
+    调用目标由 API 数据中的 `group_id`、`user_id` 等参数识别。
+    """
+    api_rate_burst: int = Field(default=1, ge=1)
+    """API 调用频率限制允许的突发调用数量。"""
+    api_max_concurrency: int = Field(default=0, ge=0)
+    """所有机器人同时进行的 API 调用数量上限，为 `0` 时不限制。"""
+    api_queue_timeout: timedelta | None = timedelta(seconds=30)
+    """API 调用排队等待的超时时间，超时后调用将被拒绝并抛出
+    {ref}`nonebot.exception.ApiRateLimited`，为 `None` 时一直等待。
+
+    限流统计信息可以通过 `bot.governor.statistics()` 获取。
+
+    用法:
+        ```conf
+        API_QUEUE_TIMEOUT=[-][DD]D[,][HH:MM:]SS[.ffffff]
+        API_QUEUE_TIMEOUT=[±]P[DD]DT[HH]H[MM]M[SS]S  # ISO 8601
+        ```
+    """
+
+    send_buffer: bool = False
+    """是否启用消息发送缓冲。
+
+    启用后事件响应器的 `send` 等方法发送的消息将先被缓冲，
+    并在超出缓冲时间窗口、事件处理函数运行结束或调用 `matcher.flush` 时
+    合并为一条消息发送。
+
+    :::warning[警告]
+    消息被缓冲时 `matcher.send` 返回 `None`，而非 `Bot.send` 的返回值。
+
+    直接调用 `bot.send` 发送的消息不经过缓冲区，可能先于此前缓冲的消息到达，
+    需要保证顺序时请先调用 `matcher.flush`。
+    :::
+
+    用法:
+        ```conf
+        SEND_BUFFER=true
+        ```
+    """
+    send_buffer_window: timedelta = timedelta(seconds=1)
+    """消息发送缓冲时间窗口，距首条缓冲消息超出窗口时缓冲的消息将自动发送。
+
+    用法:
+        ```conf
+        SEND_BUFFER_WINDOW=[-][DD]D[,][HH:MM:]SS[.ffffff]
+        SEND_BUFFER_WINDOW=[±]P[DD]DT[HH]H[MM]M[SS]S  # ISO 8601
+        ```
+    """
+    send_buffer_max_messages: int = Field(default=10, ge=1)
+    """每个发送目标最多合并的消息数量。"""
+    send_buffer_max_length: int | None = Field(default=None, ge=1)
+    """每个发送目标合并消息的最大文本长度，为 `None` 时不限制。"""
+
+    api_cache: dict[str, float] = {}
+    """API 调用结果缓存配置。
+
+    键为幂等 API 名称，值为缓存有效时间，单位: 秒。
+    缓存以机器人与 API 数据为键，可以通过 `bot.api_cache.invalidate` 使缓存失效。
+
+    用法:
+        ```conf
+        API_CACHE={"get_group_list": 300, "get_stranger_info": 60}
+        ```
+    """
+    api_cache_size: int = Field(default=1024, ge=1)
+    """每个机器人每个 API 的最大结果缓存条目数量。"""
 
     # adapter configs
     # adapter configs are defined in adapter/config.py
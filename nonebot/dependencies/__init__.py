@@ -12,7 +12,7 @@ from collections.abc import Awaitable, Callable, Iterable
 from dataclasses import dataclass, field
 from functools import partial
 import inspect
-from typing import Any, Generic, TypeVar, cast
+from typing import Any, ClassVar, Generic, TypeVar, cast
 
 import anyio
 from exceptiongroup import BaseExceptionGroup, catch
@@ -24,6 +24,7 @@ from nonebot.typing import _DependentCallable
 from nonebot.utils import (
     flatten_exception_group,
     is_coroutine_callable,
+    run_concurrently,
     run_coro_with_shield,
     run_sync,
 )
@@ -40,6 +41,11 @@ class Param(abc.ABC, FieldInfo):
     继承自 `pydantic.fields.FieldInfo`，用于描述参数信息（不包括参数名）。
     """
 
+    _inline: ClassVar[bool] = False
+    """参数解析是否不涉及异步等待，可以直接在当前任务中解析"""
+    _type_checked: ClassVar[bool] = False
+    """参数值类型是否已在 `_check` 中检查或必然符合注解，解析时无需再次检查"""
+
     def __init__(self, *args, validate: bool = False, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self.validate = validate
@@ -64,6 +70,54 @@ class Param(abc.ABC, FieldInfo):
         return
 
 
+_NO_CHECK = 0
+_CHECK = 1
+_VALIDATE = 2
+
+
+class _SolvePlan:
+    """依赖注入容器的解析计划，在创建时预先计算以避免每次调用时重复检查"""
+
+    __slots__ = (
+        "awaited_checks",
+        "awaited_fields",
+        "has_checks",
+        "inline_checks",
+        "inline_fields",
+        "is_coroutine",
+    )
+
+    def __init__(self, dependent: "Dependent[Any]") -> None:
+        self.is_coroutine = is_coroutine_callable(dependent.call)
+
+        # params without custom check do nothing in check stage
+        params = (
+            *dependent.parameterless,
+            *(cast(Param, field.field_info) for field in dependent.params),
+        )
+        checks = [param for param in params if type(param)._check is not Param._check]
+        self.inline_checks = tuple(param for param in checks if param._inline)
+        self.awaited_checks = tuple(param for param in checks if not param._inline)
+        self.has_checks = bool(checks)
+
+        fields = [(field, self._get_check_mode(field)) for field in dependent.params]
+        self.inline_fields = tuple(
+            item for item in fields if cast(Param, item[0].field_info)._inline
+        )
+        self.awaited_fields = tuple(
+            item for item in fields if not cast(Param, item[0].field_info)._inline
+        )
+
+    @staticmethod
+    def _get_check_mode(field: ModelField) -> int:
+        param = cast(Param, field.field_info)
+        if param.validate:
+            return _VALIDATE
+        if param._type_checked or field.annotation is Any:
+            return _NO_CHECK
+        return _CHECK
+
+
 @dataclass(frozen=True)
 class Dependent(Generic[R]):
     """依赖注入容器
@@ -79,6 +133,10 @@ class Dependent(Generic[R]):
     call: _DependentCallable[R]
     params: tuple[ModelField, ...] = field(default_factory=tuple)
     parameterless: tuple[Param, ...] = field(default_factory=tuple)
+    _plan: _SolvePlan = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_plan", _SolvePlan(self))
 
     def __repr__(self) -> str:
         if inspect.isfunction(self.call) or inspect.isclass(self.call):
@@ -109,7 +167,7 @@ class Dependent(Generic[R]):
             values = await self.solve(**kwargs)
 
             # call function
-            if is_coroutine_callable(self.call):
+            if self._plan.is_coroutine:
                 return await cast(Callable[..., Awaitable[R]], self.call)(**values)
             else:
                 return await run_sync(cast(Callable[..., R], self.call))(**values)
@@ -182,25 +240,28 @@ class Dependent(Generic[R]):
         return cls(call, params, parameterless_params)
 
     async def check(self, **params: Any) -> None:
-        if self.parameterless:
-            async with anyio.create_task_group() as tg:
-                for param in self.parameterless:
-                    tg.start_soon(partial(param._check, **params))
-
-        if self.params:
-            async with anyio.create_task_group() as tg:
-                for param in self.params:
-                    tg.start_soon(
-                        partial(cast(Param, param.field_info)._check, **params)
-                    )
+        plan = self._plan
+        if not plan.has_checks:
+            return
+
+        await run_concurrently(
+            *(partial(param._check, **params) for param in plan.awaited_checks),
+            cheap_funcs=[
+                partial(param._check, **params) for param in plan.inline_checks
+            ],
+        )
 
-    async def _solve_field(self, field: ModelField, params: dict[str, Any]) -> Any:
+    async def _solve_field(
+        self, field: ModelField, params: dict[str, Any], mode: int = _CHECK
+    ) -> Any:
         param = cast(Param, field.field_info)
         value = await param._solve(**params)
         if value is PydanticUndefined:
             value = field.get_default()
+        if mode == _NO_CHECK:
+            return value
         v = check_field_type(field, value)
-        return v if param.validate else value
+        return v if mode == _VALIDATE else value
 
     async def solve(self, **params: Any) -> dict[str, Any]:
         # solve parameterless
@@ -209,19 +270,39 @@ class Dependent(Generic[R]):
 
         # solve param values
         result: dict[str, Any] = {}
-        if not self.params:
+        plan = self._plan
+
+        # inline params are simple lookups, solve them in current task directly
+        if plan.inline_fields:
+            try:
+                for field, mode in plan.inline_fields:
+                    result[field.name] = await self._solve_field(field, params, mode)
+            except anyio.get_cancelled_exc_class():  # pragma: no cover
+                raise
+            except BaseException as e:
+                raise BaseExceptionGroup(
+                    "unhandled errors in a TaskGroup", [e]
+                ) from None
+
+        if not plan.awaited_fields:
             return result
 
-        async def _solve_field(field: ModelField, params: dict[str, Any]) -> None:
-            value = await self._solve_field(field, params)
+        async def _solve_field(field: ModelField, mode: int) -> None:
+            value = await self._solve_field(field, params, mode)
             result[field.name] = value
 
-        async with anyio.create_task_group() as tg:
-            for field in self.params:
-                # shield the task to prevent cancellation
-                # when one of the tasks raises an exception
-                # this will improve the dependency cache reusability
-                tg.start_soon(run_coro_with_shield, _solve_field(field, params))
+        async def _solve_field_shielded(field: ModelField, mode: int) -> None:
+            # shield the task to prevent cancellation
+            # when one of the tasks raises an exception
+            # this will improve the dependency cache reusability
+            await run_coro_with_shield(_solve_field(field, mode))
+
+        await run_concurrently(
+            *(
+                partial(_solve_field_shielded, field, mode)
+                for field, mode in plan.awaited_fields
+            )
+        )
 
         return result
 
@@ -14,6 +14,8 @@ from nonebot.internal.driver import URL as URL
 from nonebot.internal.driver import ASGIMixin as ASGIMixin
 from nonebot.internal.driver import Cookies as Cookies
 from nonebot.internal.driver import Driver as Driver
+from nonebot.internal.driver import EventQueue as EventQueue
+from nonebot.internal.driver import EventQueueStatistics as EventQueueStatistics
 from nonebot.internal.driver import ForwardDriver as ForwardDriver
 from nonebot.internal.driver import ForwardMixin as ForwardMixin
 from nonebot.internal.driver import HTTPClientMixin as HTTPClientMixin
@@ -50,6 +52,8 @@ __autodoc__ = {
     "ReverseDriver": True,
     "ASGIMixin": True,
     "combine_driver": True,
+    "EventQueue": True,
+    "EventQueueStatistics": True,
     "HTTPServerSetup": True,
     "WebSocketServerSetup": True,
 }
@@ -19,7 +19,8 @@ NoneBotException
 |   ├── NoLogException
 |   ├── ApiNotAvailable
 |   ├── NetworkError
-|   └── ActionFailed
+|   ├── ActionFailed
+|   └── ApiRateLimited
 └── DriverException
     └── WebSocketClosed
 ```
@@ -224,6 +225,10 @@ class ActionFailed(AdapterException):
     """API 请求成功返回数据，但 API 操作失败。"""
 
 
+class ApiRateLimited(AdapterException):
+    """API 调用在限流队列中等待超时，调用被拒绝。"""
+
+
 # Driver Exceptions
 class DriverException(NoneBotException):
     """`Driver` 抛出的异常基类。"""
@@ -1,6 +1,13 @@
 from .adapter import Adapter as Adapter
 from .bot import Bot as Bot
+from .buffer import SendBuffer as SendBuffer
+from .cache import ApiCache as ApiCache
+from .cache import ApiCacheRule as ApiCacheRule
 from .event import Event as Event
+from .governor import ApiGovernor as ApiGovernor
+from .governor import GovernorStatistics as GovernorStatistics
+from .governor import TokenBucket as TokenBucket
 from .message import Message as Message
+from .message import MessageBuilder as MessageBuilder
 from .message import MessageSegment as MessageSegment
 from .template import MessageTemplate as MessageTemplate
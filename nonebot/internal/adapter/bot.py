@@ -1,15 +1,19 @@
 import abc
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from fnmatch import fnmatchcase
 from functools import partial
-from typing import TYPE_CHECKING, Any, ClassVar, Protocol
+from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple, Protocol, overload
 
-import anyio
 from exceptiongroup import BaseExceptionGroup, catch
 
 from nonebot.config import Config
 from nonebot.exception import MockApiException
 from nonebot.log import logger
 from nonebot.typing import T_CalledAPIHook, T_CallingAPIHook
-from nonebot.utils import flatten_exception_group
+from nonebot.utils import flatten_exception_group, run_concurrently
+
+from .cache import ApiCache, ApiCacheRule
+from .governor import ApiGovernor
 
 if TYPE_CHECKING:
     from .adapter import Adapter
@@ -20,6 +24,51 @@ if TYPE_CHECKING:
         async def __call__(self, **kwargs: Any) -> Any: ...
 
 
+class _ApiHooks(NamedTuple):
+    calling: tuple[T_CallingAPIHook, ...]
+    called: tuple[T_CalledAPIHook, ...]
+
+
+def _to_patterns(apis: str | Iterable[str]) -> frozenset[str]:
+    return frozenset((apis,) if isinstance(apis, str) else apis)
+
+
+def _match_apis(api: str, patterns: frozenset[str]) -> bool:
+    return any(fnmatchcase(api, pattern) for pattern in patterns)
+
+
+class _ApiCacheRules(Mapping[str, ApiCacheRule]):
+    """合并配置与 `Bot.cache_api` 的缓存规则
+
+    配置仅覆盖缓存有效时间，失效关系沿用 `Bot.cache_api` 注册的规则。
+    """
+
+    def __init__(
+        self, ttls: Mapping[str, float], rules: Mapping[str, ApiCacheRule]
+    ) -> None:
+        if any(ttl <= 0 for ttl in ttls.values()):
+            raise ValueError("API cache ttl must be positive")
+        self.ttls = ttls
+        self.rules = rules
+
+    def __getitem__(self, api: str) -> ApiCacheRule:
+        rule = self.rules.get(api)
+        if (ttl := self.ttls.get(api)) is None:
+            if rule is None:
+                raise KeyError(api)
+            return rule
+        return ApiCacheRule(ttl, rule.invalidated_by if rule else frozenset())
+
+    def __iter__(self) -> Iterator[str]:
+        return iter({**self.ttls, **self.rules})
+
+    def __len__(self) -> int:
+        return len(self.ttls.keys() | self.rules.keys())
+
+    def __contains__(self, api: object) -> bool:
+        return api in self.ttls or api in self.rules
+
+
 class Bot(abc.ABC):
     """Bot 基类。
 
@@ -34,12 +83,28 @@ class Bot(abc.ABC):
     """call_api 时执行的函数"""
     _called_api_hook: ClassVar[set[T_CalledAPIHook]] = set()
     """call_api 后执行的函数"""
+    _scoped_calling_api_hook: ClassVar[dict[T_CallingAPIHook, frozenset[str]]] = {}
+    """仅在指定 API 调用时执行的 call_api 预处理函数"""
+    _scoped_called_api_hook: ClassVar[dict[T_CalledAPIHook, frozenset[str]]] = {}
+    """仅在指定 API 调用时执行的 call_api 后处理函数"""
+    _api_hooks: ClassVar[dict[str, _ApiHooks]] = {}
+    """各 API 需要执行的钩子函数"""
+    _api_hooks_sources: ClassVar[tuple[object, ...]] = (None, None, None, None)
+    _api_cache_rules: ClassVar[dict[str, ApiCacheRule]] = {}
+    """API 调用结果缓存规则"""
 
     def __init__(self, adapter: "Adapter", self_id: str):
         self.adapter: "Adapter" = adapter
         """协议适配器实例"""
         self.self_id: str = self_id
         """机器人 ID"""
+        self.governor: ApiGovernor | None = ApiGovernor.from_config(adapter.config)
+        """API 调用限流器，未配置限流时为 `None`"""
+        self.api_cache: ApiCache = ApiCache(
+            _ApiCacheRules(adapter.config.api_cache, self._api_cache_rules),
+            adapter.config.api_cache_size,
+        )
+        """API 调用结果缓存"""
 
     def __repr__(self) -> str:
         return f"Bot(type={self.type!r}, self_id={self.self_id!r})"
@@ -79,7 +144,9 @@ class Bot(abc.ABC):
         skip_calling_api: bool = False
         exception: Exception | None = None
 
-        if self._calling_api_hook:
+        hooks = self._get_api_hooks(api)
+
+        if hooks.calling:
             logger.debug("Running CallingAPI hooks...")
 
             def _handle_mock_api_exception(
@@ -119,17 +186,23 @@ class Bot(abc.ABC):
                     Exception: _handle_exception,
                 }
             ):
-                async with anyio.create_task_group() as tg:
-                    for hook in self._calling_api_hook:
-                        tg.start_soon(hook, self, api, data)
+                await run_concurrently(
+                    *(partial(hook, self, api, data) for hook in hooks.calling)
+                )
 
         if not skip_calling_api:
             try:
-                result = await self.adapter._call_api(self, api, **data)
+                if self.api_cache.is_cached(api):
+                    result = await self.api_cache.get_or_call(
+                        api, data, partial(self._call_adapter_api, api, data)
+                    )
+                else:
+                    result = await self._call_adapter_api(api, data)
+                    self.api_cache.invalidate_by(api)
             except Exception as e:
                 exception = e
 
-        if self._called_api_hook:
+        if hooks.called:
             logger.debug("Running CalledAPI hooks...")
 
             def _handle_mock_api_exception(
@@ -168,14 +241,62 @@ class Bot(abc.ABC):
                     Exception: _handle_exception,
                 }
             ):
-                async with anyio.create_task_group() as tg:
-                    for hook in self._called_api_hook:
-                        tg.start_soon(hook, self, exception, api, data, result)
+                await run_concurrently(
+                    *(
+                        partial(hook, self, exception, api, data, result)
+                        for hook in hooks.called
+                    )
+                )
 
         if exception:
             raise exception
         return result
 
+    def _get_api_hooks(self, api: str) -> _ApiHooks:
+        sources = (
+            self._calling_api_hook,
+            self._called_api_hook,
+            self._scoped_calling_api_hook,
+            self._scoped_called_api_hook,
+        )
+        # hook containers may be replaced (e.g. monkeypatched in tests) or
+        # modified in place, compare their contents with the cached snapshot
+        if sources != Bot._api_hooks_sources:
+            Bot._api_hooks = {}
+            Bot._api_hooks_sources = (
+                frozenset(self._calling_api_hook),
+                frozenset(self._called_api_hook),
+                dict(self._scoped_calling_api_hook),
+                dict(self._scoped_called_api_hook),
+            )
+
+        if (hooks := Bot._api_hooks.get(api)) is None:
+            hooks = Bot._api_hooks[api] = _ApiHooks(
+                (
+                    *self._calling_api_hook,
+                    *(
+                        hook
+                        for hook, apis in self._scoped_calling_api_hook.items()
+                        if _match_apis(api, apis)
+                    ),
+                ),
+                (
+                    *self._called_api_hook,
+                    *(
+                        hook
+                        for hook, apis in self._scoped_called_api_hook.items()
+                        if _match_apis(api, apis)
+                    ),
+                ),
+            )
+        return hooks
+
+    async def _call_adapter_api(self, api: str, data: dict[str, Any]) -> Any:
+        if self.governor is None:
+            return await self.adapter._call_api(self, api, **data)
+        async with self.governor.acquire(self, api, data):
+            return await self.adapter._call_api(self, api, **data)
+
     @abc.abstractmethod
     async def send(
         self,
@@ -192,23 +313,75 @@ class Bot(abc.ABC):
         """
         raise NotImplementedError
 
+    @overload
+    @classmethod
+    def on_calling_api(cls, func: T_CallingAPIHook) -> T_CallingAPIHook: ...
+
+    @overload
     @classmethod
-    def on_calling_api(cls, func: T_CallingAPIHook) -> T_CallingAPIHook:
+    def on_calling_api(
+        cls, *, apis: str | Iterable[str]
+    ) -> Callable[[T_CallingAPIHook], T_CallingAPIHook]: ...
+
+    @classmethod
+    def on_calling_api(
+        cls,
+        func: T_CallingAPIHook | None = None,
+        *,
+        apis: str | Iterable[str] | None = None,
+    ) -> T_CallingAPIHook | Callable[[T_CallingAPIHook], T_CallingAPIHook]:
         """调用 api 预处理。
 
+        指定 `apis` 时，钩子函数仅在调用名称匹配的 API 时执行，
+        未匹配任何钩子函数的 API 调用将跳过钩子函数处理。
+
         钩子函数参数:
 
         - bot: 当前 bot 对象
         - api: 调用的 api 名称
         - data: api 调用的参数字典
+
+        参数:
+            func: 钩子函数
+            apis: API 名称或 `fnmatch` 风格的匹配模式
+
+        用法:
+            ```python
+            @Bot.on_calling_api(apis=["set_group_ban", "set_group_kick"])
+            async def audit(bot: Bot, api: str, data: dict[str, Any]): ...
+            ```
         """
-        cls._calling_api_hook.add(func)
-        return func
 
+        def _decorator(func: T_CallingAPIHook) -> T_CallingAPIHook:
+            if apis is None:
+                cls._calling_api_hook.add(func)
+            else:
+                cls._scoped_calling_api_hook[func] = _to_patterns(apis)
+            return func
+
+        return _decorator if func is None else _decorator(func)
+
+    @overload
     @classmethod
-    def on_called_api(cls, func: T_CalledAPIHook) -> T_CalledAPIHook:
+    def on_called_api(cls, func: T_CalledAPIHook) -> T_CalledAPIHook: ...
+
+    @overload
+    @classmethod
+    def on_called_api(
+        cls, *, apis: str | Iterable[str]
+    ) -> Callable[[T_CalledAPIHook], T_CalledAPIHook]: ...
+
+    @classmethod
+    def on_called_api(
+        cls,
+        func: T_CalledAPIHook | None = None,
+        *,
+        apis: str | Iterable[str] | None = None,
+    ) -> T_CalledAPIHook | Callable[[T_CalledAPIHook], T_CalledAPIHook]:
         """调用 api 后处理。
 
+        指定 `apis` 时，钩子函数仅在调用名称匹配的 API 时执行。
+
         钩子函数参数:
 
         - bot: 当前 bot 对象
@@ -216,6 +389,42 @@ class Bot(abc.ABC):
         - api: 调用的 api 名称
         - data: api 调用的参数字典
         - result: api 调用的返回
+
+        参数:
+            func: 钩子函数
+            apis: API 名称或 `fnmatch` 风格的匹配模式
+        """
+
+        def _decorator(func: T_CalledAPIHook) -> T_CalledAPIHook:
+            if apis is None:
+                cls._called_api_hook.add(func)
+            else:
+                cls._scoped_called_api_hook[func] = _to_patterns(apis)
+            return func
+
+        return _decorator if func is None else _decorator(func)
+
+    @classmethod
+    def cache_api(
+        cls, api: str, ttl: float, *, invalidated_by: Iterable[str] = ()
+    ) -> None:
+        """缓存幂等 API 的调用结果。
+
+        缓存以 API 数据为键，调用 API 预处理钩子模拟结果时不会读取或写入缓存。
+
+        参数:
+            api: API 名称
+            ttl: 缓存有效时间，单位: 秒
+            invalidated_by: 调用成功后使该 API 缓存失效的 API 名称
+
+        异常:
+            ValueError: 缓存有效时间不为正数
+
+        用法:
+            ```python
+            Bot.cache_api(
+                "get_group_member_info", 60, invalidated_by=["set_group_card"]
+            )
+            ```
         """
-        cls._called_api_hook.add(func)
-        return func
+        cls._api_cache_rules[api] = ApiCacheRule(ttl, frozenset(invalidated_by))
@@ -0,0 +1,238 @@
+from dataclasses import dataclass, field
+import time
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
+from typing_extensions import Self
+
+import anyio
+from anyio.abc import TaskGroup
+
+from nonebot.log import logger
+
+from .message import Message, MessageSegment
+
+if TYPE_CHECKING:
+    from .bot import Bot
+    from .event import Event
+
+
+@dataclass
+class _PendingMessages:
+    event: "Event"
+    messages: list[str | Message | MessageSegment] = field(default_factory=list)
+    length: int = 0
+    created_at: float = field(default_factory=time.monotonic)
+    timer: anyio.CancelScope | None = None
+
+
+class SendBuffer:
+    """消息发送缓冲区
+
+    将发送至同一目标的多条消息合并为一条消息，减少 `Bot.send` 调用次数。
+    缓冲的消息将在以下情况发送:
+
+    - 调用 `flush` 或退出 `async with` 块时
+    - 缓冲的消息数量或长度即将超出限制时
+    - 距首条缓冲消息超过缓冲时间窗口时，
+      未提供任务组时将在新消息到达时检查
+
+    参数:
+        bot: 发送消息的 Bot 对象
+        window: 缓冲时间窗口，单位: 秒
+        max_messages: 每个目标最多缓冲的消息数量
+        max_length: 每个目标缓冲消息的最大文本长度，为 `None` 时不限制
+        separator: 合并消息时插入的分隔符
+        task_group: 运行缓冲时间窗口定时器的任务组
+
+    用法:
+        ```python
+        async with SendBuffer(bot) as buffer:
+            await buffer.send(event, "hello")
+            await buffer.send(event, "world")
+        ```
+    """
+
+    def __init__(
+        self,
+        bot: "Bot",
+        window: float = 1.0,
+        max_messages: int = 10,
+        max_length: int | None = None,
+        separator: str = "\n",
+        task_group: TaskGroup | None = None,
+    ) -> None:
+        self.bot = bot
+        self.window = window
+        self.max_messages = max_messages
+        self.max_length = max_length
+        self.separator = separator
+        self.task_group = task_group
+        self._pending: dict[str, _PendingMessages] = {}
+
+    def __repr__(self) -> str:
+        return f"SendBuffer(bot={self.bot!r}, pending={self.pending})"
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.flush()
+
+    @classmethod
+    def from_config(cls, bot: "Bot") -> Self | None:
+        """根据配置创建消息发送缓冲区，未启用时返回 `None`
+
+        参数:
+            bot: 发送消息的 Bot 对象
+        """
+        config = bot.config
+        if not config.send_buffer:
+            return None
+        try:
+            task_group = bot.adapter.driver.task_group
+        except RuntimeError:
+            task_group = None
+        return cls(
+            bot,
+            config.send_buffer_window.total_seconds(),
+            config.send_buffer_max_messages,
+            config.send_buffer_max_length,
+            task_group=task_group,
+        )
+
+    @property
+    def pending(self) -> int:
+        """等待发送的消息数量"""
+        return sum(len(pending.messages) for pending in self._pending.values())
+
+    @staticmethod
+    def get_target(event: "Event") -> str:
+        """获取事件对应的消息发送目标
+
+        优先使用事件会话 ID，事件不存在会话时以事件对象区分目标。
+
+        参数:
+            event: 上报事件
+        """
+        try:
+            return event.get_session_id()
+        except Exception:
+            return f"event-{id(event)}"
+
+    async def send(
+        self,
+        event: "Event",
+        message: str | Message | MessageSegment,
+        **kwargs: Any,
+    ) -> Any:
+        """缓冲一条发送给事件目标的消息
+
+        带有额外参数的消息无法合并，将在发送该目标已缓冲的消息后直接发送。
+
+        参数:
+            event: 上报事件
+            message: 消息内容
+            kwargs: {ref}`nonebot.adapters.Bot.send` 的参数
+
+        返回:
+            直接发送时为 `Bot.send` 的返回值，缓冲时为 `None`
+        """
+        target = self.get_target(event)
+        length = len(str(message))
+
+        if kwargs or (self.max_length is not None and length > self.max_length):
+            await self.flush(target)
+            return await self.bot.send(event, message, **kwargs)
+
+        pending = self._pending.get(target)
+        if pending is not None:
+            # merged message length includes the separator
+            length += len(self.separator)
+            if (
+                len(pending.messages) >= self.max_messages
+                or (
+                    self.max_length is not None
+                    and pending.length + length > self.max_length
+                )
+                or time.monotonic() - pending.created_at > self.window
+            ):
+                await self.flush(target)
+                length -= len(self.separator)
+                pending = None
+
+        if pending is None:
+            pending = self._pending[target] = _PendingMessages(event)
+            if self.task_group is not None:
+                pending.timer = anyio.CancelScope()
+                self.task_group.start_soon(self._flush_later, target, pending)
+        pending.messages.append(message)
+        pending.length += length
+
+    async def _flush_later(self, target: str, pending: _PendingMessages) -> None:
+        timer = pending.timer
+        assert timer is not None
+        with timer:
+            await anyio.sleep(self.window)
+        # cancelled when the target is flushed before the window ends
+        if timer.cancel_called or self._pending.get(target) is not pending:
+            return
+
+        pending.timer = None
+        # timer runs in background task, errors must not break the task group
+        try:
+            await self._send(target)
+        except Exception as e:
+            logger.opt(colors=True, exception=e).error(
+                "<r><bg #f8bbd0>Error when flushing buffered messages.</bg #f8bbd0></r>"
+            )
+
+    def _concat(
+        self, messages: list[str | Message | MessageSegment]
+    ) -> str | Message | MessageSegment:
+        if len(messages) == 1:
+            return messages[0]
+
+        message_class: type[Message] | None = None
+        for message in messages:
+            if isinstance(message, Message):
+                message_class = type(message)
+                break
+            elif isinstance(message, MessageSegment):
+                message_class = message.get_message_class()
+                break
+
+        if message_class is None:
+            return self.separator.join(str(message) for message in messages)
+
+        separator = message_class(self.separator) if self.separator else message_class()
+        return separator.join(
+            message_class(message) if isinstance(message, str) else message
+            for message in messages
+        )
+
+    async def flush(self, target: str | None = None) -> None:
+        """发送缓冲的消息
+
+        参数:
+            target: 消息发送目标，为 `None` 时发送所有目标的缓冲消息
+        """
+        if target is None:
+            targets = list(self._pending)
+        elif target in self._pending:
+            targets = [target]
+        else:
+            return
+
+        for key in targets:
+            await self._send(key)
+
+    async def _send(self, target: str) -> None:
+        pending = self._pending.pop(target)
+        if pending.timer is not None:
+            pending.timer.cancel()
+        await self.bot.send(pending.event, self._concat(pending.messages))
@@ -0,0 +1,114 @@
+from collections.abc import Awaitable, Callable, Mapping
+import copy
+from dataclasses import dataclass, field
+import json
+from typing import Any
+
+from nonebot.utils import CacheStatistics, LRUCache
+
+
+@dataclass(frozen=True)
+class ApiCacheRule:
+    """API 调用结果缓存规则"""
+
+    ttl: float
+    """缓存有效时间，单位: 秒"""
+    invalidated_by: frozenset[str] = field(default_factory=frozenset)
+    """调用成功后使该 API 缓存失效的 API 名称"""
+
+    def __post_init__(self) -> None:
+        if self.ttl <= 0:
+            raise ValueError("API cache ttl must be positive")
+
+
+class ApiCache:
+    """API 调用结果缓存
+
+    缓存幂等 API 的调用结果，以 API 数据为键，同一 API 的缓存使用 LRU 策略淘汰。
+    同一键的并发未命中只会调用一次 API，调用失败时结果不会被缓存。
+    每次获取的结果均为缓存结果的深拷贝，修改结果不会影响缓存。
+
+    参数:
+        rules: API 名称对应的缓存规则
+        maxsize: 每个 API 的最大缓存条目数量
+    """
+
+    def __init__(
+        self, rules: Mapping[str, ApiCacheRule] | None = None, maxsize: int = 1024
+    ) -> None:
+        self.rules: Mapping[str, ApiCacheRule] = rules if rules is not None else {}
+        self.maxsize = maxsize
+        self._caches: dict[str, LRUCache[str, Any]] = {}
+
+    def __repr__(self) -> str:
+        return f"ApiCache(apis={list(self.rules)}, maxsize={self.maxsize})"
+
+    @staticmethod
+    def make_key(data: Mapping[str, Any]) -> str:
+        """将 API 数据规范化为缓存键
+
+        参数:
+            data: API 数据
+        """
+        return json.dumps(data, sort_keys=True, ensure_ascii=False, default=repr)
+
+    def is_cached(self, api: str) -> bool:
+        """API 是否启用结果缓存
+
+        参数:
+            api: API 名称
+        """
+        return api in self.rules
+
+    def _get_cache(self, api: str) -> LRUCache[str, Any]:
+        if (cache := self._caches.get(api)) is None:
+            cache = self._caches[api] = LRUCache(self.maxsize, self.rules[api].ttl)
+        return cache
+
+    async def get_or_call(
+        self, api: str, data: Mapping[str, Any], call: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """获取缓存的 API 调用结果，未命中时调用 API 并缓存结果
+
+        参数:
+            api: API 名称
+            data: API 数据
+            call: 调用 API 的异步函数
+
+        返回:
+            缓存结果的深拷贝
+        """
+        result = await self._get_cache(api).get_or_create(self.make_key(data), call)
+        # results are shared between callers, do not expose the cached object
+        return copy.deepcopy(result)
+
+    def invalidate(self, api: str | None = None, **data: Any) -> None:
+        """使 API 调用结果缓存失效
+
+        参数:
+            api: API 名称，为 `None` 时使所有缓存失效
+            data: API 数据，未提供时使该 API 的所有缓存失效
+        """
+        if api is None:
+            self._caches.clear()
+        elif (cache := self._caches.get(api)) is not None:
+            if data:
+                cache.pop(self.make_key(data))
+            else:
+                cache.clear()
+
+    def invalidate_by(self, api: str) -> None:
+        """在 API 调用成功后使依赖该 API 的缓存失效
+
+        参数:
+            api: 调用成功的 API 名称
+        """
+        if not self._caches:
+            return
+        for name, rule in self.rules.items():
+            if api in rule.invalidated_by:
+                self.invalidate(name)
+
+    def statistics(self) -> dict[str, CacheStatistics]:
+        """获取各 API 的缓存统计信息"""
+        return {api: cache.statistics() for api, cache in self._caches.items()}
@@ -1,5 +1,9 @@
 import abc
-from typing import Any, TypeVar
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, ClassVar, TypeVar
 
 from pydantic import BaseModel
 
@@ -10,10 +14,62 @@ from .message import Message
 
 E = TypeVar("E", bound="Event")
 
+_MEMOIZED_ACCESSORS = (
+    "get_type",
+    "get_user_id",
+    "get_session_id",
+    "get_message",
+    "get_plaintext",
+)
+
+
+class _AccessorCache:
+    __slots__ = ("event", "values")
+
+    def __init__(self, event: "Event") -> None:
+        self.event = event
+        self.values: dict[tuple[type, str], Any] = {}
+
+
+_current_accessor_cache: ContextVar[_AccessorCache | None] = ContextVar(
+    "_current_accessor_cache", default=None
+)
+
+
+def _memoize_accessor(
+    owner: type, name: str, func: Callable[[E], Any]
+) -> Callable[[E], Any]:
+    # overrides may call the parent accessor through `super()`,
+    # so results are cached per defining class
+    key = (owner, name)
+
+    @wraps(func)
+    def _accessor(self: E) -> Any:
+        cache = _current_accessor_cache.get()
+        if cache is None or cache.event is not self:
+            return func(self)
+        try:
+            return cache.values[key]
+        except KeyError:
+            # exceptions are not cached and will be raised again on next call
+            result = cache.values[key] = func(self)
+            return result
+
+    _accessor.__memoized__ = True  # type: ignore
+    return _accessor
+
 
 class Event(abc.ABC, BaseModel):
     """Event 基类。提供获取关键信息的方法，其余信息可直接获取。"""
 
+    memoize_accessors: ClassVar[bool] = False
+    """是否在单次事件分发中缓存 `get_type`、`get_user_id`、`get_session_id`、
+    `get_message`、`get_plaintext` 的结果。
+
+    适配器的事件类可以设置为 `True` 以避免在每个规则、权限与参数中重复计算。
+    启用后，同一次分发中获取的消息为同一对象。
+    """
+
     if PYDANTIC_V2:  # pragma: pydantic-v2
         model_config = ConfigDict(extra="allow")
     else:  # pragma: pydantic-v1
@@ -30,6 +86,34 @@ class Event(abc.ABC, BaseModel):
                 raise TypeError(f"{value} is incompatible with Event type {cls}")
             return super().validate(value)
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if cls.memoize_accessors:
+            for name in _MEMOIZED_ACCESSORS:
+                func = getattr(cls, name)
+                if not getattr(func, "__memoized__", False):
+                    setattr(cls, name, _memoize_accessor(cls, name, func))
+
+    @contextmanager
+    def accessor_cache(self) -> Generator[None, None, None]:
+        """在上下文中缓存当前事件访问方法的结果，仅在 `memoize_accessors` 启用时生效。
+
+        事件分发时由 NoneBot 自动进入。
+        """
+        token = _current_accessor_cache.set(_AccessorCache(self))
+        try:
+            yield
+        finally:
+            _current_accessor_cache.reset(token)
+
+    def clear_accessor_cache(self) -> None:
+        """清除当前事件访问方法的缓存结果。
+
+        在事件预处理等过程中修改事件内容后，需要调用此方法使缓存失效。
+        """
+        if (cache := _current_accessor_cache.get()) is not None and cache.event is self:
+            cache.values.clear()
+
     @abc.abstractmethod
     def get_type(self) -> str:
         """获取事件类型的方法，类型通常为 NoneBot 内置的四种类型。"""
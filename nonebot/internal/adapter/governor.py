@@ -0,0 +1,324 @@
+from collections.abc import AsyncGenerator, Mapping
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import timedelta
+import math
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+import anyio
+from anyio.lowlevel import RunVar
+
+from nonebot.exception import ApiRateLimited
+
+if TYPE_CHECKING:
+    from nonebot.config import Config
+
+    from .bot import Bot
+
+TARGET_KEYS = ("group_id", "channel_id", "guild_id", "chat_id", "user_id")
+"""默认用于识别 API 调用目标的参数名称"""
+
+_TARGET_PRUNE_SIZE = 1024
+"""调用目标令牌桶数量超过此值时清理空闲的令牌桶"""
+
+_concurrency_groups: dict[str, RunVar[anyio.CapacityLimiter]] = {}
+
+
+@dataclass(frozen=True)
+class GovernorStatistics:
+    """API 调用限流统计信息"""
+
+    calls: int
+    """已放行的 API 调用数量"""
+    rejected: int
+    """等待超时被拒绝的 API 调用数量"""
+    waiting: int
+    """正在排队等待的 API 调用数量"""
+    running: int
+    """正在进行的 API 调用数量"""
+    wait_time_total: float
+    """已放行调用排队等待的总时间，单位: 秒"""
+    wait_time_max: float
+    """已放行调用排队等待的最长时间，单位: 秒"""
+
+
+class TokenBucket:
+    """令牌桶
+
+    令牌可以被预约，预约后需要等待至令牌生成，保证排队调用按顺序放行。
+
+    参数:
+        rate: 每秒生成的令牌数量
+        burst: 令牌桶容量，即允许的突发调用数量
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        if rate <= 0:
+            raise ValueError("Token bucket rate must be positive")
+        if burst < 1:
+            raise ValueError("Token bucket burst must be at least 1")
+
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = monotonic()
+
+    def __repr__(self) -> str:
+        return f"TokenBucket(rate={self.rate}, burst={self.burst})"
+
+    def _refill(self) -> None:
+        now = monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, max_wait: float = math.inf) -> float | None:
+        """预约一个令牌
+
+        参数:
+            max_wait: 允许等待的最长时间，单位: 秒
+
+        返回:
+            需要等待的时间，超过允许等待的时间时不预约并返回 `None`
+        """
+        self._refill()
+        wait = max(0.0, (1 - self._tokens) / self.rate)
+        if wait > max_wait:
+            return None
+        self._tokens -= 1
+        return wait
+
+    def refund(self) -> None:
+        """归还一个已预约但未使用的令牌"""
+        self._tokens = min(self.burst, self._tokens + 1)
+
+    @property
+    def full(self) -> bool:
+        """令牌桶是否已满，已满的令牌桶与新建的令牌桶等价"""
+        self._refill()
+        return self._tokens >= self.burst
+
+
+class ApiGovernor:
+    """API 调用限流器
+
+    在调用适配器 API 前排队等待，依次满足 API 名称令牌桶、调用目标令牌桶与并发数限制，
+    等待超时的调用将被拒绝并抛出 {ref}`nonebot.exception.ApiRateLimited`。
+
+    可以继承并重写 `get_target` 以适配不同平台的调用目标参数，
+    并赋值给 `bot.governor` 替换默认限流器。
+
+    参数:
+        api_rates: API 名称对应的每秒调用次数，`*` 表示未单独配置的 API
+        target_rate: 同一调用目标 (群组、用户等) 的每秒调用次数
+        burst: 令牌桶容量，即允许的突发调用数量
+        max_concurrency: 最大并发调用数量
+        timeout: 排队等待的最长时间
+        concurrency_group: 并发数限制分组名称，同一分组的限流器共享并发数限制，
+            并发数量由分组内首个获取限制的限流器决定
+    """
+
+    def __init__(
+        self,
+        *,
+        api_rates: Mapping[str, float] | None = None,
+        target_rate: float | None = None,
+        burst: int = 1,
+        max_concurrency: int | None = None,
+        timeout: timedelta | None = None,
+        concurrency_group: str | None = None,
+    ) -> None:
+        self.api_rates = dict(api_rates or {})
+        self.target_rate = target_rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.concurrency_group = concurrency_group
+
+        self._api_buckets: dict[str, TokenBucket] = {}
+        self._target_buckets: dict[str, TokenBucket] = {}
+        self._target_prune_size = _TARGET_PRUNE_SIZE
+        # limiter is bound to the event loop, create one for each run
+        self._limiter: RunVar[anyio.CapacityLimiter] = (
+            _concurrency_groups.setdefault(
+                concurrency_group, RunVar(f"api_concurrency_{concurrency_group}")
+            )
+            if concurrency_group is not None
+            else RunVar("api_concurrency")
+        )
+
+        self._calls = 0
+        self._rejected = 0
+        self._waiting = 0
+        self._running = 0
+        self._wait_time_total = 0.0
+        self._wait_time_max = 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"ApiGovernor(api_rates={self.api_rates}, target_rate={self.target_rate}, "
+            f"max_concurrency={self.max_concurrency})"
+        )
+
+    @classmethod
+    def from_config(cls, config: "Config") -> "ApiGovernor | None":
+        """根据全局配置创建限流器，未配置任何限制时返回 `None`"""
+        if not (
+            config.api_rate_limits
+            or config.api_target_rate_limit
+            or config.api_max_concurrency
+        ):
+            return None
+        return cls(
+            api_rates=config.api_rate_limits,
+            target_rate=config.api_target_rate_limit or None,
+            burst=config.api_rate_burst,
+            max_concurrency=config.api_max_concurrency or None,
+            timeout=config.api_queue_timeout,
+            concurrency_group="global",
+        )
+
+    def get_target(self, bot: "Bot", api: str, data: dict[str, Any]) -> str | None:
+        """获取 API 调用目标，用于按目标限流
+
+        默认使用 `group_id`、`channel_id`、`guild_id`、`chat_id`、`user_id`
+        中首个存在的参数。
+
+        参数:
+            bot: Bot 对象
+            api: API 名称
+            data: API 数据
+        """
+        for key in TARGET_KEYS:
+            if (value := data.get(key)) is not None:
+                return f"{key}:{value}"
+        return None
+
+    def _get_buckets(
+        self, bot: "Bot", api: str, data: dict[str, Any]
+    ) -> list[TokenBucket]:
+        buckets: list[TokenBucket] = []
+        rate = self.api_rates.get(api, self.api_rates.get("*"))
+        if rate:
+            if (bucket := self._api_buckets.get(api)) is None:
+                bucket = self._api_buckets[api] = TokenBucket(rate, self.burst)
+            buckets.append(bucket)
+        if self.target_rate and (target := self.get_target(bot, api, data)):
+            if (bucket := self._target_buckets.get(target)) is None:
+                if len(self._target_buckets) >= self._target_prune_size:
+                    self._prune_target_buckets()
+                bucket = self._target_buckets[target] = TokenBucket(
+                    self.target_rate, self.burst
+                )
+            buckets.append(bucket)
+        return buckets
+
+    def _prune_target_buckets(self) -> None:
+        # targets are unbounded (every group or user), drop idle buckets.
+        # only full buckets are removed since they are recreated identically
+        self._target_buckets = {
+            target: bucket
+            for target, bucket in self._target_buckets.items()
+            if not bucket.full
+        }
+        # amortize pruning when most buckets are still in use
+        self._target_prune_size = max(_TARGET_PRUNE_SIZE, 2 * len(self._target_buckets))
+
+    def _get_limiter(self) -> anyio.CapacityLimiter | None:
+        if self.max_concurrency is None:
+            return None
+        try:
+            return self._limiter.get()
+        except LookupError:
+            limiter = anyio.CapacityLimiter(self.max_concurrency)
+            self._limiter.set(limiter)
+            return limiter
+
+    def _reject(self, bot: "Bot", api: str) -> ApiRateLimited:
+        self._rejected += 1
+        return ApiRateLimited(
+            bot.adapter.get_name(), f"Calling API {api} is rate limited"
+        )
+
+    async def _wait(
+        self, bot: "Bot", api: str, data: dict[str, Any], deadline: float
+    ) -> list[TokenBucket]:
+        reserved: list[TokenBucket] = []
+        wait = 0.0
+        try:
+            for bucket in self._get_buckets(bot, api, data):
+                bucket_wait = bucket.reserve(deadline - monotonic())
+                if bucket_wait is None:
+                    raise self._reject(bot, api)
+                reserved.append(bucket)
+                wait = max(wait, bucket_wait)
+            if wait > 0:
+                await anyio.sleep(wait)
+        except BaseException:
+            for bucket in reserved:
+                bucket.refund()
+            raise
+        return reserved
+
+    @asynccontextmanager
+    async def acquire(
+        self, bot: "Bot", api: str, data: dict[str, Any]
+    ) -> AsyncGenerator[None, None]:
+        """排队等待调用 API
+
+        参数:
+            bot: Bot 对象
+            api: API 名称
+            data: API 数据
+
+        异常:
+            ApiRateLimited: 排队等待超时
+        """
+        start = monotonic()
+        timeout = math.inf if self.timeout is None else self.timeout.total_seconds()
+        deadline = start + timeout
+
+        # borrow on behalf of the call to allow nested api calls in one task
+        token = object()
+        limiter = self._get_limiter()
+
+        self._waiting += 1
+        try:
+            reserved = await self._wait(bot, api, data, deadline)
+            if limiter is not None:
+                try:
+                    with anyio.move_on_after(deadline - monotonic()):
+                        await limiter.acquire_on_behalf_of(token)
+                    if token not in limiter.statistics().borrowers:
+                        raise self._reject(bot, api)
+                except BaseException:
+                    # the call never runs, return the reserved tokens
+                    for bucket in reserved:
+                        bucket.refund()
+                    raise
+        finally:
+            self._waiting -= 1
+
+        waited = monotonic() - start
+        self._calls += 1
+        self._wait_time_total += waited
+        self._wait_time_max = max(self._wait_time_max, waited)
+
+        self._running += 1
+        try:
+            yield
+        finally:
+            self._running -= 1
+            if limiter is not None:
+                limiter.release_on_behalf_of(token)
+
+    def statistics(self) -> GovernorStatistics:
+        """获取限流统计信息"""
+        return GovernorStatistics(
+            calls=self._calls,
+            rejected=self._rejected,
+            waiting=self._waiting,
+            running=self._running,
+            wait_time_total=self._wait_time_total,
+            wait_time_max=self._wait_time_max,
+        )
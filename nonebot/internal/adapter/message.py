@@ -137,6 +137,25 @@ class Message(list[TMS], abc.ABC):
         """
         return MessageTemplate(format_string, cls)
 
+    @classmethod
+    def builder(cls) -> "MessageBuilder[Self]":
+        """创建消息构造器。
+
+        用于在循环中拼接大量消息内容，避免 `+` 每次复制整个消息。
+
+        返回:
+            消息构造器
+
+        用法:
+            ```python
+            builder = Message.builder()
+            for rank, name in enumerate(names, 1):
+                builder += f"{rank}. {name}\n"
+            message = builder.build()
+            ```
+        """
+        return MessageBuilder(cls)
+
     @classmethod
     @abc.abstractmethod
     def get_segment_class(cls) -> type[TMS]:
@@ -432,3 +451,97 @@ class Message(list[TMS], abc.ABC):
         """提取消息内纯文本消息"""
 
         return "".join(str(seg) for seg in self if seg.is_text())
+
+
+class MessageBuilder(Generic[TM]):
+    """消息构造器
+
+    以较低开销收集消息段与字符串，在 `build` 时一次性合并相邻的纯文本消息段，
+    并构造出消息数组。
+
+    仅数据只包含 `text` 字段的同类型纯文本消息段会被合并，其余消息段保持原样。
+
+    参数:
+        message_class: 构造的消息数组类型
+    """
+
+    def __init__(self, message_class: type[TM]) -> None:
+        self.message_class = message_class
+        self._segments: list[MessageSegment] = []
+
+    def __repr__(self) -> str:
+        return f"MessageBuilder(message_class={self.message_class.__name__})"
+
+    def append(self, obj: str | MessageSegment | Iterable[MessageSegment]) -> Self:
+        """添加字符串、消息段或消息数组
+
+        参数:
+            obj: 要添加的内容
+        """
+        if isinstance(obj, str):
+            self._segments.extend(self.message_class._construct(obj))
+        elif isinstance(obj, MessageSegment):
+            self._segments.append(obj)
+        elif isinstance(obj, Iterable):
+            self._segments.extend(obj)
+        else:
+            raise TypeError(f"Unsupported type {type(obj)!r}")
+        return self
+
+    def extend(
+        self, objs: Iterable[str | MessageSegment | Iterable[MessageSegment]]
+    ) -> Self:
+        """依次添加多个字符串、消息段或消息数组
+
+        参数:
+            objs: 要添加的内容
+        """
+        for obj in objs:
+            self.append(obj)
+        return self
+
+    __iadd__ = append
+
+    def build(self) -> TM:
+        """构造消息数组，构造后仍可继续添加内容"""
+        segments: list[MessageSegment] = []
+        push = segments.append
+        head: MessageSegment | None = None
+        texts: list[str] = []
+
+        for segment in self._segments:
+            data = segment.data
+            if len(data) == 1 and isinstance(text := data.get("text"), str):
+                if (
+                    head is not None
+                    and segment.__class__ is head.__class__
+                    and segment.type == head.type
+                ):
+                    texts.append(text)
+                    continue
+                if segment.is_text():
+                    if head is not None:
+                        push(_merge_text(head, texts))
+                    head, texts = segment, [text]
+                    continue
+            if head is not None:
+                push(_merge_text(head, texts))
+                head = None
+            push(segment)
+        if head is not None:
+            push(_merge_text(head, texts))
+
+        # 消息段均已构造完成，跳过逐个 append 的开销
+        message = self.message_class()
+        list.extend(message, segments)
+        return message
+
+
+def _merge_text(head: MessageSegment, texts: list[str]) -> MessageSegment:
+    if len(texts) == 1:
+        return head
+    # 浅拷贝原消息段，避免 `dataclasses.replace` 逐字段重新初始化的开销
+    merged = object.__new__(type(head))
+    merged.__dict__.update(head.__dict__)
+    merged.data = {"text": "".join(texts)}
+    return merged
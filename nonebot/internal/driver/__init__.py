@@ -1,3 +1,5 @@
+from ._queue import EventQueue as EventQueue
+from ._queue import EventQueueStatistics as EventQueueStatistics
 from .abstract import ASGIMixin as ASGIMixin
 from .abstract import Driver as Driver
 from .abstract import ForwardDriver as ForwardDriver
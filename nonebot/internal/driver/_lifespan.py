@@ -19,6 +19,7 @@ class Lifespan:
 
         self._startup_funcs: list[LIFESPAN_FUNC] = []
         self._ready_funcs: list[LIFESPAN_FUNC] = []
+        self._pre_shutdown_funcs: list[LIFESPAN_FUNC] = []
         self._shutdown_funcs: list[LIFESPAN_FUNC] = []
 
     @property
@@ -37,6 +38,10 @@ class Lifespan:
         self._startup_funcs.append(func)
         return func
 
+    def on_pre_shutdown(self, func: LIFESPAN_FUNC) -> LIFESPAN_FUNC:
+        self._pre_shutdown_funcs.append(func)
+        return func
+
     def on_shutdown(self, func: LIFESPAN_FUNC) -> LIFESPAN_FUNC:
         self._shutdown_funcs.append(func)
         return func
@@ -75,6 +80,10 @@ class Lifespan:
         exc_val: BaseException | None = None,
         exc_tb: TracebackType | None = None,
     ) -> None:
+        # run pre shutdown funcs before any resource is released
+        if self._pre_shutdown_funcs:
+            await self._run_lifespan_func(self._pre_shutdown_funcs)
+
         if self._shutdown_funcs:
             # reverse shutdown funcs to ensure stack order
             await self._run_lifespan_func(reversed(self._shutdown_funcs))
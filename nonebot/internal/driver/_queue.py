@@ -0,0 +1,303 @@
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from time import perf_counter
+from typing import TYPE_CHECKING, Literal, TypeAlias
+
+import anyio
+from anyio.abc import ObjectReceiveStream, ObjectSendStream, TaskGroup
+
+from nonebot.log import logger
+from nonebot.utils import escape_tag
+
+if TYPE_CHECKING:
+    from nonebot.internal.adapter import Bot, Event
+
+OVERFLOW_POLICY: TypeAlias = Literal["block", "drop_oldest", "drop_newest"]
+DISPATCH_MODE: TypeAlias = Literal["shared", "session"]
+EVENT_HANDLER: TypeAlias = Callable[["Bot", "Event"], Awaitable[None]]
+_QueueItem: TypeAlias = tuple["Bot", "Event", float]
+
+
+@dataclass(frozen=True)
+class EventQueueStatistics:
+    """事件分发队列统计信息"""
+
+    size: int
+    """当前队列中等待处理的事件数量"""
+    max_size: int
+    """队列容量"""
+    workers: int
+    """处理协程数量"""
+    submitted: int
+    """已提交的事件数量"""
+    dropped: int
+    """因队列已满或关闭时未处理而被丢弃的事件数量"""
+    processed: int
+    """已开始处理的事件数量"""
+    wait_time_total: float
+    """事件在队列中等待的总时间，单位: 秒"""
+    wait_time_max: float
+    """事件在队列中等待的最长时间，单位: 秒"""
+
+    @property
+    def wait_time_avg(self) -> float:
+        """事件在队列中等待的平均时间，单位: 秒"""
+        return self.wait_time_total / self.processed if self.processed else 0.0
+
+
+class _EventLane:
+    def __init__(self, max_size: int, workers: int) -> None:
+        self.max_size = max_size
+        self.workers = workers
+
+        self.send_stream: ObjectSendStream[_QueueItem] | None = None
+        self.receive_stream: ObjectReceiveStream[_QueueItem] | None = None
+
+        self.submitted = 0
+        self.dropped = 0
+        self.processed = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+
+    def statistics(self) -> EventQueueStatistics:
+        return EventQueueStatistics(
+            size=(
+                self.receive_stream.statistics().current_buffer_used
+                if self.receive_stream is not None
+                else 0
+            ),
+            max_size=self.max_size,
+            workers=self.workers,
+            submitted=self.submitted,
+            dropped=self.dropped,
+            processed=self.processed,
+            wait_time_total=self.wait_time_total,
+            wait_time_max=self.wait_time_max,
+        )
+
+
+class EventQueue:
+    """有界事件分发队列。
+
+    事件提交后由固定数量的处理协程依次取出并处理，
+    队列已满时根据溢出策略阻塞提交方或丢弃事件。
+
+    分发模式为 `shared` 时，所有处理协程共享同一个队列；
+    分发模式为 `session` 时，事件根据会话 ID 分配至固定的处理通道，
+    每个通道拥有独立的队列与一个处理协程，
+    同一会话的事件将按提交顺序依次处理，不同会话的事件并行处理。
+    处理函数中不应等待同一会话的后续事件，否则该通道将死锁；
+    溢出策略不为 `block` 时，同一会话的事件仍可能被丢弃。
+
+    参数:
+        handler: 事件处理函数
+        max_size: 队列容量，分发模式为 `session` 时为每个通道的队列容量
+        workers: 处理协程数量，分发模式为 `session` 时为通道数量
+        overflow: 队列已满时的处理策略
+        mode: 分发模式
+    """
+
+    def __init__(
+        self,
+        handler: EVENT_HANDLER,
+        max_size: int,
+        workers: int = 1,
+        overflow: OVERFLOW_POLICY = "block",
+        mode: DISPATCH_MODE = "shared",
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("Event queue size must be positive")
+        if workers < 1:
+            raise ValueError("Event queue workers must be positive")
+
+        self.handler = handler
+        self.max_size = max_size
+        self.workers = workers
+        self.overflow: OVERFLOW_POLICY = overflow
+        self.mode: DISPATCH_MODE = mode
+
+        self._lanes = (
+            [_EventLane(max_size, 1) for _ in range(workers)]
+            if mode == "session"
+            else [_EventLane(max_size, workers)]
+        )
+        self._next_lane = 0
+        self._started = False
+        self._running_workers = 0
+        self._workers_done: anyio.Event | None = None
+
+    def __repr__(self) -> str:
+        return (
+            f"EventQueue(max_size={self.max_size}, workers={self.workers}, "
+            f"overflow={self.overflow!r}, mode={self.mode!r})"
+        )
+
+    @property
+    def started(self) -> bool:
+        """队列是否已启动"""
+        return self._started
+
+    def start(self, task_group: TaskGroup) -> None:
+        """创建队列并在任务组中启动处理协程"""
+        if self._started:
+            raise RuntimeError("Event queue already started")
+
+        self._workers_done = anyio.Event()
+        self._running_workers = sum(lane.workers for lane in self._lanes)
+        for lane in self._lanes:
+            lane.send_stream, lane.receive_stream = anyio.create_memory_object_stream[
+                _QueueItem
+            ](lane.max_size)
+            for _ in range(lane.workers):
+                task_group.start_soon(self._worker, lane, lane.receive_stream.clone())
+        self._started = True
+
+    async def close(self, grace_period: float | None = None) -> None:
+        """关闭队列，停止接受新事件并等待处理协程处理完剩余事件。
+
+        超时后仍未处理的事件将被丢弃并计入统计信息。
+
+        参数:
+            grace_period: 等待剩余事件处理完成的最长时间，单位: 秒，为 `None` 时不限制
+        """
+        if not self._started:
+            return
+
+        for lane in self._lanes:
+            if lane.send_stream is not None:
+                lane.send_stream.close()
+            lane.send_stream = None
+
+        if self._workers_done is not None:
+            with anyio.move_on_after(grace_period):
+                await self._workers_done.wait()
+
+        dropped = 0
+        for lane in self._lanes:
+            if lane.receive_stream is None:  # pragma: no cover
+                continue
+            while True:
+                try:
+                    lane.receive_stream.receive_nowait()
+                except (anyio.WouldBlock, anyio.EndOfStream):
+                    break
+                lane.dropped += 1
+                dropped += 1
+            lane.receive_stream.close()
+            lane.receive_stream = None
+        if dropped:
+            logger.warning(
+                f"Event queue closed before all events were handled, "
+                f"dropped {dropped} pending event(s)"
+            )
+        self._started = False
+
+    async def submit(self, bot: "Bot", event: "Event") -> bool:
+        """提交事件至队列。
+
+        溢出策略为 `block` 时，队列已满将等待直至有空位。
+
+        参数:
+            bot: Bot 对象
+            event: Event 对象
+
+        返回:
+            事件是否被接受
+        """
+        lane = self._select_lane(event)
+        send_stream, receive_stream = lane.send_stream, lane.receive_stream
+        if send_stream is None or receive_stream is None:
+            raise RuntimeError("Event queue not started or already closed")
+
+        lane.submitted += 1
+        item = (bot, event, perf_counter())
+
+        if self.overflow == "block":
+            await send_stream.send(item)
+            return True
+
+        try:
+            send_stream.send_nowait(item)
+            return True
+        except anyio.WouldBlock:
+            pass
+
+        if self.overflow == "drop_newest":
+            self._on_dropped(lane, event)
+            return False
+
+        # drop oldest event to make room for the new one
+        try:
+            _, dropped_event, _ = receive_stream.receive_nowait()
+        except anyio.WouldBlock:  # pragma: no cover
+            pass
+        else:
+            self._on_dropped(lane, dropped_event)
+        send_stream.send_nowait(item)
+        return True
+
+    def statistics(self) -> EventQueueStatistics:
+        """获取队列统计信息，分发模式为 `session` 时为所有通道的汇总"""
+        lanes = self.lane_statistics()
+        return EventQueueStatistics(
+            size=sum(lane.size for lane in lanes),
+            max_size=sum(lane.max_size for lane in lanes),
+            workers=sum(lane.workers for lane in lanes),
+            submitted=sum(lane.submitted for lane in lanes),
+            dropped=sum(lane.dropped for lane in lanes),
+            processed=sum(lane.processed for lane in lanes),
+            wait_time_total=sum(lane.wait_time_total for lane in lanes),
+            wait_time_max=max(lane.wait_time_max for lane in lanes),
+        )
+
+    def lane_statistics(self) -> list[EventQueueStatistics]:
+        """获取各处理通道的统计信息"""
+        return [lane.statistics() for lane in self._lanes]
+
+    def _select_lane(self, event: "Event") -> _EventLane:
+        if len(self._lanes) == 1:
+            return self._lanes[0]
+
+        try:
+            session_id = event.get_session_id()
+        except Exception:
+            # events without session have no order to keep
+            self._next_lane = (self._next_lane + 1) % len(self._lanes)
+            return self._lanes[self._next_lane]
+        return self._lanes[hash(session_id) % len(self._lanes)]
+
+    def _on_dropped(self, lane: _EventLane, event: "Event") -> None:
+        lane.dropped += 1
+        logger.opt(colors=True).warning(
+            "Event queue is full, dropped event "
+            f"<y>{escape_tag(event.get_event_name())}</y>"
+        )
+
+    async def _worker(
+        self, lane: _EventLane, receive_stream: ObjectReceiveStream[_QueueItem]
+    ) -> None:
+        try:
+            await self._consume(lane, receive_stream)
+        finally:
+            self._running_workers -= 1
+            if self._running_workers == 0 and self._workers_done is not None:
+                self._workers_done.set()
+
+    async def _consume(
+        self, lane: _EventLane, receive_stream: ObjectReceiveStream[_QueueItem]
+    ) -> None:
+        async with receive_stream:
+            async for bot, event, submitted_at in receive_stream:
+                wait_time = perf_counter() - submitted_at
+                lane.processed += 1
+                lane.wait_time_total += wait_time
+                lane.wait_time_max = max(lane.wait_time_max, wait_time)
+
+                try:
+                    await self.handler(bot, event)
+                except Exception as e:
+                    logger.opt(colors=True, exception=e).error(
+                        "<r><bg #f8bbd0>"
+                        "Error when handling event in queue."
+                        "</bg #f8bbd0></r>"
+                    )
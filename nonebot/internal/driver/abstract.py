@@ -25,9 +25,12 @@ from nonebot.utils import (
     escape_tag,
     flatten_exception_group,
     run_coro_with_catch,
+    shutdown_executors,
+    start_executors,
 )
 
 from ._lifespan import LIFESPAN_FUNC, Lifespan
+from ._queue import EventQueue
 from .model import (
     CookieTypes,
     HeaderTypes,
@@ -42,12 +45,18 @@ from .model import (
 )
 
 if TYPE_CHECKING:
-    from nonebot.internal.adapter import Adapter, Bot
+    from nonebot.internal.adapter import Adapter, Bot, Event
 
 
 BOT_HOOK_PARAMS = [DependParam, BotParam, DefaultParam]
 
 
+async def _handle_event(bot: "Bot", event: "Event") -> None:
+    from nonebot.message import handle_event
+
+    await handle_event(bot, event)
+
+
 class Driver(abc.ABC):
     """驱动器基类。
 
@@ -72,6 +81,24 @@ class Driver(abc.ABC):
         """全局配置对象"""
         self._bots: dict[str, "Bot"] = {}
         self._lifespan = Lifespan()
+        self._event_queue: EventQueue | None = (
+            EventQueue(
+                _handle_event,
+                max_size=config.event_queue_size,
+                workers=config.event_queue_workers,
+                overflow=config.event_queue_overflow,
+                mode=config.event_queue_mode,
+            )
+            if config.event_queue_size
+            else None
+        )
+        self._lifespan.on_startup(self._start_matcher_expire)
+        self._lifespan.on_startup(start_executors)
+        self._lifespan.on_shutdown(shutdown_executors)
+        if self._event_queue is not None:
+            self._lifespan.on_startup(self._start_event_queue)
+            # drain events before plugins and adapters release their resources
+            self._lifespan.on_pre_shutdown(self._close_event_queue)
 
     def __repr__(self) -> str:
         return (
@@ -88,6 +115,46 @@ class Driver(abc.ABC):
     def task_group(self) -> TaskGroup:
         return self._lifespan.task_group
 
+    @property
+    def event_queue(self) -> EventQueue | None:
+        """事件分发队列，未启用时为 `None`"""
+        return self._event_queue
+
+    async def submit_event(self, bot: "Bot", event: "Event") -> bool:
+        """提交事件进行处理。
+
+        启用事件分发队列时，事件将进入队列等待处理，
+        适配器可以等待该方法以将背压传递至连接的读取循环；
+        否则事件将立即在后台任务中处理。
+
+        参数:
+            bot: Bot 对象
+            event: Event 对象
+
+        返回:
+            事件是否被接受，队列已满丢弃事件时返回 `False`
+        """
+        if self._event_queue is None:
+            self.task_group.start_soon(_handle_event, bot, event)
+            return True
+        return await self._event_queue.submit(bot, event)
+
+    async def _start_matcher_expire(self) -> None:
+        from nonebot.internal.matcher import expire_scheduler
+
+        await expire_scheduler.start(self.task_group)
+
+    async def _start_event_queue(self) -> None:
+        if self._event_queue is not None:
+            self._event_queue.start(self.task_group)
+
+    async def _close_event_queue(self) -> None:
+        if self._event_queue is not None:
+            timeout = self.config.event_queue_close_timeout
+            await self._event_queue.close(
+                timeout.total_seconds() if timeout is not None else None
+            )
+
     def register_adapter(self, adapter: type["Adapter"], **kwargs) -> None:
         """注册一个协议适配器
 
@@ -1,8 +1,13 @@
+from .continuation import ContinuationRegistry as ContinuationRegistry
+from .continuation import MatcherContinuation as MatcherContinuation
+from .expire import MatcherExpireScheduler as MatcherExpireScheduler
 from .manager import MatcherManager as MatcherManager
 from .provider import DEFAULT_PROVIDER_CLASS as DEFAULT_PROVIDER_CLASS
 from .provider import MatcherProvider as MatcherProvider
 
 matchers = MatcherManager()
+expire_scheduler = MatcherExpireScheduler()
+continuations = ContinuationRegistry()
 
 from .matcher import Matcher as Matcher
 from .matcher import MatcherSource as MatcherSource
@@ -0,0 +1,169 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+import heapq
+from itertools import count
+import time
+from typing import TYPE_CHECKING, Any
+
+from nonebot.dependencies import Dependent
+from nonebot.typing import T_State
+
+from .manager import _get_permission_sessions
+
+if TYPE_CHECKING:
+    from nonebot.internal.permission import Permission
+
+    from .matcher import Matcher
+
+
+@dataclass(eq=False)
+class MatcherContinuation:
+    """事件响应器会话续体
+
+    保存 `got`、`reject`、`pause` 等会话控制暂停后的会话状态，
+    在下一次满足权限的事件到来时恢复运行剩余的事件处理函数，
+    而不必为每一轮对话创建新的事件响应器类。
+    """
+
+    matcher: type["Matcher"]
+    """暂停会话的事件响应器类"""
+    type: str
+    """恢复会话的事件类型，空字符串表示任意"""
+    permission: "Permission"
+    """恢复会话的权限"""
+    handlers: list[Dependent[Any]]
+    """剩余的事件处理函数"""
+    state: T_State
+    """会话状态"""
+    expire_time: datetime | None = None
+    """会话过期时间点"""
+    sessions: tuple[str, ...] | None = field(init=False)
+    """权限限定的会话 ID"""
+
+    def __post_init__(self) -> None:
+        self.sessions = _get_permission_sessions(self.permission)
+
+    def __repr__(self) -> str:
+        return f"MatcherContinuation(matcher={self.matcher}, type={self.type!r})"
+
+    def is_expired(self) -> bool:
+        """检查会话是否过期"""
+        # use timestamp to support both naive and aware datetime
+        return (
+            self.expire_time is not None and self.expire_time.timestamp() < time.time()
+        )
+
+    def resume(self) -> "Matcher":
+        """创建恢复会话的事件响应器实例"""
+        matcher = self.matcher()
+        matcher.remain_handlers = self.handlers.copy()
+        matcher.state = self.state.copy()
+        matcher.block = True
+        return matcher
+
+
+class ContinuationRegistry:
+    """事件响应器会话续体存储器
+
+    限定会话 ID 的续体按会话 ID 索引，分发事件时只需检查当前会话的续体。
+    过期的续体将在存储器被访问时清理。
+    """
+
+    def __init__(self) -> None:
+        self._sessions: dict[str, list[MatcherContinuation]] = {}
+        self._shared: list[MatcherContinuation] = []
+        self._heap: list[tuple[float, int, MatcherContinuation]] = []
+        self._counter = count()
+        self._size = 0
+
+    def __repr__(self) -> str:
+        return f"ContinuationRegistry(size={self._size})"
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, continuation: object) -> bool:
+        return isinstance(continuation, MatcherContinuation) and any(
+            continuation in bucket for bucket in self._buckets(continuation)
+        )
+
+    def _buckets(
+        self, continuation: MatcherContinuation
+    ) -> list[list[MatcherContinuation]]:
+        if continuation.sessions is None:
+            return [self._shared]
+        return [
+            self._sessions[session]
+            for session in continuation.sessions
+            if session in self._sessions
+        ]
+
+    def add(self, continuation: MatcherContinuation) -> None:
+        """添加会话续体
+
+        参数:
+            continuation: 会话续体
+        """
+        self._prune()
+        if continuation.sessions is None:
+            self._shared.append(continuation)
+        else:
+            for session in continuation.sessions:
+                self._sessions.setdefault(session, []).append(continuation)
+        if continuation.expire_time is not None:
+            heapq.heappush(
+                self._heap,
+                (
+                    continuation.expire_time.timestamp(),
+                    next(self._counter),
+                    continuation,
+                ),
+            )
+        self._size += 1
+
+    def remove(self, continuation: MatcherContinuation) -> bool:
+        """移除会话续体
+
+        参数:
+            continuation: 会话续体
+
+        返回:
+            续体是否存在，用于确保续体只被恢复一次
+        """
+        removed = False
+        for bucket in self._buckets(continuation):
+            if continuation in bucket:
+                bucket.remove(continuation)
+                removed = True
+        if continuation.sessions is not None:
+            for session in continuation.sessions:
+                if not self._sessions.get(session, True):
+                    del self._sessions[session]
+        if removed:
+            self._size -= 1
+        return removed
+
+    def get_candidates(self, session_id: str | None) -> list[MatcherContinuation]:
+        """获取可能被事件恢复的会话续体
+
+        参数:
+            session_id: 事件会话 ID，无法获取时为 `None`
+        """
+        self._prune()
+        candidates = self._shared.copy()
+        if session_id is not None and session_id in self._sessions:
+            candidates.extend(self._sessions[session_id])
+        return candidates
+
+    def clear(self) -> None:
+        """清空会话续体"""
+        self._sessions.clear()
+        self._shared.clear()
+        self._heap.clear()
+        self._size = 0
+
+    def _prune(self) -> None:
+        now = time.time()
+        while self._heap and self._heap[0][0] < now:
+            _, _, continuation = heapq.heappop(self._heap)
+            self.remove(continuation)
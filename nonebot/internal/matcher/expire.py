@@ -0,0 +1,108 @@
+import contextlib
+from datetime import datetime
+import heapq
+from itertools import count
+import math
+import time
+from typing import TYPE_CHECKING, TypeAlias
+from weakref import WeakSet, ref
+
+import anyio
+from anyio.abc import TaskGroup, TaskStatus
+
+from nonebot.log import logger
+
+if TYPE_CHECKING:
+    from .matcher import Matcher
+
+_HeapItem: TypeAlias = tuple[float, int, "ref[type[Matcher]]"]
+
+
+class MatcherExpireScheduler:
+    """事件响应器过期调度器
+
+    在事件响应器的最终有效时间点将其销毁，而不必在每次事件分发时检查时间。
+    调度器未运行时，将回退至分发时检查事件响应器是否过期。
+    """
+
+    def __init__(self) -> None:
+        self._heap: list[_HeapItem] = []
+        self._counter = count()
+        self._scheduled: WeakSet[type["Matcher"]] = WeakSet()
+        self._expired: WeakSet[type["Matcher"]] = WeakSet()
+        self._wakeup: anyio.Event | None = None
+        self._running = False
+
+    def __repr__(self) -> str:
+        return f"MatcherExpireScheduler(pending={len(self._heap)})"
+
+    @property
+    def running(self) -> bool:
+        """调度器是否正在运行"""
+        return self._running
+
+    def schedule(self, matcher: type["Matcher"]) -> None:
+        """调度事件响应器在其最终有效时间点过期
+
+        参数:
+            matcher: 事件响应器
+        """
+        if matcher.expire_time is None:
+            return
+
+        # use timestamp to support both naive and aware datetime
+        heapq.heappush(
+            self._heap,
+            (matcher.expire_time.timestamp(), next(self._counter), ref(matcher)),
+        )
+        self._scheduled.add(matcher)
+
+        # wake up the scheduler if the next expire time changed
+        if self._wakeup is not None and self._heap[0][2]() is matcher:
+            self._wakeup.set()
+
+    def is_expired(self, matcher: type["Matcher"]) -> bool:
+        """检查事件响应器是否过期
+
+        参数:
+            matcher: 事件响应器
+        """
+        if matcher.expire_time is None:
+            return False
+        if matcher in self._expired:
+            return True
+        if self._running and matcher in self._scheduled:
+            return False
+        return datetime.now() > matcher.expire_time
+
+    async def start(self, task_group: TaskGroup) -> None:
+        """在任务组中启动调度器，已运行时忽略"""
+        if not self._running:
+            await task_group.start(self._run)
+
+    async def _run(self, *, task_status: TaskStatus[None]) -> None:
+        self._running = True
+        try:
+            task_status.started()
+            while True:
+                self._expire()
+
+                self._wakeup = anyio.Event()
+                timeout = self._heap[0][0] - time.time() if self._heap else math.inf
+                with anyio.move_on_after(timeout):
+                    await self._wakeup.wait()
+        finally:
+            self._running = False
+            self._wakeup = None
+
+    def _expire(self) -> None:
+        now = time.time()
+        while self._heap and self._heap[0][0] <= now:
+            _, _, matcher_ref = heapq.heappop(self._heap)
+            if (matcher := matcher_ref()) is None:
+                continue
+
+            self._expired.add(matcher)
+            logger.trace(f"Matcher {matcher} expired")
+            with contextlib.suppress(Exception):
+                matcher.destroy()
@@ -1,13 +1,59 @@
 from collections.abc import ItemsView, Iterator, KeysView, MutableMapping, ValuesView
-from typing import TYPE_CHECKING, TypeVar, overload
+from typing import TYPE_CHECKING, TypeAlias, TypeVar, overload
 
 from .provider import DEFAULT_PROVIDER_CLASS, MatcherProvider
 
 if TYPE_CHECKING:
+    from nonebot.internal.permission import Permission
+
     from .matcher import Matcher
 
 T = TypeVar("T")
 
+_IndexBucket: TypeAlias = tuple[
+    int,
+    tuple[type["Matcher"], ...],
+    dict[tuple[str, ...], tuple[type["Matcher"], ...]],
+]
+
+
+def _get_matcher_commands(
+    matcher: type["Matcher"],
+) -> frozenset[tuple[str, ...]] | None:
+    """获取事件响应器规则要求的命令
+
+    规则中的所有检查均需通过，因此多个命令检查取交集。
+    非命令事件响应器返回 `None`。
+    """
+    from nonebot.rule import CommandRule, ShellCommandRule
+
+    commands: frozenset[tuple[str, ...]] | None = None
+    for checker in matcher.rule.checkers:
+        if isinstance(checker.call, (CommandRule, ShellCommandRule)):
+            cmds = frozenset(checker.call.cmds)
+            commands = cmds if commands is None else commands & cmds
+    return commands
+
+
+def _get_permission_sessions(permission: "Permission") -> tuple[str, ...] | None:
+    """获取权限限定的会话 ID
+
+    仅当权限只包含一个 `User` 检查时返回其会话 ID 元组，
+    此时会话 ID 不匹配的事件必然无法通过权限检查。
+    其他权限返回 `None`。
+    """
+    from nonebot.internal.permission import User
+
+    checkers = permission.checkers
+    if len(checkers) == 1 and isinstance(user := next(iter(checkers)).call, User):
+        return user.users
+    return None
+
+
+def _get_matcher_sessions(matcher: type["Matcher"]) -> tuple[str, ...] | None:
+    """获取事件响应器权限限定的会话 ID"""
+    return _get_permission_sessions(matcher.permission)
+
 
 class MatcherManager(MutableMapping[int, list[type["Matcher"]]]):
     """事件响应器管理器
@@ -18,6 +64,16 @@ class MatcherManager(MutableMapping[int, list[type["Matcher"]]]):
     def __init__(self):
         self.provider: MatcherProvider = DEFAULT_PROVIDER_CLASS({})
 
+        self._index_provider: MatcherProvider | None = None
+        self._index_source: list[tuple[int, list[type["Matcher"]]]] = []
+        self._index_snapshot: dict[int, list[type["Matcher"]]] = {}
+        self._session_index: dict[str, list[type["Matcher"]]] = {}
+        self._index_cache: dict[str | None, list[_IndexBucket]] = {}
+        self._candidate_cache: dict[
+            tuple[str | None, tuple[str, ...] | None],
+            tuple[tuple[int, tuple[type["Matcher"], ...]], ...],
+        ] = {}
+
     def __repr__(self) -> str:
         return f"MatcherManager(provider={self.provider!r})"
 
@@ -35,9 +91,11 @@ class MatcherManager(MutableMapping[int, list[type["Matcher"]]]):
 
     def __setitem__(self, key: int, value: list[type["Matcher"]]) -> None:
         self.provider[key] = value
+        self._invalidate_index()
 
     def __delitem__(self, key: int) -> None:
         del self.provider[key]
+        self._invalidate_index()
 
     def __eq__(self, other: object) -> bool:
         return isinstance(other, MatcherManager) and self.provider == other.provider
@@ -70,24 +128,216 @@ class MatcherManager(MutableMapping[int, list[type["Matcher"]]]):
     def pop(  # pyright: ignore[reportIncompatibleMethodOverride]
         self, key: int
     ) -> list[type["Matcher"]]:
+        self._invalidate_index()
         return self.provider.pop(key)
 
     def popitem(self) -> tuple[int, list[type["Matcher"]]]:
+        self._invalidate_index()
         return self.provider.popitem()
 
     def clear(self) -> None:
         self.provider.clear()
+        self._invalidate_index()
 
     def update(  # pyright: ignore[reportIncompatibleMethodOverride]
         self, m: MutableMapping[int, list[type["Matcher"]]], /
     ) -> None:
         self.provider.update(m)
+        self._invalidate_index()
 
     def setdefault(
         self, key: int, default: list[type["Matcher"]]
     ) -> list[type["Matcher"]]:
+        self._invalidate_index()
         return self.provider.setdefault(key, default)
 
+    def add(self, matcher: type["Matcher"]) -> None:
+        """添加事件响应器
+
+        参数:
+            matcher: 事件响应器
+        """
+        priority_matchers = self.provider[matcher.priority]
+        priority_matchers.append(matcher)
+        self._update_session_index(matcher, priority_matchers, 1)
+
+    def remove(self, matcher: type["Matcher"]) -> None:
+        """移除事件响应器
+
+        参数:
+            matcher: 事件响应器
+        """
+        priority_matchers = self.provider[matcher.priority]
+        priority_matchers.remove(matcher)
+        self._update_session_index(matcher, priority_matchers, -1)
+
+    @property
+    def has_session_matchers(self) -> bool:
+        """是否存在限定会话的事件响应器"""
+        self._check_index()
+        return bool(self._session_index)
+
+    def get_candidates(
+        self,
+        event_type: str | None = None,
+        command: tuple[str, ...] | None = None,
+        session_id: str | None = None,
+    ) -> tuple[tuple[int, tuple[type["Matcher"], ...]], ...]:
+        """获取可能响应事件的事件响应器
+
+        结果按优先级升序排列，并跳过没有候选事件响应器的优先级。
+        索引在事件响应器变更后惰性重建。
+
+        权限仅限定会话的事件响应器 (如 `got`、`reject`、`pause` 产生的临时事件响应器)
+        按会话 ID 单独索引，仅在会话 ID 匹配时包含，增删时无需重建索引。
+
+        参数:
+            event_type: 事件类型，为 `None` 时不按类型筛选
+            command: 事件解析出的命令，仅包含对应命令的命令事件响应器
+            session_id: 事件的会话 ID
+        """
+        self._check_index()
+        key = (event_type, command)
+        if (candidates := self._candidate_cache.get(key)) is None:
+            candidates = self._candidate_cache[key] = tuple(
+                (priority, bucket)
+                for priority, generic, by_command in self._get_type_index(event_type)
+                if (
+                    bucket := (
+                        generic + by_command.get(command, ())
+                        if command is not None
+                        else generic
+                    )
+                )
+            )
+        if session_id is not None and (
+            session_matchers := self._session_index.get(session_id)
+        ):
+            candidates = self._merge_session_matchers(
+                candidates, session_matchers, event_type
+            )
+        return candidates
+
+    @staticmethod
+    def _merge_session_matchers(
+        candidates: tuple[tuple[int, tuple[type["Matcher"], ...]], ...],
+        session_matchers: list[type["Matcher"]],
+        event_type: str | None,
+    ) -> tuple[tuple[int, tuple[type["Matcher"], ...]], ...]:
+        merged = {priority: list(group) for priority, group in candidates}
+        for matcher in session_matchers:
+            if event_type is None or matcher.type in ("", event_type):
+                merged.setdefault(matcher.priority, []).append(matcher)
+        return tuple(
+            (priority, tuple(group)) for priority, group in sorted(merged.items())
+        )
+
+    def _get_type_index(self, event_type: str | None) -> list[_IndexBucket]:
+        if (index := self._index_cache.get(event_type)) is not None:
+            return index
+
+        index = self._index_cache[event_type] = []
+        for priority, priority_matchers in self._index_source:
+            generic: list[type["Matcher"]] = []
+            by_command: dict[tuple[str, ...], list[type["Matcher"]]] = {}
+            for matcher in priority_matchers:
+                if _get_matcher_sessions(matcher) is not None:
+                    continue
+                if event_type is not None and matcher.type not in ("", event_type):
+                    continue
+                if (commands := _get_matcher_commands(matcher)) is None:
+                    generic.append(matcher)
+                    continue
+                for command in commands:
+                    by_command.setdefault(command, []).append(matcher)
+            if generic or by_command:
+                index.append(
+                    (
+                        priority,
+                        tuple(generic),
+                        {cmd: tuple(group) for cmd, group in by_command.items()},
+                    )
+                )
+        return index
+
+    def _invalidate_index(self) -> None:
+        self._index_provider = None
+
+    def invalidate_index(self) -> None:
+        """使事件响应器索引失效
+
+        事件响应器的类型、规则、权限或优先级变更后调用，索引将在下次分发时重建。
+        """
+        self._invalidate_index()
+
+    def _update_session_index(
+        self,
+        matcher: type["Matcher"],
+        priority_matchers: list[type["Matcher"]],
+        delta: int,
+    ) -> None:
+        # session matchers are created and destroyed frequently,
+        # update the index in place instead of rebuilding it when possible
+        priority = matcher.priority
+        sessions = _get_matcher_sessions(matcher)
+        if (
+            sessions is None
+            or self._index_provider is not self.provider
+            or (snapshot := self._index_snapshot.get(priority)) is None
+            or self.provider.get(priority) is not priority_matchers
+        ):
+            self._invalidate_index()
+            return
+
+        expected = snapshot.copy()
+        if delta > 0:
+            expected.append(matcher)
+        elif matcher in expected:
+            expected.remove(matcher)
+        if expected != priority_matchers:
+            self._invalidate_index()
+            return
+
+        self._index_snapshot[priority] = expected
+        for session_id in sessions:
+            if delta > 0:
+                self._session_index.setdefault(session_id, []).append(matcher)
+            elif session_matchers := self._session_index.get(session_id):
+                session_matchers.remove(matcher)
+                if not session_matchers:
+                    del self._session_index[session_id]
+
+    def _check_index(self) -> None:
+        # provider may be modified in place (e.g. list operations or provider
+        # context switching), so validate the snapshot before using the cache.
+        # list equality compares matcher classes by identity
+        provider = self.provider
+        snapshot = self._index_snapshot
+        if (
+            self._index_provider is provider
+            and len(self._index_source) == len(provider)
+            and all(
+                provider.get(priority) is priority_matchers
+                and priority_matchers == snapshot[priority]
+                for priority, priority_matchers in self._index_source
+            )
+        ):
+            return
+
+        self._index_provider = provider
+        self._index_source = sorted(provider.items(), key=lambda x: x[0])
+        self._index_snapshot = {
+            priority: priority_matchers.copy()
+            for priority, priority_matchers in self._index_source
+        }
+        self._session_index = {}
+        for _, priority_matchers in self._index_source:
+            for matcher in priority_matchers:
+                for session_id in _get_matcher_sessions(matcher) or ():
+                    self._session_index.setdefault(session_id, []).append(matcher)
+        self._index_cache.clear()
+        self._candidate_cache.clear()
+
     def set_provider(self, provider_class: type[MatcherProvider]) -> None:
         """设置事件响应器存储器
 
@@ -95,3 +345,4 @@ class MatcherManager(MutableMapping[int, list[type["Matcher"]]]):
             provider_class: 事件响应器存储器类
         """
         self.provider = provider_class(self.provider)
+        self._invalidate_index()
@@ -45,6 +45,7 @@ from nonebot.internal.adapter import (
     Message,
     MessageSegment,
     MessageTemplate,
+    SendBuffer,
 )
 from nonebot.internal.params import (
     ArgParam,
@@ -68,7 +69,8 @@ from nonebot.typing import (
 )
 from nonebot.utils import classproperty, flatten_exception_group
 
-from . import matchers
+from . import continuations, expire_scheduler, matchers
+from .continuation import MatcherContinuation
 
 if TYPE_CHECKING:
     from nonebot.plugin import Plugin
@@ -122,6 +124,12 @@ class MatcherMeta(type):
         _source: MatcherSource | None
         module_name: str | None
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # attributes used by the dispatch index
+        if name in ("type", "rule", "permission", "priority"):
+            matchers.invalidate_index()
+
     def __repr__(self) -> str:
         return (
             f"{self.__name__}(type={self.type!r}"
@@ -178,6 +186,8 @@ class Matcher(metaclass=MatcherMeta):
     def __init__(self):
         self.remain_handlers: list[Dependent[Any]] = self.handlers.copy()
         self.state = self._default_state.copy()
+        self.send_buffer: SendBuffer | None = None
+        """消息发送缓冲区，启用 `send_buffer` 配置时在运行期间创建"""
 
     def __repr__(self) -> str:
         return (
@@ -320,14 +330,15 @@ class Matcher(metaclass=MatcherMeta):
 
         logger.trace(f"Define new matcher {NewMatcher}")
 
-        matchers[priority].append(NewMatcher)
+        matchers.add(NewMatcher)
+        expire_scheduler.schedule(NewMatcher)
 
         return NewMatcher  # type: ignore
 
     @classmethod
     def destroy(cls) -> None:
         """销毁当前的事件响应器"""
-        matchers[cls.priority].remove(cls)
+        matchers.remove(cls)
 
     @classproperty
     def plugin(cls) -> "Plugin | None":
@@ -553,20 +564,38 @@ class Matcher(metaclass=MatcherMeta):
     ) -> Any:
         """发送一条消息给当前交互用户
 
+        启用 `send_buffer` 配置时，消息将被缓冲，
+        并在超出缓冲时间窗口或事件响应器运行结束时合并发送。
+
         参数:
             message: 消息内容
             kwargs: {ref}`nonebot.adapters.Bot.send` 的参数，
                 请参考对应 adapter 的 bot 对象 api
+
+        返回:
+            `Bot.send` 的返回值，消息被缓冲时为 `None`
         """
         bot = current_bot.get()
         event = current_event.get()
+        matcher = current_matcher.get()
         if isinstance(message, MessageTemplate):
-            state = current_matcher.get().state
-            _message = message.format(**state)
+            _message = message.format(**matcher.state)
         else:
             _message = message
+        if matcher.send_buffer is not None:
+            return await matcher.send_buffer.send(event, _message, **kwargs)
         return await bot.send(event=event, message=_message, **kwargs)
 
+    @classmethod
+    async def flush(cls) -> None:
+        """立即发送当前事件响应器缓冲的消息
+
+        未启用消息发送缓冲时无任何效果。
+        """
+        matcher = current_matcher.get()
+        if matcher.send_buffer is not None:
+            await matcher.send_buffer.flush()
+
     @classmethod
     async def finish(
         cls,
@@ -835,6 +864,8 @@ class Matcher(metaclass=MatcherMeta):
         def _handle_stop_propagation(exc_group: BaseExceptionGroup[StopPropagation]):
             self.block = True
 
+        self.send_buffer = SendBuffer.from_config(bot)
+
         with self.ensure_context(bot, event):
             try:
                 with catch({StopPropagation: _handle_stop_propagation}):
@@ -861,6 +892,16 @@ class Matcher(metaclass=MatcherMeta):
                                 dependency_cache=dependency_cache,
                             )
             finally:
+                # flush failure must not replace the session control exception
+                if self.send_buffer is not None:
+                    try:
+                        await self.send_buffer.flush()
+                    except Exception as e:
+                        logger.opt(colors=True, exception=e).error(
+                            "<r><bg #f8bbd0>"
+                            f"Flushing buffered messages of {self} failed."
+                            "</bg #f8bbd0></r>"
+                        )
                 logger.info(f"{self} running complete")
 
     # 运行handlers
@@ -919,42 +960,56 @@ class Matcher(metaclass=MatcherMeta):
             pass
         elif isinstance(exc, RejectedException):
             await self.resolve_reject()
-            type_ = await self.update_type(bot, event, stack, dependency_cache)
-            permission = await self.update_permission(
-                bot, event, stack, dependency_cache
-            )
-
-            self.new(
-                type_,
-                Rule(),
-                permission,
-                self.remain_handlers,
-                temp=True,
-                priority=0,
-                block=True,
-                source=self.__class__._source,
-                expire_time=bot.config.session_expire_timeout,
-                default_state=self.state,
-                default_type_updater=self.__class__._default_type_updater,
-                default_permission_updater=self.__class__._default_permission_updater,
-            )
+            await self.suspend(bot, event, stack, dependency_cache)
         elif isinstance(exc, PausedException):
-            type_ = await self.update_type(bot, event, stack, dependency_cache)
-            permission = await self.update_permission(
-                bot, event, stack, dependency_cache
-            )
+            await self.suspend(bot, event, stack, dependency_cache)
+
+    async def suspend(
+        self,
+        bot: Bot,
+        event: Event,
+        stack: AsyncExitStack | None = None,
+        dependency_cache: T_DependencyCache | None = None,
+    ) -> None:
+        """暂停会话，等待下一次满足权限的事件恢复运行剩余的事件处理函数
+
+        启用 `session_continuation` 配置时保存为会话续体，
+        否则创建新的临时事件响应器。
 
-            self.new(
+        参数:
+            bot: Bot 对象
+            event: 上报事件
+            stack: 异步上下文栈
+            dependency_cache: 依赖缓存
+        """
+        type_ = await self.update_type(bot, event, stack, dependency_cache)
+        permission = await self.update_permission(bot, event, stack, dependency_cache)
+        expire_time = datetime.now() + bot.config.session_expire_timeout
+
+        if bot.config.session_continuation:
+            continuation = MatcherContinuation(
+                self.__class__,
                 type_,
-                Rule(),
                 permission,
                 self.remain_handlers,
-                temp=True,
-                priority=0,
-                block=True,
-                source=self.__class__._source,
-                expire_time=bot.config.session_expire_timeout,
-                default_state=self.state,
-                default_type_updater=self.__class__._default_type_updater,
-                default_permission_updater=self.__class__._default_permission_updater,
+                self.state,
+                expire_time,
             )
+            logger.trace(f"Suspend {self} as {continuation}")
+            continuations.add(continuation)
+            return
+
+        self.new(
+            type_,
+            Rule(),
+            permission,
+            self.remain_handlers,
+            temp=True,
+            priority=0,
+            block=True,
+            source=self.__class__._source,
+            expire_time=expire_time,
+            default_state=self.state,
+            default_type_updater=self.__class__._default_type_updater,
+            default_permission_updater=self.__class__._default_permission_updater,
+        )
@@ -7,6 +7,7 @@ from typing import (
     Annotated,
     Any,
     Literal,
+    TypeAlias,
     cast,
     get_args,
     get_origin,
@@ -21,20 +22,27 @@ from nonebot.compat import FieldInfo, ModelField, PydanticUndefined
 from nonebot.consts import ARG_KEY, REJECT_PROMPT_RESULT_KEY
 from nonebot.dependencies import Dependent, Param
 from nonebot.dependencies.utils import check_field_type
-from nonebot.exception import SkippedException
+from nonebot.exception import SkippedException, TypeMisMatch
 from nonebot.typing import (
     _STATE_FLAG,
     T_DependencyCache,
     T_Handler,
     T_State,
+    is_none_type,
     origin_is_annotated,
+    origin_is_union,
 )
 from nonebot.utils import (
+    UNSET,
+    CacheStatistics,
+    LRUCache,
+    UnsetType,
     generic_check_issubclass,
     get_name,
     is_async_gen_callable,
     is_coroutine_callable,
     is_gen_callable,
+    resolve_executor,
     run_sync,
     run_sync_ctx_manager,
 )
@@ -44,6 +52,13 @@ if TYPE_CHECKING:
     from nonebot.matcher import Matcher
 
 
+CacheScope: TypeAlias = Literal["event", "session", "bot", "global"]
+"""子依赖缓存作用域"""
+
+DEFAULT_CACHE_SIZE = 1024
+"""子依赖作用域缓存默认最大条目数量"""
+
+
 class DependsInner:
     def __init__(
         self,
@@ -51,16 +66,28 @@ class DependsInner:
         *,
         use_cache: bool = True,
         validate: bool | PydanticFieldInfo = False,
+        executor: str | None = None,
+        cache_scope: CacheScope = "event",
+        cache_ttl: float | None = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
     ) -> None:
         self.dependency = dependency
         self.use_cache = use_cache
         self.validate = validate
+        self.executor = executor
+        self.cache_scope: CacheScope = cache_scope
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
 
     def __repr__(self) -> str:
         dep = get_name(self.dependency)
         cache = "" if self.use_cache else ", use_cache=False"
         validate = f", validate={self.validate}" if self.validate else ""
-        return f"DependsInner({dep}{cache}{validate})"
+        executor = f", executor={self.executor!r}" if self.executor else ""
+        scope = (
+            f", cache_scope={self.cache_scope!r}" if self.cache_scope != "event" else ""
+        )
+        return f"DependsInner({dep}{cache}{validate}{executor}{scope})"
 
 
 def Depends(
@@ -68,6 +95,10 @@ def Depends(
     *,
     use_cache: bool = True,
     validate: bool | PydanticFieldInfo = False,
+    executor: str | None = None,
+    cache_scope: CacheScope = "event",
+    cache_ttl: float | None = None,
+    cache_size: int = DEFAULT_CACHE_SIZE,
 ) -> Any:
     """子依赖装饰器
 
@@ -75,6 +106,13 @@ def Depends(
         dependency: 依赖函数。默认为参数的类型注释。
         use_cache: 是否使用缓存。默认为 `True`。
         validate: 是否使用 Pydantic 类型校验。默认为 `False`。
+        executor: 同步依赖函数使用的执行器名称。
+            默认参考 {ref}`nonebot.utils.resolve_executor`。
+        cache_scope: 缓存作用域。默认为 `event`，仅在同一事件中共享结果；
+            `session` 与 `bot` 分别在同一会话与同一机器人的事件间共享结果，
+            `global` 在所有事件间共享结果。生成器依赖仅支持 `event` 作用域。
+        cache_ttl: 作用域缓存的有效时间，单位: 秒。默认不过期。
+        cache_size: 作用域缓存的最大条目数量，超出时淘汰最久未使用的条目。
 
     用法:
         ```python
@@ -90,11 +128,55 @@ def Depends(
         async def handler(
             param_name: Any = Depends(depend_func),
             gen: Any = Depends(depend_gen_func),
+            config: Any = Depends(depend_func, cache_scope="session", cache_ttl=60),
         ):
             ...
         ```
     """
-    return DependsInner(dependency, use_cache=use_cache, validate=validate)
+    return DependsInner(
+        dependency,
+        use_cache=use_cache,
+        validate=validate,
+        executor=executor,
+        cache_scope=cache_scope,
+        cache_ttl=cache_ttl,
+        cache_size=cache_size,
+    )
+
+
+_scoped_caches: dict[
+    tuple[Callable[..., Any], CacheScope, float | None, int], LRUCache[Any, Any]
+] = {}
+
+
+def _get_scoped_cache(
+    call: Callable[..., Any], scope: CacheScope, ttl: float | None, size: int
+) -> LRUCache[Any, Any]:
+    # the same dependency may be declared with different cache settings,
+    # each combination of settings gets its own cache
+    key = (call, scope, ttl, size)
+    if (cache := _scoped_caches.get(key)) is None:
+        cache = _scoped_caches[key] = LRUCache(size, ttl)
+    return cache
+
+
+def get_dependency_cache_statistics() -> dict[str, CacheStatistics]:
+    """获取所有子依赖作用域缓存的统计信息
+
+    键为 `依赖函数名称:作用域`，同一依赖以不同缓存设置声明时，
+    键为 `依赖函数名称:作用域:ttl=有效时间,size=最大条目数量`。
+    """
+    settings: dict[tuple[Callable[..., Any], CacheScope], int] = {}
+    for call, scope, _, _ in _scoped_caches:
+        settings[(call, scope)] = settings.get((call, scope), 0) + 1
+
+    statistics: dict[str, CacheStatistics] = {}
+    for (call, scope, ttl, size), cache in _scoped_caches.items():
+        name = f"{get_name(call)}:{scope}"
+        if settings[(call, scope)] > 1:
+            name += f":ttl={ttl},size={size}"
+        statistics[name] = cache.statistics()
+    return statistics
 
 
 class CacheState(str, Enum):
@@ -178,11 +260,21 @@ class DependParam(Param):
     """
 
     def __init__(
-        self, *args, dependent: Dependent[Any], use_cache: bool, **kwargs: Any
+        self,
+        *args,
+        dependent: Dependent[Any],
+        use_cache: bool,
+        executor: str | None = None,
+        cache_scope: CacheScope = "event",
+        scoped_cache: LRUCache[Any, Any] | None = None,
+        **kwargs: Any,
     ) -> None:
         super().__init__(*args, **kwargs)
         self.dependent = dependent
         self.use_cache = use_cache
+        self.executor = executor
+        self.cache_scope: CacheScope = cache_scope
+        self.scoped_cache = scoped_cache
 
     def __repr__(self) -> str:
         return f"Depends({self.dependent}, use_cache={self.use_cache})"
@@ -191,14 +283,32 @@ class DependParam(Param):
     def _from_field(
         cls,
         sub_dependent: Dependent[Any],
-        use_cache: bool,
-        validate: bool | PydanticFieldInfo,
+        depends_inner: DependsInner,
     ) -> Self:
+        scoped_cache = None
+        if depends_inner.use_cache and depends_inner.cache_scope != "event":
+            call = cast(Callable[..., Any], sub_dependent.call)
+            if is_gen_callable(call) or is_async_gen_callable(call):
+                raise ValueError(
+                    f"Generator dependency {get_name(call)} "
+                    "only supports event cache scope"
+                )
+            scoped_cache = _get_scoped_cache(
+                call,
+                depends_inner.cache_scope,
+                depends_inner.cache_ttl,
+                depends_inner.cache_size,
+            )
+
+        validate = depends_inner.validate
         return cls._inherit_construct(
             validate if isinstance(validate, PydanticFieldInfo) else None,
             dependent=sub_dependent,
-            use_cache=use_cache,
+            use_cache=depends_inner.use_cache,
             validate=bool(validate),
+            executor=depends_inner.executor,
+            cache_scope=depends_inner.cache_scope,
+            scoped_cache=scoped_cache,
         )
 
     @classmethod
@@ -237,9 +347,7 @@ class DependParam(Param):
             allow_types=allow_types,
         )
 
-        return cls._from_field(
-            sub_dependent, depends_inner.use_cache, depends_inner.validate
-        )
+        return cls._from_field(sub_dependent, depends_inner)
 
     @classmethod
     @override
@@ -251,7 +359,7 @@ class DependParam(Param):
             dependent = Dependent[Any].parse(
                 call=value.dependency, allow_types=allow_types
             )
-            return cls._from_field(dependent, value.use_cache, value.validate)
+            return cls._from_field(dependent, value)
 
     @override
     async def _solve(
@@ -260,9 +368,42 @@ class DependParam(Param):
         dependency_cache: T_DependencyCache | None = None,
         **kwargs: Any,
     ) -> Any:
-        use_cache: bool = self.use_cache
         dependency_cache = {} if dependency_cache is None else dependency_cache
 
+        if (
+            self.scoped_cache is not None
+            and (key := self._get_cache_key(**kwargs)) is not UNSET
+        ):
+            return await self.scoped_cache.get_or_create(
+                key, lambda: self._solve_dependency(stack, dependency_cache, **kwargs)
+            )
+        return await self._solve_dependency(stack, dependency_cache, **kwargs)
+
+    def _get_cache_key(
+        self, bot: "Bot | None" = None, event: "Event | None" = None, **kwargs: Any
+    ) -> Any | UnsetType:
+        if self.cache_scope == "global":
+            return None
+        if bot is None:
+            return UNSET
+        if self.cache_scope == "bot":
+            return bot.self_id
+        if event is None:
+            return UNSET
+        try:
+            return bot.self_id, event.get_session_id()
+        except Exception:
+            # event has no session, e.g. meta event
+            return UNSET
+
+    async def _solve_dependency(
+        self,
+        stack: AsyncExitStack | None,
+        dependency_cache: T_DependencyCache,
+        **kwargs: Any,
+    ) -> Any:
+        use_cache: bool = self.use_cache
+
         sub_dependent = self.dependent
         call = cast(Callable[..., Any], sub_dependent.call)
 
@@ -292,7 +433,10 @@ class DependParam(Param):
                 "Generator dependency should be called in context"
             )
             if is_gen_callable(call):
-                cm = run_sync_ctx_manager(contextmanager(call)(**sub_values))
+                cm = run_sync_ctx_manager(
+                    contextmanager(call)(**sub_values),
+                    executor=resolve_executor(call, self.executor),
+                )
             else:
                 cm = asynccontextmanager(call)(**sub_values)
 
@@ -300,7 +444,7 @@ class DependParam(Param):
         elif is_coroutine_callable(call):
             target = call(**sub_values)
         else:
-            target = run_sync(call)(**sub_values)
+            target = run_sync(call, executor=self.executor)(**sub_values)
 
         dependency_cache[call] = cache = DependencyCache()
         try:
@@ -324,6 +468,42 @@ class DependParam(Param):
         await self.dependent.check(**kwargs)
 
 
+def _get_instance_types(checker: ModelField | None) -> tuple[type[Any], ...] | None:
+    """将类型注解解析为可以直接用于 `isinstance` 检查的类型元组
+
+    仅支持普通类型及其 `Union`，其他注解返回 `None` 并使用 pydantic 检查。
+    """
+    if checker is None:
+        return None
+
+    def _resolve(annotation: Any) -> tuple[type[Any], ...] | None:
+        if is_none_type(annotation):
+            return (type(None),)
+        origin = get_origin(annotation)
+        if origin is None:
+            return (annotation,) if isinstance(annotation, type) else None
+        if origin_is_union(origin):
+            types: tuple[type[Any], ...] = ()
+            for arg in get_args(annotation):
+                if (arg_types := _resolve(arg)) is None:
+                    return None
+                types += arg_types
+            return types
+        return None
+
+    return _resolve(checker.annotation)
+
+
+def _check_instance(
+    checker: ModelField | None, types: tuple[type[Any], ...] | None, value: Any
+) -> None:
+    if types is not None:
+        if not isinstance(value, types):
+            raise TypeMisMatch(cast(ModelField, checker), value)
+    elif checker is not None:
+        check_field_type(checker, value)
+
+
 class BotParam(Param):
     """{ref}`nonebot.adapters.Bot` 注入参数。
 
@@ -332,9 +512,13 @@ class BotParam(Param):
     为保证兼容性，本注入还会解析名为 `bot` 且没有类型注解的参数。
     """
 
+    _inline = True
+    _type_checked = True
+
     def __init__(self, *args, checker: ModelField | None = None, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self.checker = checker
+        self.checker_types = _get_instance_types(checker)
 
     def __repr__(self) -> str:
         return (
@@ -372,8 +556,7 @@ class BotParam(Param):
     async def _check(  # pyright: ignore[reportIncompatibleMethodOverride]
         self, bot: "Bot", **kwargs: Any
     ) -> None:
-        if self.checker is not None:
-            check_field_type(self.checker, bot)
+        _check_instance(self.checker, self.checker_types, bot)
 
 
 class EventParam(Param):
@@ -384,9 +567,13 @@ class EventParam(Param):
     为保证兼容性，本注入还会解析名为 `event` 且没有类型注解的参数。
     """
 
+    _inline = True
+    _type_checked = True
+
     def __init__(self, *args, checker: ModelField | None = None, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self.checker = checker
+        self.checker_types = _get_instance_types(checker)
 
     def __repr__(self) -> str:
         return (
@@ -424,8 +611,7 @@ class EventParam(Param):
     async def _check(  # pyright: ignore[reportIncompatibleMethodOverride]
         self, event: "Event", **kwargs: Any
     ) -> Any:
-        if self.checker is not None:
-            check_field_type(self.checker, event)
+        _check_instance(self.checker, self.checker_types, event)
 
 
 class StateParam(Param):
@@ -436,6 +622,9 @@ class StateParam(Param):
     为保证兼容性，本注入还会解析名为 `state` 且没有类型注解的参数。
     """
 
+    _inline = True
+    _type_checked = True
+
     def __repr__(self) -> str:
         return "StateParam()"
 
@@ -468,9 +657,13 @@ class MatcherParam(Param):
     为保证兼容性，本注入还会解析名为 `matcher` 且没有类型注解的参数。
     """
 
+    _inline = True
+    _type_checked = True
+
     def __init__(self, *args, checker: ModelField | None = None, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self.checker = checker
+        self.checker_types = _get_instance_types(checker)
 
     def __repr__(self) -> str:
         return (
@@ -508,8 +701,7 @@ class MatcherParam(Param):
     async def _check(  # pyright: ignore[reportIncompatibleMethodOverride]
         self, matcher: "Matcher", **kwargs: Any
     ) -> Any:
-        if self.checker is not None:
-            check_field_type(self.checker, matcher)
+        _check_instance(self.checker, self.checker_types, matcher)
 
 
 class ArgInner:
@@ -552,6 +744,8 @@ class ArgParam(Param):
     留空则会根据参数名称获取。
     """
 
+    _inline = True
+
     def __init__(
         self,
         *args,
@@ -617,6 +811,8 @@ class ExceptionParam(Param):
     为保证兼容性，本注入还会解析名为 `exception` 且没有类型注解的参数。
     """
 
+    _inline = True
+
     def __repr__(self) -> str:
         return "ExceptionParam()"
 
@@ -645,6 +841,8 @@ class DefaultParam(Param):
     本注入参数应该具有最低优先级，因此应该在所有其他注入参数之后使用。
     """
 
+    _inline = True
+
     def __repr__(self) -> str:
         return f"DefaultParam(default={self.default!r})"
 
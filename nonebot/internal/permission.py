@@ -1,16 +1,18 @@
 from contextlib import AsyncExitStack
+from functools import partial
 from typing import ClassVar, NoReturn
 from typing_extensions import Self
 
-import anyio
+from exceptiongroup import BaseExceptionGroup, catch
 
 from nonebot.dependencies import Dependent
 from nonebot.exception import SkippedException
 from nonebot.typing import T_DependencyCache, T_PermissionChecker
-from nonebot.utils import run_coro_with_catch
+from nonebot.utils import run_concurrently, run_coro_with_catch
 
 from .adapter import Bot, Event
 from .params import BotParam, DefaultParam, DependParam, EventParam, Param
+from .rule import _CheckerOrder, checker_cost
 
 
 class Permission:
@@ -20,6 +22,7 @@ class Permission:
 
     参数:
         checkers: PermissionChecker
+        short_circuit: 是否按开销依次运行检查函数，并在首个检查通过时停止
 
     用法:
         ```python
@@ -29,7 +32,7 @@ class Permission:
         ```
     """
 
-    __slots__ = ("checkers",)
+    __slots__ = ("_order", "checkers", "short_circuit")
 
     HANDLER_PARAM_TYPES: ClassVar[list[type[Param]]] = [
         DependParam,
@@ -38,7 +41,11 @@ class Permission:
         DefaultParam,
     ]
 
-    def __init__(self, *checkers: T_PermissionChecker | Dependent[bool]) -> None:
+    def __init__(
+        self,
+        *checkers: T_PermissionChecker | Dependent[bool],
+        short_circuit: bool = False,
+    ) -> None:
         self.checkers: set[Dependent[bool]] = {
             (
                 checker
@@ -50,6 +57,9 @@ class Permission:
             for checker in checkers
         }
         """存储 `PermissionChecker`"""
+        self.short_circuit = short_circuit
+        """是否启用短路求值"""
+        self._order: _CheckerOrder | None = None
 
     def __repr__(self) -> str:
         return f"Permission({', '.join(repr(checker) for checker in self.checkers)})"
@@ -71,6 +81,8 @@ class Permission:
         """
         if not self.checkers:
             return True
+        if self.short_circuit:
+            return await self._check_short_circuit(bot, event, stack, dependency_cache)
 
         result = False
 
@@ -86,12 +98,41 @@ class Permission:
             )
             result |= is_passed
 
-        async with anyio.create_task_group() as tg:
-            for checker in self.checkers:
-                tg.start_soon(_run_checker, checker)
+        await run_concurrently(
+            *(partial(_run_checker, checker) for checker in self.checkers)
+        )
 
         return result
 
+    async def _check_short_circuit(
+        self,
+        bot: Bot,
+        event: Event,
+        stack: AsyncExitStack | None = None,
+        dependency_cache: T_DependencyCache | None = None,
+    ) -> bool:
+        # checkers run sequentially instead of being cancelled on first success,
+        # so no shared dependency in the cache is left unresolved
+        if self._order is None or len(self._order) != len(self.checkers):
+            self._order = _CheckerOrder(self.checkers)
+
+        result = False
+
+        def _handle_skipped_exception(
+            exc_group: BaseExceptionGroup[SkippedException],
+        ) -> None:
+            nonlocal result
+            result = False
+
+        for checker in self._order.ordered():
+            with catch({SkippedException: _handle_skipped_exception}):
+                result = await checker(
+                    bot=bot, event=event, stack=stack, dependency_cache=dependency_cache
+                )
+            if result:
+                return True
+        return False
+
     def __and__(self, other: object) -> NoReturn:
         raise RuntimeError("And operation between Permissions is not allowed.")
 
@@ -99,19 +140,28 @@ class Permission:
         if other is None:
             return self
         elif isinstance(other, Permission):
-            return Permission(*self.checkers, *other.checkers)
+            return Permission(
+                *self.checkers,
+                *other.checkers,
+                short_circuit=self.short_circuit or other.short_circuit,
+            )
         else:
-            return Permission(*self.checkers, other)
+            return Permission(*self.checkers, other, short_circuit=self.short_circuit)
 
     def __ror__(self, other: "Permission | T_PermissionChecker | None") -> "Permission":
         if other is None:
             return self
         elif isinstance(other, Permission):
-            return Permission(*other.checkers, *self.checkers)
+            return Permission(
+                *other.checkers,
+                *self.checkers,
+                short_circuit=self.short_circuit or other.short_circuit,
+            )
         else:
-            return Permission(other, *self.checkers)
+            return Permission(other, *self.checkers, short_circuit=self.short_circuit)
 
 
+@checker_cost(0)
 class User:
     """检查当前事件是否属于指定会话。
 
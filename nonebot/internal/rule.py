@@ -1,16 +1,106 @@
+from collections.abc import Callable, Collection
 from contextlib import AsyncExitStack
-from typing import ClassVar, NoReturn
+from functools import partial
+import math
+from time import perf_counter
+from typing import Any, ClassVar, NoReturn, TypeVar
 
-import anyio
 from exceptiongroup import BaseExceptionGroup, catch
 
 from nonebot.dependencies import Dependent
 from nonebot.exception import SkippedException
 from nonebot.typing import T_DependencyCache, T_RuleChecker, T_State
+from nonebot.utils import run_concurrently
 
 from .adapter import Bot, Event
 from .params import BotParam, DefaultParam, DependParam, EventParam, Param, StateParam
 
+T = TypeVar("T")
+
+CHECKER_COST_ATTR = "__checker_cost__"
+"""检查函数预估开销的属性名"""
+
+
+def checker_cost(cost: float) -> Callable[[T], T]:
+    """声明检查函数的预估开销，单位: 秒。
+
+    启用短路求值时，检查函数按开销升序依次运行。
+    未声明开销的检查函数以运行时测得的平均耗时作为开销，
+    尚未测得耗时的检查函数排在最后。
+
+    参数:
+        cost: 预估开销
+
+    用法:
+        ```python
+        @checker_cost(0.1)
+        async def check_database(event: Event) -> bool: ...
+        ```
+    """
+
+    def _decorator(checker: T) -> T:
+        setattr(checker, CHECKER_COST_ATTR, cost)
+        return checker
+
+    return _decorator
+
+
+class _CostedChecker:
+    __slots__ = ("count", "declared", "dependent", "total")
+
+    def __init__(self, dependent: Dependent[bool]) -> None:
+        self.dependent = dependent
+        self.declared: float | None = getattr(dependent.call, CHECKER_COST_ATTR, None)
+        self.total = 0.0
+        self.count = 0
+
+    @property
+    def cost(self) -> float:
+        if self.declared is not None:
+            return self.declared
+        return self.total / self.count if self.count else math.inf
+
+    async def __call__(self, **kwargs: Any) -> bool:
+        start = perf_counter()
+        try:
+            return await self.dependent(**kwargs)
+        finally:
+            self.total += perf_counter() - start
+            self.count += 1
+
+
+class _CheckerOrder:
+    """按预估开销排序的检查函数序列"""
+
+    __slots__ = ("checkers",)
+
+    def __init__(self, checkers: Collection[Dependent[bool]]) -> None:
+        self.checkers = [_CostedChecker(checker) for checker in checkers]
+
+    def __len__(self) -> int:
+        return len(self.checkers)
+
+    def ordered(self) -> list[_CostedChecker]:
+        # return a snapshot, concurrent evaluations may reorder while iterating
+        return sorted(self.checkers, key=lambda checker: checker.cost)
+
+
+_STATELESS_PARAM_TYPES = (BotParam, EventParam, DefaultParam)
+"""不读取会话状态的参数类型"""
+
+
+def _uses_state(dependent: Dependent[Any]) -> bool:
+    for param in (
+        *(field.field_info for field in dependent.params),
+        *dependent.parameterless,
+    ):
+        if isinstance(param, DependParam):
+            if _uses_state(param.dependent):
+                return True
+        elif not isinstance(param, _STATELESS_PARAM_TYPES):
+            return True
+    return False
+
 
 class Rule:
     """{ref}`nonebot.matcher.Matcher` 规则类。
@@ -19,6 +109,7 @@ class Rule:
 
     参数:
         *checkers: RuleChecker
+        short_circuit: 是否按开销依次运行检查函数，并在首个检查失败时停止
 
     用法:
         ```python
@@ -28,7 +119,7 @@ class Rule:
         ```
     """
 
-    __slots__ = ("checkers",)
+    __slots__ = ("_order", "_uses_state", "checkers", "short_circuit")
 
     HANDLER_PARAM_TYPES: ClassVar[list[type[Param]]] = [
         DependParam,
@@ -38,7 +129,9 @@ class Rule:
         DefaultParam,
     ]
 
-    def __init__(self, *checkers: T_RuleChecker | Dependent[bool]) -> None:
+    def __init__(
+        self, *checkers: T_RuleChecker | Dependent[bool], short_circuit: bool = False
+    ) -> None:
         self.checkers: set[Dependent[bool]] = {
             (
                 checker
@@ -50,10 +143,24 @@ class Rule:
             for checker in checkers
         }
         """存储 `RuleChecker`"""
+        self.short_circuit = short_circuit
+        """是否启用短路求值"""
+        self._order: _CheckerOrder | None = None
+        self._uses_state: tuple[int, bool] | None = None
 
     def __repr__(self) -> str:
         return f"Rule({', '.join(repr(checker) for checker in self.checkers)})"
 
+    @property
+    def uses_state(self) -> bool:
+        """是否存在可能读取或修改会话状态的检查函数"""
+        if self._uses_state is None or self._uses_state[0] != len(self.checkers):
+            self._uses_state = (
+                len(self.checkers),
+                any(_uses_state(checker) for checker in self.checkers),
+            )
+        return self._uses_state[1]
+
     async def __call__(
         self,
         bot: Bot,
@@ -73,6 +180,10 @@ class Rule:
         """
         if not self.checkers:
             return True
+        if self.short_circuit:
+            return await self._check_short_circuit(
+                bot, event, state, stack, dependency_cache
+            )
 
         result = True
 
@@ -95,27 +206,67 @@ class Rule:
             result &= is_passed
 
         with catch({SkippedException: _handle_skipped_exception}):
-            async with anyio.create_task_group() as tg:
-                for checker in self.checkers:
-                    tg.start_soon(_run_checker, checker)
+            await run_concurrently(
+                *(partial(_run_checker, checker) for checker in self.checkers)
+            )
 
         return result
 
+    async def _check_short_circuit(
+        self,
+        bot: Bot,
+        event: Event,
+        state: T_State,
+        stack: AsyncExitStack | None = None,
+        dependency_cache: T_DependencyCache | None = None,
+    ) -> bool:
+        if self._order is None or len(self._order) != len(self.checkers):
+            self._order = _CheckerOrder(self.checkers)
+
+        result = True
+
+        def _handle_skipped_exception(
+            exc_group: BaseExceptionGroup[SkippedException],
+        ) -> None:
+            nonlocal result
+            result = False
+
+        for checker in self._order.ordered():
+            with catch({SkippedException: _handle_skipped_exception}):
+                result = await checker(
+                    bot=bot,
+                    event=event,
+                    state=state,
+                    stack=stack,
+                    dependency_cache=dependency_cache,
+                )
+            if not result:
+                return False
+        return True
+
     def __and__(self, other: "Rule | T_RuleChecker | None") -> "Rule":
         if other is None:
             return self
         elif isinstance(other, Rule):
-            return Rule(*self.checkers, *other.checkers)
+            return Rule(
+                *self.checkers,
+                *other.checkers,
+                short_circuit=self.short_circuit or other.short_circuit,
+            )
         else:
-            return Rule(*self.checkers, other)
+            return Rule(*self.checkers, other, short_circuit=self.short_circuit)
 
     def __rand__(self, other: "Rule | T_RuleChecker | None") -> "Rule":
         if other is None:
             return self
         elif isinstance(other, Rule):
-            return Rule(*other.checkers, *self.checkers)
+            return Rule(
+                *other.checkers,
+                *self.checkers,
+                short_circuit=self.short_circuit or other.short_circuit,
+            )
         else:
-            return Rule(other, *self.checkers)
+            return Rule(other, *self.checkers, short_circuit=self.short_circuit)
 
     def __or__(self, other: object) -> NoReturn:
         raise RuntimeError("Or operation between rules is not allowed.")
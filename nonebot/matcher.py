@@ -8,10 +8,13 @@ FrontMatter:
 """
 
 from nonebot.internal.matcher import DEFAULT_PROVIDER_CLASS as DEFAULT_PROVIDER_CLASS
+from nonebot.internal.matcher import ContinuationRegistry as ContinuationRegistry
 from nonebot.internal.matcher import Matcher as Matcher
+from nonebot.internal.matcher import MatcherContinuation as MatcherContinuation
 from nonebot.internal.matcher import MatcherManager as MatcherManager
 from nonebot.internal.matcher import MatcherProvider as MatcherProvider
 from nonebot.internal.matcher import MatcherSource as MatcherSource
+from nonebot.internal.matcher import continuations as continuations
 from nonebot.internal.matcher import current_bot as current_bot
 from nonebot.internal.matcher import current_event as current_event
 from nonebot.internal.matcher import current_handler as current_handler
@@ -24,4 +27,7 @@ __autodoc__ = {
     "MatcherManager": True,
     "MatcherProvider": True,
     "DEFAULT_PROVIDER_CLASS": True,
+    "continuations": True,
+    "MatcherContinuation": True,
+    "ContinuationRegistry": True,
 }
@@ -9,15 +9,18 @@ FrontMatter:
     description: nonebot.message 模块
 """
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterator, Sequence
 import contextlib
 from contextlib import AsyncExitStack
-from datetime import datetime
+from functools import partial
+from time import perf_counter
 from typing import TYPE_CHECKING, Any
+from weakref import WeakKeyDictionary
 
 import anyio
 from exceptiongroup import BaseExceptionGroup, catch
 
+from nonebot.consts import CMD_KEY, PREFIX_KEY
 from nonebot.dependencies import Dependent
 from nonebot.exception import (
     IgnoredException,
@@ -25,6 +28,11 @@ from nonebot.exception import (
     SkippedException,
     StopPropagation,
 )
+from nonebot.internal.matcher import (
+    MatcherContinuation,
+    continuations,
+    expire_scheduler,
+)
 from nonebot.internal.params import (
     ArgParam,
     BotParam,
@@ -49,6 +57,7 @@ from nonebot.typing import (
 from nonebot.utils import (
     escape_tag,
     flatten_exception_group,
+    run_concurrently,
     run_coro_with_catch,
     run_coro_with_shield,
 )
@@ -61,6 +70,11 @@ _event_postprocessors: set[Dependent[Any]] = set()
 _run_preprocessors: set[Dependent[Any]] = set()
 _run_postprocessors: set[Dependent[Any]] = set()
 
+_matcher_profiles: dict[str, "_MatcherProfile"] = {}
+_matcher_profile_cache: "WeakKeyDictionary[type[Matcher], _MatcherProfile]" = (
+    WeakKeyDictionary()
+)
+
 EVENT_PCS_PARAMS = (
     DependParam,
     BotParam,
@@ -133,6 +147,141 @@ def run_postprocessor(func: T_RunPostProcessor) -> T_RunPostProcessor:
     return func
 
 
+class _StageStats:
+    __slots__ = ("count", "max", "total")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, duration: float) -> None:
+        self.count += 1
+        self.total += duration
+        if duration > self.max:
+            self.max = duration
+
+    def dump(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "avg": self.total / self.count if self.count else 0.0,
+            "max": self.max,
+        }
+
+
+class _StageTimer:
+    __slots__ = ("start", "stats")
+
+    def __init__(self, stats: _StageStats) -> None:
+        self.stats = stats
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        self.start = perf_counter()
+
+    def __exit__(self, *args: object) -> None:
+        self.stats.record(perf_counter() - self.start)
+
+
+class _MatcherProfile:
+    __slots__ = (
+        "checked",
+        "hits",
+        "lineno",
+        "module_name",
+        "permission",
+        "plugin_id",
+        "rule",
+        "run",
+        "skips",
+    )
+
+    def __init__(
+        self, plugin_id: str | None, module_name: str | None, lineno: int | None
+    ) -> None:
+        self.plugin_id = plugin_id
+        self.module_name = module_name
+        self.lineno = lineno
+        self.checked = 0
+        self.hits = 0
+        self.skips = 0
+        self.permission = _StageStats()
+        self.rule = _StageStats()
+        self.run = _StageStats()
+
+    def dump(self) -> dict[str, Any]:
+        return {
+            "plugin_id": self.plugin_id,
+            "module_name": self.module_name,
+            "lineno": self.lineno,
+            "checked": self.checked,
+            "hits": self.hits,
+            "skips": self.skips,
+            "hit_rate": self.hits / self.checked if self.checked else 0.0,
+            "skip_rate": self.skips / self.checked if self.checked else 0.0,
+            "permission": self.permission.dump(),
+            "rule": self.rule.dump(),
+            "run": self.run.dump(),
+        }
+
+
+def _get_matcher_profile(Matcher: type[Matcher], bot: "Bot") -> _MatcherProfile | None:
+    if not bot.config.dispatch_profiler:
+        return None
+
+    if (profile := _matcher_profile_cache.get(Matcher)) is not None:
+        return profile
+
+    # matchers created from the same source (e.g. temp matchers) share stats
+    source = Matcher._source
+    key = (
+        f"{source.module_name}:{source.lineno}"
+        if source and source.module_name
+        else f"{Matcher!r}@{id(Matcher):#x}"
+    )
+    if (profile := _matcher_profiles.get(key)) is None:
+        profile = _matcher_profiles[key] = _MatcherProfile(
+            source.plugin_id if source else None,
+            source.module_name if source else None,
+            source.lineno if source else None,
+        )
+    _matcher_profile_cache[Matcher] = profile
+    return profile
+
+
+_null_context = contextlib.nullcontext()
+
+
+def _profile_stage(
+    profile: _MatcherProfile | None, stage: str
+) -> _StageTimer | contextlib.nullcontext[None]:
+    return _StageTimer(getattr(profile, stage)) if profile else _null_context
+
+
+def get_dispatch_stats() -> dict[str, dict[str, Any]]:
+    """获取事件响应器分发统计信息。
+
+    需要配置 `DISPATCH_PROFILER=true` 以启用统计。
+    统计信息以事件响应器定义位置 `<module_name>:<lineno>` 为键，
+    同一位置创建的事件响应器（如临时事件响应器）共享统计信息。
+    包含检查次数、命中率、跳过率以及权限检查、规则检查、运行的耗时（单位: 秒），
+    可以直接序列化为 JSON。
+
+    用法:
+        ```python
+        json.dumps(nonebot.get_dispatch_stats())
+        ```
+    """
+    return {key: profile.dump() for key, profile in _matcher_profiles.items()}
+
+
+def reset_dispatch_stats() -> None:
+    """清空事件响应器分发统计信息。"""
+    _matcher_profiles.clear()
+    _matcher_profile_cache.clear()
+
+
 def _handle_ignored_exception(
     msg: str,
 ) -> Callable[[BaseExceptionGroup[IgnoredException]], None]:
@@ -384,15 +533,18 @@ async def _check_matcher(
     返回:
         bool: 是否符合运行条件
     """
-    if Matcher.expire_time and datetime.now() > Matcher.expire_time:
+    if Matcher.expire_time and expire_scheduler.is_expired(Matcher):
         with contextlib.suppress(Exception):
             Matcher.destroy()
         return False
 
+    profile = _get_matcher_profile(Matcher, bot)
+
     try:
-        if not await Matcher.check_perm(bot, event, stack, dependency_cache):
-            logger.trace(f"Permission conditions not met for {Matcher}")
-            return False
+        with _profile_stage(profile, "permission"):
+            if not await Matcher.check_perm(bot, event, stack, dependency_cache):
+                logger.trace(f"Permission conditions not met for {Matcher}")
+                return False
     except Exception as e:
         logger.opt(colors=True, exception=e).error(
             f"<r><bg #f8bbd0>Permission check failed for {Matcher}.</bg #f8bbd0></r>"
@@ -400,9 +552,10 @@ async def _check_matcher(
         return False
 
     try:
-        if not await Matcher.check_rule(bot, event, state, stack, dependency_cache):
-            logger.trace(f"Rule conditions not met for {Matcher}")
-            return False
+        with _profile_stage(profile, "rule"):
+            if not await Matcher.check_rule(bot, event, state, stack, dependency_cache):
+                logger.trace(f"Rule conditions not met for {Matcher}")
+                return False
     except Exception as e:
         logger.opt(colors=True, exception=e).error(
             f"<r><bg #f8bbd0>Rule check failed for {Matcher}.</bg #f8bbd0></r>"
@@ -419,6 +572,7 @@ async def _run_matcher(
     state: T_State,
     stack: AsyncExitStack | None = None,
     dependency_cache: T_DependencyCache | None = None,
+    matcher: Matcher | None = None,
 ) -> None:
     """运行事件响应器。
 
@@ -431,17 +585,19 @@ async def _run_matcher(
         state: 会话状态
         stack: 异步上下文栈
         dependency_cache: 依赖缓存
+        matcher: 已创建的事件响应器实例，例如恢复的会话续体
 
     异常:
         StopPropagation: 阻止事件继续传播
     """
     logger.info(f"Event will be handled by {Matcher}")
 
-    if Matcher.temp:
-        with contextlib.suppress(Exception):
-            Matcher.destroy()
+    if matcher is None:
+        if Matcher.temp:
+            with contextlib.suppress(Exception):
+                Matcher.destroy()
 
-    matcher = Matcher()
+        matcher = Matcher()
 
     if not await _apply_run_preprocessors(
         bot=bot,
@@ -496,6 +652,30 @@ async def check_and_run_matcher(
         stack: 异步上下文栈
         dependency_cache: 依赖缓存
     """
+    await _check_and_run_matcher(
+        Matcher, bot, event, state, stack, dependency_cache, shared_state=False
+    )
+
+
+async def _check_and_run_matcher(
+    Matcher: type[Matcher],
+    bot: "Bot",
+    event: "Event",
+    state: T_State,
+    stack: AsyncExitStack | None,
+    dependency_cache: T_DependencyCache | None,
+    *,
+    shared_state: bool,
+) -> None:
+    # shared state is copied only when the matcher may write to it
+    if shared_state and Matcher.rule.uses_state:
+        state = state.copy()
+        shared_state = False
+
+    profile = _get_matcher_profile(Matcher, bot)
+    if profile:
+        profile.checked += 1
+
     if not await _check_matcher(
         Matcher=Matcher,
         bot=bot,
@@ -504,28 +684,127 @@ async def check_and_run_matcher(
         stack=stack,
         dependency_cache=dependency_cache,
     ):
+        if profile:
+            profile.skips += 1
         return
 
+    if profile:
+        profile.hits += 1
+
+    with _profile_stage(profile, "run"):
+        await _run_matcher(
+            Matcher=Matcher,
+            bot=bot,
+            event=event,
+            state=state.copy() if shared_state else state,
+            stack=stack,
+            dependency_cache=dependency_cache,
+        )
+
+
+def _iter_candidates(
+    event_type: str | None, command: tuple[str, ...] | None, session_id: str | None
+) -> Iterator[tuple[int, Sequence[type[Matcher]], Sequence[MatcherContinuation]]]:
+    """按优先级迭代候选事件响应器，会话续体与优先级 `0` 的事件响应器一同检查"""
+    pending = continuations.get_candidates(session_id) if continuations else []
+    for priority, priority_matchers in matchers.get_candidates(
+        event_type, command, session_id
+    ):
+        if pending and priority >= 0:
+            if priority == 0:
+                yield priority, priority_matchers, pending
+                pending = []
+                continue
+            yield 0, (), pending
+            pending = []
+        yield priority, priority_matchers, ()
+    if pending:
+        yield 0, (), pending
+
+
+async def check_and_resume_continuation(
+    continuation: MatcherContinuation,
+    bot: "Bot",
+    event: "Event",
+    state: T_State,
+    stack: AsyncExitStack | None = None,
+    dependency_cache: T_DependencyCache | None = None,
+) -> None:
+    """检查并恢复会话续体。
+
+    过期的会话续体将被**移除**，每个会话续体只会被恢复一次。
+
+    参数:
+        continuation: 会话续体
+        bot: Bot 对象
+        event: Event 对象
+        state: 会话状态
+        stack: 异步上下文栈
+        dependency_cache: 依赖缓存
+    """
+    await _check_and_resume_continuation(
+        continuation, bot, event, state, stack, dependency_cache, shared_state=False
+    )
+
+
+async def _check_and_resume_continuation(
+    continuation: MatcherContinuation,
+    bot: "Bot",
+    event: "Event",
+    state: T_State,
+    stack: AsyncExitStack | None,
+    dependency_cache: T_DependencyCache | None,
+    *,
+    shared_state: bool,
+) -> None:
+    if continuation.is_expired():
+        continuations.remove(continuation)
+        return
+
+    try:
+        event_type = event.get_type()
+        if event_type != (continuation.type or event_type) or not (
+            await continuation.permission(bot, event, stack, dependency_cache)
+        ):
+            logger.trace(f"Permission conditions not met for {continuation}")
+            return
+    except Exception as e:
+        logger.opt(colors=True, exception=e).error(
+            "<r><bg #f8bbd0>"
+            f"Permission check failed for {escape_tag(repr(continuation))}."
+            "</bg #f8bbd0></r>"
+        )
+        return
+
+    # another event may have resumed the continuation concurrently
+    if not continuations.remove(continuation):
+        return
+
+    # permission checks do not receive state, copy only when resuming
     await _run_matcher(
-        Matcher=Matcher,
-        bot=bot,
-        event=event,
-        state=state,
-        stack=stack,
-        dependency_cache=dependency_cache,
+        continuation.matcher,
+        bot,
+        event,
+        state.copy() if shared_state else state,
+        stack,
+        dependency_cache,
+        matcher=continuation.resume(),
     )
 
 
 async def handle_event(bot: "Bot", event: "Event") -> None:
     """处理一个事件。调用该函数以实现分发事件。
 
+    适配器应通过 {ref}`nonebot.drivers.Driver.submit_event` 提交事件，
+    以便在启用事件分发队列时使用队列处理。
+
     参数:
         bot: Bot 对象
         event: Event 对象
 
     用法:
         ```python
-        driver.task_group.start_soon(handle_event, bot, event)
+        await driver.submit_event(bot, event)
         ```
     """
     show_log = True
@@ -542,6 +821,8 @@ async def handle_event(bot: "Bot", event: "Event") -> None:
 
     # create event scope context
     async with AsyncExitStack() as stack:
+        stack.enter_context(event.accessor_cache())
+
         if not await _apply_event_preprocessors(
             bot=bot,
             event=event,
@@ -561,23 +842,67 @@ async def handle_event(bot: "Bot", event: "Event") -> None:
 
         break_flag = False
 
+        async def _check_and_run_shielded(
+            matcher: type[Matcher], matcher_state: T_State
+        ) -> None:
+            await run_coro_with_shield(
+                _check_and_run_matcher(
+                    matcher,
+                    bot,
+                    event,
+                    matcher_state,
+                    stack,
+                    dependency_cache,
+                    shared_state=True,
+                )
+            )
+
+        async def _check_and_resume_shielded(
+            continuation: MatcherContinuation, matcher_state: T_State
+        ) -> None:
+            await run_coro_with_shield(
+                _check_and_resume_continuation(
+                    continuation,
+                    bot,
+                    event,
+                    matcher_state,
+                    stack,
+                    dependency_cache,
+                    shared_state=True,
+                )
+            )
+
         def _handle_stop_propagation(exc_group: BaseExceptionGroup) -> None:
             nonlocal break_flag
 
             break_flag = True
             logger.debug("Stop event propagation")
 
+        # only matchers accepting the event type and command need to be checked
+        command = state[PREFIX_KEY][CMD_KEY] if PREFIX_KEY in state else None
+        try:
+            event_type = event.get_type()
+        except Exception as e:
+            logger.opt(colors=True, exception=e).warning(
+                "Error while getting type for event"
+            )
+            event_type = None
+        # session id is only needed to find session matchers (e.g. got, reject)
+        session_id = None
+        if matchers.has_session_matchers or continuations:
+            with contextlib.suppress(Exception):
+                session_id = event.get_session_id()
+
         # iterate through all priority until stop propagation
-        for priority in sorted(matchers.keys()):
+        for priority, priority_matchers, priority_continuations in _iter_candidates(
+            event_type, command, session_id
+        ):
             if break_flag:
                 break
 
             if show_log:
                 logger.debug(f"Checking for matchers in priority {priority}...")
 
-            if not (priority_matchers := matchers[priority]):
-                continue
-
             with catch(
                 {
                     StopPropagation: _handle_stop_propagation,
@@ -586,19 +911,17 @@ async def handle_event(bot: "Bot", event: "Event") -> None:
                     ),
                 }
             ):
-                async with anyio.create_task_group() as tg:
-                    for matcher in priority_matchers:
-                        tg.start_soon(
-                            run_coro_with_shield,
-                            check_and_run_matcher(
-                                matcher,
-                                bot,
-                                event,
-                                state.copy(),
-                                stack,
-                                dependency_cache,
-                            ),
-                        )
+                # state is copied for each candidate once it may be modified
+                await run_concurrently(
+                    *(
+                        partial(_check_and_resume_shielded, continuation, state)
+                        for continuation in priority_continuations
+                    ),
+                    *(
+                        partial(_check_and_run_shielded, matcher, state)
+                        for matcher in priority_matchers
+                    ),
+                )
 
         if show_log:
             logger.debug("Checking for matchers completed")
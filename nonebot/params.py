@@ -11,7 +11,7 @@ from collections.abc import Callable
 from re import Match
 from typing import Any, Literal, overload
 
-from nonebot.adapters import Event, Message, MessageSegment
+from nonebot.adapters import Bot, Event, Message, MessageSegment
 from nonebot.consts import (
     CMD_ARG_KEY,
     CMD_KEY,
@@ -43,6 +43,9 @@ from nonebot.internal.params import EventParam as EventParam
 from nonebot.internal.params import ExceptionParam as ExceptionParam
 from nonebot.internal.params import MatcherParam as MatcherParam
 from nonebot.internal.params import StateParam as StateParam
+from nonebot.internal.params import (
+    get_dependency_cache_statistics as get_dependency_cache_statistics,
+)
 from nonebot.matcher import Matcher
 from nonebot.typing import T_State
 
@@ -83,6 +86,33 @@ def EventToMe() -> bool:
     return Depends(_event_to_me)
 
 
+async def _event_user_id(event: Event) -> str:
+    return event.get_user_id()
+
+
+def EventUserId() -> str:
+    """{ref}`nonebot.adapters.Event` 用户 ID 参数"""
+    return Depends(_event_user_id)
+
+
+async def _event_session_id(event: Event) -> str:
+    return event.get_session_id()
+
+
+def EventSessionId() -> str:
+    """{ref}`nonebot.adapters.Event` 会话 ID 参数"""
+    return Depends(_event_session_id)
+
+
+async def _bot_self_id(bot: Bot) -> str:
+    return bot.self_id
+
+
+def BotSelfId() -> str:
+    """{ref}`nonebot.adapters.Bot` 自身 ID 参数"""
+    return Depends(_bot_self_id)
+
+
 def _command(state: T_State) -> Message:
     return state[PREFIX_KEY][CMD_KEY]
 
@@ -291,4 +321,5 @@ __autodoc__ = {
     "MatcherParam": True,
     "ExceptionParam": True,
     "ArgPromptResult": True,
+    "get_dependency_cache_statistics": True,
 }
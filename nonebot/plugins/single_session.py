@@ -8,7 +8,13 @@ from nonebot.plugin import PluginMetadata
 __plugin_meta__ = PluginMetadata(
     name="唯一会话",
     description="限制同一会话内同时只能运行一个响应器",
-    usage="加载插件后自动生效",
+    usage=(
+        "加载插件后自动生效。"
+        "如需同一会话内的事件依次处理而不被忽略，"
+        "且所用适配器通过 driver.submit_event 提交事件，"
+        "可配置 EVENT_QUEUE_SIZE 与 EVENT_QUEUE_MODE=session 代替本插件；"
+        "直接调用 handle_event 的适配器不经过事件分发队列，请继续使用本插件"
+    ),
     type="application",
     homepage="https://github.com/nonebot/nonebot2/blob/master/nonebot/plugins/single_session.py",
     config=None,
@@ -14,24 +14,33 @@ FrontMatter:
 from argparse import Action, ArgumentError
 from argparse import ArgumentParser as ArgParser
 from argparse import Namespace as Namespace
-from collections.abc import Sequence
+from collections import deque
+from collections.abc import Iterable, Sequence
 from contextvars import ContextVar
 from gettext import gettext
 from itertools import chain, product
 import re
 import shlex
+import sys
 from typing import (
     IO,
     TYPE_CHECKING,
+    Any,
     NamedTuple,
     TypedDict,
     TypeVar,
     cast,
     overload,
 )
+import weakref
 
 from pygtrie import CharTrie
 
+if sys.version_info >= (3, 11):
+    from re import _parser as sre_parse
+else:  # pragma: py-lt-311
+    import sre_parse
+
 from nonebot import get_driver
 from nonebot.adapters import Bot, Event, Message, MessageSegment
 from nonebot.consts import (
@@ -51,8 +60,14 @@ from nonebot.consts import (
 )
 from nonebot.exception import ParserExit
 from nonebot.internal.rule import Rule as Rule
+from nonebot.internal.rule import checker_cost as checker_cost
 from nonebot.log import logger
-from nonebot.params import Command, CommandArg, CommandWhitespace, EventToMe
+from nonebot.params import (
+    Command,
+    CommandArg,
+    CommandWhitespace,
+    EventToMe,
+)
 from nonebot.typing import T_State
 
 T = TypeVar("T")
@@ -135,6 +150,338 @@ class TrieRule:
         return prefix
 
 
+class _AhoCorasick:
+    """多模式字符串匹配自动机"""
+
+    __slots__ = ("fail", "goto", "output")
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self.goto: list[dict[str, int]] = [{}]
+        self.fail: list[int] = [0]
+        self.output: list[tuple[str, ...]] = [()]
+
+        for pattern in patterns:
+            state = 0
+            for char in pattern:
+                if (next_state := self.goto[state].get(char)) is None:
+                    next_state = self.goto[state][char] = len(self.goto)
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(())
+                state = next_state
+            self.output[state] += (pattern,)
+
+        # breadth-first build failure links and merge outputs
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fail = self.fail[state]
+                while fail and char not in self.goto[fail]:
+                    fail = self.fail[fail]
+                self.fail[next_state] = self.goto[fail].get(char, 0)
+                self.output[next_state] += self.output[self.fail[next_state]]
+
+    def search(self, text: str) -> set[str]:
+        """返回文本中出现的所有模式"""
+        goto, fail, output = self.goto, self.fail, self.output
+        found: set[str] = set(output[0])
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found.update(output[state])
+        return found
+
+
+def _build_trie(patterns: Iterable[str], reverse: bool = False) -> dict[str, Any]:
+    trie: dict[str, Any] = {}
+    for pattern in patterns:
+        node = trie
+        for char in reversed(pattern) if reverse else pattern:
+            node = node.setdefault(char, {})
+        # empty key marks the end of a pattern since chars are never empty
+        node[""] = pattern
+    return trie
+
+
+def _walk_trie(trie: dict[str, Any], chars: Iterable[str]) -> set[str]:
+    found: set[str] = set()
+    node = trie
+    if "" in node:
+        found.add(node[""])
+    for char in chars:
+        if (node := node.get(char)) is None:
+            break
+        if "" in node:
+            found.add(node[""])
+    return found
+
+
+_SCAN_CACHE_SIZE = 64
+"""每个索引缓存的最近扫描结果数量"""
+
+
+class _PatternRegistry:
+    """按规则实例引用计数的模式字符串集合
+
+    规则实例被回收后，其独有的模式字符串将在下次重建索引时移除。
+    """
+
+    __slots__ = ("_built", "_counts")
+
+    def __init__(self) -> None:
+        self._counts: dict[str, int] = {}
+        self._built: frozenset[str] = frozenset()
+
+    def add(self, owner: object, patterns: Iterable[str]) -> bool:
+        """添加规则实例的模式字符串，返回索引是否需要重建"""
+        unique = tuple(set(patterns))
+        for pattern in unique:
+            self._counts[pattern] = self._counts.get(pattern, 0) + 1
+        weakref.finalize(owner, self._release, unique)
+        return not self._built.issuperset(unique)
+
+    def _release(self, patterns: tuple[str, ...]) -> None:
+        for pattern in patterns:
+            if count := self._counts[pattern] - 1:
+                self._counts[pattern] = count
+            else:
+                del self._counts[pattern]
+
+    @property
+    def stale(self) -> bool:
+        """已回收规则的模式字符串是否占据了索引的大部分"""
+        return len(self._built) > max(2 * len(self._counts), 32)
+
+    def build(self) -> frozenset[str]:
+        """获取当前所有模式字符串并标记为已构建"""
+        self._built = frozenset(self._counts)
+        return self._built
+
+
+class _TextScan:
+    """单个事件的消息纯文本扫描结果"""
+
+    __slots__ = (
+        "generation",
+        "keywords",
+        "prefixes",
+        "suffixes",
+        "suffixes_before_newline",
+        "text",
+    )
+
+    def __init__(
+        self,
+        text: str,
+        generation: int,
+        prefixes: set[str],
+        suffixes: set[str],
+        suffixes_before_newline: set[str],
+        keywords: set[str],
+    ) -> None:
+        self.text = text
+        self.generation = generation
+        self.prefixes = prefixes
+        self.suffixes = suffixes
+        self.suffixes_before_newline = suffixes_before_newline
+        self.keywords = keywords
+
+
+class _TextIndex:
+    """所有文本规则的共享索引
+
+    汇总所有区分大小写的 startswith、endswith 与 keyword 规则的字符串，
+    每个事件仅需扫描一次消息纯文本即可得到所有规则的匹配结果。
+    新增规则后索引在下次扫描时惰性重建，最近的扫描结果按文本缓存。
+    """
+
+    __slots__ = (
+        "_built",
+        "_keyword_automaton",
+        "_keywords",
+        "_prefix_trie",
+        "_prefixes",
+        "_scans",
+        "_suffix_trie",
+        "_suffixes",
+        "generation",
+    )
+
+    def __init__(self) -> None:
+        self.generation = 0
+        self._built = -1
+        self._prefixes = _PatternRegistry()
+        self._suffixes = _PatternRegistry()
+        self._keywords = _PatternRegistry()
+        self._prefix_trie: dict[str, Any] = {}
+        self._suffix_trie: dict[str, Any] = {}
+        self._keyword_automaton = _AhoCorasick(())
+        self._scans: dict[str, _TextScan] = {}
+
+    def _add(
+        self, registry: _PatternRegistry, owner: object, patterns: Iterable[str]
+    ) -> int:
+        if registry.add(owner, patterns):
+            self.generation += 1
+        return self.generation
+
+    def add_prefixes(self, owner: object, prefixes: Iterable[str]) -> int:
+        return self._add(self._prefixes, owner, prefixes)
+
+    def add_suffixes(self, owner: object, suffixes: Iterable[str]) -> int:
+        return self._add(self._suffixes, owner, suffixes)
+
+    def add_keywords(self, owner: object, keywords: Iterable[str]) -> int:
+        return self._add(self._keywords, owner, keywords)
+
+    def scan(self, text: str) -> _TextScan:
+        if (
+            self._built != self.generation
+            or self._prefixes.stale
+            or self._suffixes.stale
+            or self._keywords.stale
+        ):
+            self._prefix_trie = _build_trie(self._prefixes.build())
+            self._suffix_trie = _build_trie(self._suffixes.build(), reverse=True)
+            self._keyword_automaton = _AhoCorasick(self._keywords.build())
+            self._built = self.generation
+            self._scans.clear()
+
+        if (scan := self._scans.get(text)) is not None:
+            return scan
+        if len(self._scans) >= _SCAN_CACHE_SIZE:
+            del self._scans[next(iter(self._scans))]
+        scan = self._scans[text] = _TextScan(
+            text,
+            self._built,
+            _walk_trie(self._prefix_trie, text),
+            _walk_trie(self._suffix_trie, reversed(text)),
+            # regex `$` also matches before a trailing newline
+            (
+                _walk_trie(self._suffix_trie, reversed(text[:-1]))
+                if text.endswith("\n")
+                else set()
+            ),
+            self._keyword_automaton.search(text),
+        )
+        return scan
+
+
+_text_index = _TextIndex()
+
+
+def _scan_text(event: Event) -> _TextScan | None:
+    try:
+        text = event.get_plaintext()
+    except Exception:
+        return None
+    return _text_index.scan(text)
+
+
+def _required_literals(
+    items: "sre_parse.SubPattern | list[Any]",
+) -> frozenset[str] | None:
+    """获取正则表达式匹配时必然出现的字符串集合，至少其中之一会出现在文本中
+
+    无法确定时返回 `None`。
+    """
+    requirements: list[frozenset[str]] = []
+    run: list[str] = []
+
+    def _end_run() -> None:
+        if run:
+            requirements.append(frozenset(("".join(run),)))
+            run.clear()
+
+    for op, av in items:
+        if op is sre_parse.LITERAL:
+            run.append(chr(av))
+            continue
+        _end_run()
+        required: frozenset[str] | None = None
+        if op is sre_parse.SUBPATTERN:
+            _, add_flags, _, sub = av
+            if not add_flags & re.IGNORECASE:
+                required = _required_literals(sub)
+        elif op is sre_parse.BRANCH:
+            branches = [_required_literals(branch) for branch in av[1]]
+            if all(branch is not None for branch in branches):
+                required = frozenset().union(*cast(list[frozenset[str]], branches))
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT) and av[0] >= 1:
+            required = _required_literals(av[2])
+        if required:
+            requirements.append(required)
+    _end_run()
+
+    # prefer the requirement whose shortest string is the longest
+    return max(requirements, key=lambda literals: min(map(len, literals)), default=None)
+
+
+class _MessageScan:
+    """单个事件的消息字符串扫描结果"""
+
+    __slots__ = ("generation", "literals", "text")
+
+    def __init__(self, text: str, generation: int, literals: set[str]) -> None:
+        self.text = text
+        self.generation = generation
+        self.literals = literals
+
+
+class _RegexIndex:
+    """所有正则规则必需字符串的共享索引
+
+    每个事件仅需扫描一次消息字符串，
+    即可排除所有必需字符串未出现的正则规则。
+    """
+
+    __slots__ = ("_automaton", "_built", "_literals", "_scans", "generation")
+
+    def __init__(self) -> None:
+        self.generation = 0
+        self._built = -1
+        self._literals = _PatternRegistry()
+        self._automaton = _AhoCorasick(())
+        self._scans: dict[str, _MessageScan] = {}
+
+    def add_literals(self, owner: object, literals: Iterable[str]) -> int:
+        if self._literals.add(owner, literals):
+            self.generation += 1
+        return self.generation
+
+    def scan(self, text: str) -> _MessageScan:
+        if self._built != self.generation or self._literals.stale:
+            self._automaton = _AhoCorasick(self._literals.build())
+            self._built = self.generation
+            self._scans.clear()
+
+        if (scan := self._scans.get(text)) is not None:
+            return scan
+        if len(self._scans) >= _SCAN_CACHE_SIZE:
+            del self._scans[next(iter(self._scans))]
+        scan = self._scans[text] = _MessageScan(
+            text, self._built, self._automaton.search(text)
+        )
+        return scan
+
+
+_regex_index = _RegexIndex()
+
+
+def _scan_message(event: Event) -> _MessageScan | None:
+    try:
+        msg = event.get_message()
+    except Exception:
+        return None
+    return _regex_index.scan(str(msg))
+
+
+@checker_cost(0)
 class StartswithRule:
     """检查消息纯文本是否以指定字符串开头。
 
@@ -143,11 +490,16 @@ class StartswithRule:
         ignorecase: 是否忽略大小写
     """
 
-    __slots__ = ("ignorecase", "msg")
+    __slots__ = ("__weakref__", "_generation", "_pattern", "ignorecase", "msg")
 
     def __init__(self, msg: tuple[str, ...], ignorecase: bool = False):
         self.msg = msg
         self.ignorecase = ignorecase
+        self._pattern = re.compile(
+            f"^(?:{'|'.join(re.escape(prefix) for prefix in msg)})",
+            re.IGNORECASE if ignorecase else 0,
+        )
+        self._generation = 0 if ignorecase else _text_index.add_prefixes(self, msg)
 
     def __repr__(self) -> str:
         return f"Startswith(msg={self.msg}, ignorecase={self.ignorecase})"
@@ -163,16 +515,21 @@ class StartswithRule:
         return hash((frozenset(self.msg), self.ignorecase))
 
     async def __call__(self, event: Event, state: T_State) -> bool:
-        try:
-            text = event.get_plaintext()
-        except Exception:
+        scan = _scan_text(event)
+        if scan is None:
             return False
-        if match := re.match(
-            f"^(?:{'|'.join(re.escape(prefix) for prefix in self.msg)})",
-            text,
-            re.IGNORECASE if self.ignorecase else 0,
-        ):
-            state[STARTSWITH_KEY] = match.group()
+        if self.ignorecase or scan.generation < self._generation:
+            if match := self._pattern.match(scan.text):
+                state[STARTSWITH_KEY] = match.group()
+                return True
+            return False
+        # regex alternation prefers the first matched prefix in order
+        if (
+            prefix := next(
+                (prefix for prefix in self.msg if prefix in scan.prefixes), None
+            )
+        ) is not None:
+            state[STARTSWITH_KEY] = prefix
             return True
         return False
 
@@ -190,6 +547,7 @@ def startswith(msg: str | tuple[str, ...], ignorecase: bool = False) -> Rule:
     return Rule(StartswithRule(msg, ignorecase))
 
 
+@checker_cost(0)
 class EndswithRule:
     """检查消息纯文本是否以指定字符串结尾。
 
@@ -198,11 +556,16 @@ class EndswithRule:
         ignorecase: 是否忽略大小写
     """
 
-    __slots__ = ("ignorecase", "msg")
+    __slots__ = ("__weakref__", "_generation", "_pattern", "ignorecase", "msg")
 
     def __init__(self, msg: tuple[str, ...], ignorecase: bool = False):
         self.msg = msg
         self.ignorecase = ignorecase
+        self._pattern = re.compile(
+            f"(?:{'|'.join(re.escape(suffix) for suffix in msg)})$",
+            re.IGNORECASE if ignorecase else 0,
+        )
+        self._generation = 0 if ignorecase else _text_index.add_suffixes(self, msg)
 
     def __repr__(self) -> str:
         return f"Endswith(msg={self.msg}, ignorecase={self.ignorecase})"
@@ -218,16 +581,27 @@ class EndswithRule:
         return hash((frozenset(self.msg), self.ignorecase))
 
     async def __call__(self, event: Event, state: T_State) -> bool:
-        try:
-            text = event.get_plaintext()
-        except Exception:
+        scan = _scan_text(event)
+        if scan is None:
             return False
-        if match := re.search(
-            f"(?:{'|'.join(re.escape(suffix) for suffix in self.msg)})$",
-            text,
-            re.IGNORECASE if self.ignorecase else 0,
-        ):
-            state[ENDSWITH_KEY] = match.group()
+        if self.ignorecase or scan.generation < self._generation:
+            if match := self._pattern.search(scan.text):
+                state[ENDSWITH_KEY] = match.group()
+                return True
+            return False
+        # regex search prefers the leftmost match, then the first suffix in order
+        length = len(scan.text)
+        candidates = [
+            (length - len(suffix), index, suffix)
+            for index, suffix in enumerate(self.msg)
+            if suffix in scan.suffixes
+        ] + [
+            (length - 1 - len(suffix), index, suffix)
+            for index, suffix in enumerate(self.msg)
+            if suffix in scan.suffixes_before_newline
+        ]
+        if candidates:
+            state[ENDSWITH_KEY] = min(candidates)[2]
             return True
         return False
 
@@ -245,6 +619,7 @@ def endswith(msg: str | tuple[str, ...], ignorecase: bool = False) -> Rule:
     return Rule(EndswithRule(msg, ignorecase))
 
 
+@checker_cost(0)
 class FullmatchRule:
     """检查消息纯文本是否与指定字符串全匹配。
 
@@ -273,13 +648,10 @@ class FullmatchRule:
         return hash((frozenset(self.msg), self.ignorecase))
 
     async def __call__(self, event: Event, state: T_State) -> bool:
-        try:
-            text = event.get_plaintext()
-        except Exception:
+        scan = _scan_text(event)
+        if scan is None or not scan.text:
             return False
-        if not text:
-            return False
-        text = text.casefold() if self.ignorecase else text
+        text = scan.text.casefold() if self.ignorecase else scan.text
         if text in self.msg:
             state[FULLMATCH_KEY] = text
             return True
@@ -299,6 +671,7 @@ def fullmatch(msg: str | tuple[str, ...], ignorecase: bool = False) -> Rule:
     return Rule(FullmatchRule(msg, ignorecase))
 
 
+@checker_cost(0)
 class KeywordsRule:
     """检查消息纯文本是否包含指定关键字。
 
@@ -306,10 +679,11 @@ class KeywordsRule:
         keywords: 指定关键字元组
     """
 
-    __slots__ = ("keywords",)
+    __slots__ = ("__weakref__", "_generation", "keywords")
 
     def __init__(self, *keywords: str):
         self.keywords = keywords
+        self._generation = _text_index.add_keywords(self, keywords)
 
     def __repr__(self) -> str:
         return f"Keywords(keywords={self.keywords})"
@@ -323,13 +697,15 @@ class KeywordsRule:
         return hash(frozenset(self.keywords))
 
     async def __call__(self, event: Event, state: T_State) -> bool:
-        try:
-            text = event.get_plaintext()
-        except Exception:
-            return False
-        if not text:
+        scan = _scan_text(event)
+        if scan is None or not scan.text:
             return False
-        if key := next((k for k in self.keywords if k in text), None):
+        found = (
+            scan.keywords
+            if scan.generation >= self._generation
+            else {k for k in self.keywords if k in scan.text}
+        )
+        if key := next((k for k in self.keywords if k in found), None):
             state[KEYWORD_KEY] = key
             return True
         return False
@@ -345,6 +721,7 @@ def keyword(*keywords: str) -> Rule:
     return Rule(KeywordsRule(*keywords))
 
 
+@checker_cost(0)
 class CommandRule:
     """检查消息是否为指定命令。
 
@@ -662,11 +1039,29 @@ class RegexRule:
         flags: 正则表达式标记
     """
 
-    __slots__ = ("flags", "regex")
+    __slots__ = (
+        "__weakref__",
+        "_generation",
+        "_literals",
+        "_pattern",
+        "flags",
+        "regex",
+    )
 
     def __init__(self, regex: str, flags: int = 0):
         self.regex = regex
         self.flags = flags
+        self._pattern = re.compile(regex, flags)
+
+        self._literals: frozenset[str] | None = None
+        if not self._pattern.flags & re.IGNORECASE:
+            try:
+                self._literals = _required_literals(sre_parse.parse(regex, flags))
+            except Exception:  # pragma: no cover
+                self._literals = None
+        self._generation = (
+            _regex_index.add_literals(self, self._literals) if self._literals else 0
+        )
 
     def __repr__(self) -> str:
         return f"Regex(regex={self.regex!r}, flags={self.flags})"
@@ -682,11 +1077,17 @@ class RegexRule:
         return hash((self.regex, self.flags))
 
     async def __call__(self, event: Event, state: T_State) -> bool:
-        try:
-            msg = event.get_message()
-        except Exception:
+        scan = _scan_message(event)
+        if scan is None:
+            return False
+        # skip the regex search if none of the required strings appears
+        if (
+            self._literals
+            and scan.generation >= self._generation
+            and self._literals.isdisjoint(scan.literals)
+        ):
             return False
-        if matched := re.search(self.regex, str(msg), self.flags):
+        if matched := self._pattern.search(scan.text):
             state[REGEX_MATCHED] = matched
             return True
         else:
@@ -717,6 +1118,7 @@ def regex(regex: str, flags: int | re.RegexFlag = 0) -> Rule:
     return Rule(RegexRule(regex, flags))
 
 
+@checker_cost(0)
 class ToMeRule:
     """检查事件是否与机器人有关。"""
 
@@ -741,6 +1143,7 @@ def to_me() -> Rule:
     return Rule(ToMeRule())
 
 
+@checker_cost(0)
 class IsTypeRule:
     """检查事件类型是否为指定类型。"""
 
@@ -775,6 +1178,7 @@ def is_type(*types: type[Event]) -> Rule:
 __autodoc__ = {
     "Rule": True,
     "Rule.__call__": True,
+    "checker_cost": True,
     "TrieRule": False,
     "ArgumentParser.exit": False,
     "ArgumentParser.parse_args": False,
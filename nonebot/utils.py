@@ -7,25 +7,31 @@ FrontMatter:
     description: nonebot.utils 模块
 """
 
-from collections import deque
+from collections import OrderedDict, deque
 from collections.abc import (
     AsyncGenerator,
+    Awaitable,
     Callable,
     Coroutine,
     Generator,
     Mapping,
     Sequence,
 )
+from concurrent.futures import ProcessPoolExecutor
 import contextlib
 from contextlib import AbstractContextManager, asynccontextmanager
 import dataclasses
 from enum import Enum
-from functools import partial, wraps
+from functools import wraps
 import importlib
 import inspect
 import json
+import math
+import os
 from pathlib import Path
+import pickle
 import re
+from time import monotonic, perf_counter
 from typing import (
     Any,
     Final,
@@ -41,6 +47,7 @@ from typing import (
 from typing_extensions import ParamSpec, override
 
 import anyio
+from anyio.lowlevel import RunVar
 import anyio.to_thread
 from exceptiongroup import BaseExceptionGroup, catch
 from pydantic import BaseModel
@@ -245,35 +252,374 @@ def is_async_gen_callable(call: Callable[..., Any]) -> bool:
     return inspect.isasyncgenfunction(func_)
 
 
-def run_sync(call: Callable[P, R]) -> Callable[P, Coroutine[None, None, R]]:
+DEFAULT_EXECUTOR: Final = "default"
+"""默认同步函数执行器名称"""
+PROCESS_EXECUTOR: Final = "process"
+"""进程池执行器名称"""
+EXECUTOR_ATTR: Final = "__nonebot_executor__"
+"""同步函数指定执行器的属性名"""
+
+
+@dataclasses.dataclass(frozen=True)
+class ExecutorStatistics:
+    """同步函数执行器统计信息"""
+
+    name: str
+    """执行器名称"""
+    max_workers: int | None
+    """最大并发线程数或进程数
+
+    `0` 表示在事件循环中直接运行，`None` 表示使用默认限制。
+    """
+    running: int
+    """正在运行的同步函数数量"""
+    waiting: int
+    """等待空闲线程的同步函数数量"""
+    submitted: int
+    """已提交的同步函数数量"""
+    completed: int
+    """已完成的同步函数数量"""
+    wait_time_total: float
+    """同步函数等待空闲线程的总时间，单位: 秒"""
+    run_time_total: float
+    """同步函数运行的总时间，单位: 秒"""
+
+
+class SyncExecutor:
+    """同步函数执行器。
+
+    每个执行器拥有独立的线程数限制，避免慢速同步函数占满线程影响其他插件。
+
+    参数:
+        name: 执行器名称
+        max_workers: 最大并发线程数，为 `0` 时在事件循环中直接运行，
+            为 `None` 时使用 anyio 默认线程限制
+    """
+
+    def __init__(self, name: str, max_workers: int | None = None) -> None:
+        if max_workers is not None and max_workers < 0:
+            raise ValueError("Executor max workers must not be negative")
+
+        self.name = name
+        self.max_workers = max_workers
+        # limiter is bound to the event loop, create one for each run
+        self._limiter: RunVar[anyio.CapacityLimiter] = RunVar(f"executor_{name}")
+
+        self._running = 0
+        self._submitted = 0
+        self._completed = 0
+        self._wait_time_total = 0.0
+        self._run_time_total = 0.0
+
+    def __repr__(self) -> str:
+        return f"SyncExecutor(name={self.name!r}, max_workers={self.max_workers})"
+
+    @property
+    def inline(self) -> bool:
+        """是否在事件循环中直接运行"""
+        return self.max_workers == 0
+
+    def _get_limiter(self) -> anyio.CapacityLimiter | None:
+        if self.max_workers is None:
+            return None
+        try:
+            return self._limiter.get()
+        except LookupError:
+            limiter = anyio.CapacityLimiter(self.max_workers)
+            self._limiter.set(limiter)
+            return limiter
+
+    async def run(self, call: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
+        """在执行器中运行同步函数
+
+        参数:
+            call: 同步函数
+            args: 位置参数
+            kwargs: 关键字参数
+        """
+        self._submitted += 1
+        submitted_at = perf_counter()
+        started_at = submitted_at
+
+        def _run() -> R:
+            nonlocal started_at
+            started_at = perf_counter()
+            return call(*args, **kwargs)
+
+        try:
+            if self.inline:
+                return _run()
+            self._running += 1
+            try:
+                return await anyio.to_thread.run_sync(
+                    _run, abandon_on_cancel=True, limiter=self._get_limiter()
+                )
+            finally:
+                self._running -= 1
+        finally:
+            finished_at = perf_counter()
+            self._completed += 1
+            self._wait_time_total += started_at - submitted_at
+            self._run_time_total += finished_at - started_at
+
+    def statistics(self) -> ExecutorStatistics:
+        """获取执行器统计信息"""
+        waiting = 0
+        with contextlib.suppress(Exception):
+            limiter = (
+                self._get_limiter() or anyio.to_thread.current_default_thread_limiter()
+            )
+            waiting = limiter.statistics().tasks_waiting
+        return ExecutorStatistics(
+            name=self.name,
+            max_workers=self.max_workers,
+            running=max(self._running - waiting, 0),
+            waiting=waiting,
+            submitted=self._submitted,
+            completed=self._completed,
+            wait_time_total=self._wait_time_total,
+            run_time_total=self._run_time_total,
+        )
+
+
+def _run_pickled(payload: bytes) -> Any:
+    call, args, kwargs = pickle.loads(payload)
+    return call(*args, **kwargs)
+
+
+def _submit_pickled(pool: ProcessPoolExecutor, payload: bytes) -> Any:
+    return pool.submit(_run_pickled, payload).result()
+
+
+def _warmup() -> int:
+    return os.getpid()
+
+
+class ProcessExecutor(SyncExecutor):
+    """进程池执行器。
+
+    在独立进程中运行 CPU 密集型同步函数，不受 GIL 限制。
+    函数及其参数、返回值必须可以被 pickle，
+    可以使用 {ref}`nonebot.params.EventPlainText` 等依赖提取事件中的数据。
+
+    进程池由驱动器生命周期管理：启动时预热配置的工作进程，关闭时清理进程池。
+    未在驱动器生命周期中启动时，将在首次使用时创建进程池。
+
+    参数:
+        name: 执行器名称
+        max_workers: 最大工作进程数，为 `None` 时使用 CPU 核心数
+    """
+
+    def __init__(self, name: str, max_workers: int | None = None) -> None:
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError("Process executor max workers must be positive")
+
+        super().__init__(name, max_workers or os.cpu_count() or 1)
+        self.warmup = max_workers is not None
+        """是否在驱动器启动时预热工作进程"""
+        self._pool: ProcessPoolExecutor | None = None
+
+    @override
+    def __repr__(self) -> str:
+        return f"ProcessExecutor(name={self.name!r}, max_workers={self.max_workers})"
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(self.max_workers)
+        return self._pool
+
+    async def start(self) -> None:
+        """创建进程池并预热所有工作进程"""
+        pool = self._get_pool()
+        futures = [pool.submit(_warmup) for _ in range(self.max_workers or 1)]
+        await anyio.to_thread.run_sync(lambda: [f.result() for f in futures])
+
+    def close(self, wait: bool = True) -> None:
+        """关闭进程池，取消尚未开始的任务
+
+        参数:
+            wait: 是否等待正在运行的任务完成
+        """
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+    async def shutdown(self) -> None:
+        """关闭进程池并等待工作进程退出"""
+        await anyio.to_thread.run_sync(self.close)
+
+    @override
+    async def run(self, call: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
+        try:
+            payload = pickle.dumps((call, args, kwargs))
+        except Exception as e:
+            raise TypeError(
+                f"Cannot send {get_name(call)} to process executor {self.name!r}, "
+                "function and arguments must be picklable"
+            ) from e
+        return await super().run(_submit_pickled, self._get_pool(), payload)
+
+
+_executors: dict[str, SyncExecutor] = {
+    DEFAULT_EXECUTOR: SyncExecutor(DEFAULT_EXECUTOR),
+    PROCESS_EXECUTOR: ProcessExecutor(PROCESS_EXECUTOR),
+}
+_module_executors: dict[str, str] = {}
+_BUILTIN_EXECUTORS: Final = {DEFAULT_EXECUTOR, PROCESS_EXECUTOR}
+
+
+def set_executors(executors: Mapping[str, int]) -> None:
+    """设置同步函数执行器。
+
+    名称为 `default` 的执行器将作为默认执行器，未设置时使用 anyio 默认线程限制；
+    名称为 `process` 的执行器为进程池执行器，值为最大工作进程数；
+    与插件名称相同的执行器将用于该插件中未指定执行器的同步函数。
+
+    参数:
+        executors: 执行器名称与最大并发线程数，为 `0` 时在事件循环中直接运行
+    """
+    for executor in _executors.values():
+        if isinstance(executor, ProcessExecutor):
+            executor.close(wait=False)
+
+    _executors.clear()
+    _executors[DEFAULT_EXECUTOR] = SyncExecutor(DEFAULT_EXECUTOR)
+    _executors[PROCESS_EXECUTOR] = ProcessExecutor(
+        PROCESS_EXECUTOR, executors.get(PROCESS_EXECUTOR)
+    )
+    for name, max_workers in executors.items():
+        if name != PROCESS_EXECUTOR:
+            _executors[name] = SyncExecutor(name, max_workers)
+    _module_executors.clear()
+
+
+async def start_executors() -> None:
+    """预热配置了工作进程数的进程池执行器，由驱动器启动时调用"""
+    for executor in _executors.values():
+        if isinstance(executor, ProcessExecutor) and executor.warmup:
+            await executor.start()
+
+
+async def shutdown_executors() -> None:
+    """关闭所有进程池执行器，由驱动器关闭时调用"""
+    for executor in _executors.values():
+        if isinstance(executor, ProcessExecutor):
+            await executor.shutdown()
+
+
+def get_executor(name: str | None = None) -> SyncExecutor:
+    """获取同步函数执行器，不存在时返回默认执行器
+
+    参数:
+        name: 执行器名称
+    """
+    return _executors.get(name or DEFAULT_EXECUTOR) or _executors[DEFAULT_EXECUTOR]
+
+
+def get_executor_statistics() -> dict[str, ExecutorStatistics]:
+    """获取所有同步函数执行器的统计信息"""
+    return {name: executor.statistics() for name, executor in _executors.items()}
+
+
+def sync_executor(name: str) -> Callable[[T], T]:
+    """指定同步函数使用的执行器。
+
+    参数:
+        name: 执行器名称
+
+    用法:
+        ```python
+        @matcher.handle()
+        @sync_executor("image")
+        def render(): ...
+        ```
+    """
+
+    def _decorator(call: T) -> T:
+        setattr(call, EXECUTOR_ATTR, name)
+        return call
+
+    return _decorator
+
+
+def run_in_process(call: T) -> T:
+    """指定同步函数在进程池执行器中运行。
+
+    函数必须定义在模块顶层，其参数与返回值必须可以被 pickle。
+
+    用法:
+        ```python
+        @matcher.handle()
+        @run_in_process
+        def render(text: str = EventPlainText()) -> bytes: ...
+        ```
+    """
+    return sync_executor(PROCESS_EXECUTOR)(call)
+
+
+def resolve_executor(call: Callable[..., Any], executor: str | None = None) -> str:
+    """获取同步函数使用的执行器名称。
+
+    依次使用指定的执行器、`sync_executor` 指定的执行器、
+    与插件名称相同的执行器以及默认执行器。
+
+    参数:
+        call: 同步函数
+        executor: 指定的执行器名称
+    """
+    if executor is not None:
+        return executor
+    if (name := getattr(call, EXECUTOR_ATTR, None)) is not None:
+        return name
+
+    module_name = getattr(call, "__module__", None)
+    if not isinstance(module_name, str) or _executors.keys() <= _BUILTIN_EXECUTORS:
+        return DEFAULT_EXECUTOR
+    if (name := _module_executors.get(module_name)) is None:
+        from nonebot.plugin import get_plugin_by_module_name
+
+        plugin = get_plugin_by_module_name(module_name)
+        name = _module_executors[module_name] = (
+            plugin.id_
+            if plugin is not None and plugin.id_ in _executors
+            else DEFAULT_EXECUTOR
+        )
+    return name
+
+
+def run_sync(
+    call: Callable[P, R], *, executor: str | None = None
+) -> Callable[P, Coroutine[None, None, R]]:
     """一个用于包装 sync function 为 async function 的装饰器
 
     参数:
         call: 被装饰的同步函数
+        executor: 运行同步函数的执行器名称，
+            未指定时参考 {ref}`nonebot.utils.resolve_executor`
     """
 
+    name = resolve_executor(call, executor)
+
     @wraps(call)
     async def _wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-        return await anyio.to_thread.run_sync(
-            partial(call, *args, **kwargs), abandon_on_cancel=True
-        )
+        return await get_executor(name).run(call, *args, **kwargs)
 
     return _wrapper
 
 
 @asynccontextmanager
 async def run_sync_ctx_manager(
-    cm: AbstractContextManager[T],
+    cm: AbstractContextManager[T], *, executor: str | None = None
 ) -> AsyncGenerator[T, None]:
     """一个用于包装 sync context manager 为 async context manager 的执行函数"""
     try:
-        yield await run_sync(cm.__enter__)()
+        yield await run_sync(cm.__enter__, executor=executor)()
     except Exception as e:
-        ok = await run_sync(cm.__exit__)(type(e), e, None)
+        ok = await run_sync(cm.__exit__, executor=executor)(type(e), e, None)
         if not ok:
             raise e
     else:
-        await run_sync(cm.__exit__)(None, None, None)
+        await run_sync(cm.__exit__, executor=executor)(None, None, None)
 
 
 @overload
@@ -330,6 +676,195 @@ async def run_coro_with_shield(coro: Coroutine[Any, Any, T]) -> T:
     raise RuntimeError("This should not happen")
 
 
+_inline_single_task: bool = False
+
+
+def set_inline_single_task(enabled: bool) -> None:
+    """设置 {ref}`nonebot.utils.run_concurrently` 是否内联运行单个任务。
+
+    参数:
+        enabled: 是否启用
+    """
+    global _inline_single_task
+    _inline_single_task = enabled
+
+
+async def run_concurrently(
+    *funcs: Callable[[], Awaitable[Any]],
+    cheap_funcs: Sequence[Callable[[], Awaitable[Any]]] = (),
+) -> None:
+    """在任务组中并发运行多个异步函数。
+
+    启用单任务内联时，`cheap_funcs` 将依次直接在当前任务中等待；
+    若 `funcs` 仅有一个函数，也将直接在当前任务中等待，以避免创建任务组的开销。
+    此时函数将与调用方共享上下文变量，
+    抛出的异常仍会包装为 `BaseExceptionGroup` 以与任务组行为保持一致。
+
+    参数:
+        funcs: 要运行的异步函数
+        cheap_funcs: 不涉及异步等待、可以依次直接运行的异步函数
+    """
+    if _inline_single_task:
+        if len(funcs) == 1:
+            cheap_funcs, funcs = (*cheap_funcs, *funcs), ()
+        if cheap_funcs:
+            await _run_inline(*cheap_funcs)
+    else:
+        funcs = (*cheap_funcs, *funcs)
+
+    if not funcs:
+        return
+
+    async with anyio.create_task_group() as tg:
+        for func in funcs:
+            tg.start_soon(func)
+
+
+async def _run_inline(*funcs: Callable[[], Awaitable[Any]]) -> None:
+    try:
+        for func in funcs:
+            await func()
+    except anyio.get_cancelled_exc_class():
+        raise
+    except BaseException as e:
+        raise BaseExceptionGroup("unhandled errors in a TaskGroup", [e]) from None
+
+
+@dataclasses.dataclass(frozen=True)
+class CacheStatistics:
+    """缓存统计信息"""
+
+    hits: int
+    """命中次数"""
+    misses: int
+    """未命中次数"""
+    evictions: int
+    """因容量限制被淘汰的条目数量"""
+    size: int
+    """当前缓存条目数量"""
+    maxsize: int | None
+    """最大缓存条目数量，`None` 表示不限制"""
+
+
+class LRUCache(Generic[K, V]):
+    """支持过期时间的 LRU 缓存。
+
+    通过 {ref}`nonebot.utils.LRUCache.get_or_create` 获取缓存时，
+    同一键的并发未命中只会调用一次工厂函数，其他调用者等待其结果；
+    工厂函数失败时结果不会被缓存，等待者将重新尝试获取。
+
+    参数:
+        maxsize: 最大缓存条目数量，超出时淘汰最久未使用的条目，`None` 表示不限制
+        ttl: 缓存条目的有效时间，单位: 秒，`None` 表示不过期
+    """
+
+    def __init__(self, maxsize: int | None = None, ttl: float | None = None) -> None:
+        if maxsize is not None and maxsize <= 0:
+            raise ValueError("Cache max size must be positive")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("Cache ttl must be positive")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._pending: dict[K, anyio.Event] = {}
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __repr__(self) -> str:
+        return f"LRUCache(maxsize={self.maxsize}, ttl={self.ttl}, size={len(self)})"
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _lookup(self, key: K) -> V | UnsetType:
+        if (item := self._data.get(key)) is None:
+            return UNSET
+        expire_at, value = item
+        if expire_at <= monotonic():
+            del self._data[key]
+            return UNSET
+        self._data.move_to_end(key)
+        return value
+
+    def get(self, key: K, default: T | None = None) -> V | T | None:
+        """获取缓存，不存在或已过期时返回默认值
+
+        参数:
+            key: 缓存键
+            default: 默认值
+        """
+        if (value := self._lookup(key)) is UNSET:
+            self._misses += 1
+            return default
+        self._hits += 1
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """设置缓存
+
+        参数:
+            key: 缓存键
+            value: 缓存值
+        """
+        expire_at = math.inf if self.ttl is None else monotonic() + self.ttl
+        self._data[key] = (expire_at, value)
+        self._data.move_to_end(key)
+        if self.maxsize is not None:
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def pop(self, key: K) -> None:
+        """移除缓存
+
+        参数:
+            key: 缓存键
+        """
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """清空缓存"""
+        self._data.clear()
+
+    async def get_or_create(self, key: K, factory: Callable[[], Awaitable[V]]) -> V:
+        """获取缓存，未命中时调用工厂函数生成并缓存结果
+
+        参数:
+            key: 缓存键
+            factory: 生成缓存值的异步函数
+        """
+        while (value := self._lookup(key)) is UNSET:
+            if (waiter := self._pending.get(key)) is None:
+                break
+            await waiter.wait()
+        else:
+            self._hits += 1
+            return value
+
+        self._misses += 1
+        self._pending[key] = waiter = anyio.Event()
+        try:
+            value = await factory()
+        finally:
+            del self._pending[key]
+            waiter.set()
+        self.set(key, value)
+        return value
+
+    def statistics(self) -> CacheStatistics:
+        """获取缓存统计信息"""
+        return CacheStatistics(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            size=len(self._data),
+            maxsize=self.maxsize,
+        )
+
+
 def flatten_exception_group(
     exc_group: BaseExceptionGroup[E],
 ) -> Generator[E, None, None]:
@@ -0,0 +1,118 @@
+"""依赖注入基准测试。
+
+对比预编译解析计划与逐次检查参数的原实现调用单个事件处理函数的耗时。
+
+用法:
+    ```bash
+    cd tests
+    python -m benchmarks.bench_dependent
+    ```
+"""
+
+from functools import partial
+from time import perf_counter
+from typing import Any, cast
+
+import anyio
+
+import nonebot
+from nonebot.adapters import Bot, Event
+from nonebot.compat import PydanticUndefined
+from nonebot.dependencies import Dependent, Param
+from nonebot.dependencies.utils import check_field_type
+from nonebot.matcher import Matcher
+from nonebot.params import Depends
+from nonebot.typing import T_State
+from nonebot.utils import is_coroutine_callable, run_concurrently, run_coro_with_shield
+from utils import FakeAdapter, FakeMessage, make_fake_event
+
+from .bench_dispatch import FakeBot
+
+ROUNDS = 20000
+
+
+async def legacy_call(dependent: Dependent[Any], **params: Any) -> Any:
+    """解析计划引入前的依赖注入调用流程"""
+    if dependent.parameterless:
+        await run_concurrently(
+            *(partial(param._check, **params) for param in dependent.parameterless)
+        )
+    if dependent.params:
+        await run_concurrently(
+            *(
+                partial(cast(Param, field.field_info)._check, **params)
+                for field in dependent.params
+            )
+        )
+
+    for param in dependent.parameterless:
+        await param._solve(**params)
+
+    values: dict[str, Any] = {}
+
+    async def _solve_field(field: Any) -> None:
+        param = cast(Param, field.field_info)
+        value = await param._solve(**params)
+        if value is PydanticUndefined:
+            value = field.get_default()
+        v = check_field_type(field, value)
+        values[field.name] = v if param.validate else value
+
+    async def _solve_field_shielded(field: Any) -> None:
+        await run_coro_with_shield(_solve_field(field))
+
+    await run_concurrently(
+        *(partial(_solve_field_shielded, field) for field in dependent.params)
+    )
+
+    assert is_coroutine_callable(dependent.call)
+    return await dependent.call(**values)
+
+
+def get_value() -> int:
+    return 1
+
+
+async def handler(
+    bot: Bot,
+    event: Event,
+    state: T_State,
+    matcher: Matcher,
+    value: int = Depends(get_value),
+    default: int = 1,
+) -> None: ...
+
+
+async def simple_handler(bot: Bot, event: Event, state: T_State) -> None: ...
+
+
+async def run(dependent: Dependent[Any], legacy: bool, **params: Any) -> float:
+    call = partial(legacy_call, dependent) if legacy else dependent
+    start = perf_counter()
+    for _ in range(ROUNDS):
+        await call(**params)
+    return (perf_counter() - start) / ROUNDS
+
+
+async def main() -> None:
+    nonebot.init(driver="~none", log_level="WARNING")
+    adapter = FakeAdapter(nonebot.get_driver())
+    bot = FakeBot(adapter, "bench")
+    event = make_fake_event(_message=FakeMessage("hello"))()
+    params = {"bot": bot, "event": event, "state": {}, "matcher": Matcher()}
+
+    print(f"{'handler':<16}{'legacy us':>12}{'plan us':>12}{'speedup':>10}")
+    for call in (simple_handler, handler):
+        dependent = Dependent[Any].parse(
+            call=call, allow_types=Matcher.HANDLER_PARAM_TYPES
+        )
+        legacy = await run(dependent, True, **params)
+        plan = await run(dependent, False, **params)
+        print(
+            f"{call.__name__:<16}{legacy * 1e6:>12.1f}{plan * 1e6:>12.1f}"
+            f"{legacy / plan:>9.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    anyio.run(main)
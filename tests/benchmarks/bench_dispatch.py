@@ -0,0 +1,113 @@
+"""事件分发基准测试。
+
+统计单个事件分发过程中创建的任务组与任务数量及耗时，
+对比启用与未启用单任务内联时的差异。
+
+用法:
+    ```bash
+    cd tests
+    python -m benchmarks.bench_dispatch
+    ```
+"""
+
+from time import perf_counter
+from typing import Any
+from typing_extensions import Self, override
+
+import anyio
+
+import nonebot
+from nonebot.adapters import Bot
+from nonebot.message import handle_event
+from nonebot.params import EventPlainText
+from nonebot.rule import to_me
+from nonebot.utils import set_inline_single_task
+from utils import FakeAdapter, FakeMessage, make_fake_event
+
+ROUNDS = 1000
+
+
+class FakeBot(Bot):
+    @override
+    async def send(self, event: Any, message: Any, **kwargs: Any) -> Any:
+        return None
+
+
+class TaskCounter:
+    def __init__(self) -> None:
+        self.task_groups = 0
+        self.tasks = 0
+        self._create_task_group = anyio.create_task_group
+
+    def __enter__(self) -> Self:
+        counter = self
+
+        def create_task_group():
+            task_group = counter._create_task_group()
+            start_soon = task_group.start_soon
+
+            def _start_soon(*args: Any, **kwargs: Any) -> None:
+                counter.tasks += 1
+                start_soon(*args, **kwargs)
+
+            counter.task_groups += 1
+            task_group.start_soon = _start_soon
+            return task_group
+
+        anyio.create_task_group = create_task_group
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        anyio.create_task_group = self._create_task_group
+
+
+def setup_matchers() -> None:
+    for i in range(20):
+
+        async def _handle(text: str = EventPlainText()) -> None: ...
+
+        nonebot.on_command(f"cmd{i}", priority=i % 5 + 1).handle()(_handle)
+
+    async def _echo(text: str = EventPlainText()) -> None: ...
+
+    nonebot.on_message(rule=to_me(), priority=10, block=False).handle()(_echo)
+    nonebot.on_notice(priority=10).handle()(_echo)
+
+
+async def run(bot: Bot, inline: bool) -> tuple[float, float, float]:
+    set_inline_single_task(inline)
+    events = [
+        make_fake_event(_message=FakeMessage("/cmd1 hello"))(),
+        make_fake_event(_message=FakeMessage("hello"))(),
+        make_fake_event(_type="meta_event")(),
+    ]
+    with TaskCounter() as counter:
+        start = perf_counter()
+        for _ in range(ROUNDS):
+            for event in events:
+                await handle_event(bot, event)
+        elapsed = perf_counter() - start
+
+    total = ROUNDS * len(events)
+    return counter.task_groups / total, counter.tasks / total, elapsed / total
+
+
+async def main() -> None:
+    nonebot.init(driver="~none", log_level="WARNING")
+    adapter = FakeAdapter(nonebot.get_driver())
+    bot = FakeBot(adapter, "bench")
+    setup_matchers()
+
+    results = {inline: await run(bot, inline) for inline in (False, True)}
+    print(f"{'mode':<10}{'groups/event':>15}{'tasks/event':>15}{'us/event':>12}")
+    for inline, (groups, tasks, elapsed) in results.items():
+        mode = "inline" if inline else "default"
+        print(f"{mode:<10}{groups:>15.2f}{tasks:>15.2f}{elapsed * 1e6:>12.1f}")
+
+    groups_saved = results[False][0] - results[True][0]
+    tasks_saved = results[False][1] - results[True][1]
+    print(f"saved {groups_saved:.2f} task groups, {tasks_saved:.2f} tasks per event")
+
+
+if __name__ == "__main__":
+    anyio.run(main)
@@ -0,0 +1,75 @@
+"""消息构造基准测试。
+
+对比在循环中通过 `+`、`+=` 与消息构造器拼接排行榜消息的耗时。
+
+用法:
+    ```bash
+    cd tests
+    python -m benchmarks.bench_message
+    ```
+"""
+
+from collections.abc import Callable
+import gc
+from time import perf_counter
+
+from utils import FakeMessage, FakeMessageSegment
+
+ROUNDS = 20
+
+
+def build_add(lines: int) -> FakeMessage:
+    message = FakeMessage()
+    for i in range(lines):
+        message = message + f"{i}. " + FakeMessageSegment.image("avatar") + "\n"
+    return message
+
+
+def build_iadd(lines: int) -> FakeMessage:
+    message = FakeMessage()
+    for i in range(lines):
+        message += f"{i}. "
+        message += FakeMessageSegment.image("avatar")
+        message += "\n"
+    return message
+
+
+def build_builder(lines: int) -> FakeMessage:
+    builder = FakeMessage.builder()
+    for i in range(lines):
+        builder += f"{i}. "
+        builder += FakeMessageSegment.image("avatar")
+        builder += "\n"
+    return builder.build()
+
+
+def run(build: Callable[[int], FakeMessage], lines: int) -> float:
+    # 避免前一组基准测试产生的垃圾触发回收，干扰本组计时
+    gc.collect()
+    gc.disable()
+    try:
+        best = float("inf")
+        for _ in range(ROUNDS):
+            start = perf_counter()
+            build(lines)
+            best = min(best, perf_counter() - start)
+    finally:
+        gc.enable()
+    return best
+
+
+def main() -> None:
+    print(f"{'lines':<8}{'+ ms':>12}{'+= ms':>12}{'builder ms':>12}{'segments':>10}")
+    for lines in (10, 100, 300):
+        add = run(build_add, lines)
+        iadd = run(build_iadd, lines)
+        builder = run(build_builder, lines)
+        segments = f"{len(build_iadd(lines))}/{len(build_builder(lines))}"
+        print(
+            f"{lines:<8}{add * 1e3:>12.2f}{iadd * 1e3:>12.2f}"
+            f"{builder * 1e3:>12.2f}{segments:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 from typing import TypeVar
 
 from nonebot.adapters import Bot
+from nonebot.params import BotSelfId
 
 
 async def get_bot(b: Bot) -> Bot:
@@ -18,6 +19,10 @@ async def legacy_bot(bot):
 async def not_legacy_bot(bot: int): ...
 
 
+async def bot_self_id(self_id: str = BotSelfId()) -> str:
+    return self_id
+
+
 class FooBot(Bot): ...
 
 
@@ -1,7 +1,14 @@
 from typing import TypeVar
 
 from nonebot.adapters import Event, Message
-from nonebot.params import EventMessage, EventPlainText, EventToMe, EventType
+from nonebot.params import (
+    EventMessage,
+    EventPlainText,
+    EventSessionId,
+    EventToMe,
+    EventType,
+    EventUserId,
+)
 
 
 async def event(e: Event) -> Event:
@@ -64,3 +71,11 @@ async def event_plain_text(text: str = EventPlainText()) -> str:
 
 async def event_to_me(to_me: bool = EventToMe()) -> bool:
     return to_me
+
+
+async def event_user_id(user_id: str = EventUserId()) -> str:
+    return user_id
+
+
+async def event_session_id(session_id: str = EventSessionId()) -> str:
+    return session_id
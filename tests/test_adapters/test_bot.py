@@ -1,11 +1,13 @@
+from datetime import timedelta
 from typing import Any
 
 import anyio
 from nonebug import App
 import pytest
 
-from nonebot.adapters import Bot
-from nonebot.exception import MockApiException
+from nonebot.adapters import ApiCacheRule, ApiGovernor, Bot, SendBuffer
+from nonebot.exception import ApiRateLimited, MockApiException
+from utils import FakeMessage, FakeMessageSegment, make_fake_event
 
 
 @pytest.mark.anyio
@@ -24,6 +26,284 @@ async def test_bot_call_api(app: App):
             await bot.call_api("test")
 
 
+@pytest.mark.anyio
+async def test_bot_api_governor(app: App):
+    async with app.test_api() as ctx:
+        bot = ctx.create_bot()
+        assert bot.governor is None
+
+        # api rate limit
+        bot.governor = governor = ApiGovernor(
+            api_rates={"test": 10}, timeout=timedelta(seconds=0.05)
+        )
+        ctx.should_call_api("test", {}, True)
+        assert await bot.call_api("test") is True
+        with pytest.raises(ApiRateLimited):
+            await bot.call_api("test")
+        ctx.should_call_api("other", {}, True)
+        assert await bot.call_api("other") is True
+
+        stats = governor.statistics()
+        assert stats.calls == 2
+        assert stats.rejected == 1
+        assert stats.waiting == stats.running == 0
+
+        # target rate limit
+        bot.governor = governor = ApiGovernor(
+            api_rates={"*": 1000}, target_rate=10, timeout=timedelta(seconds=0.05)
+        )
+        ctx.should_call_api("test", {"group_id": 1}, True)
+        await bot.call_api("test", group_id=1)
+        ctx.should_call_api("test", {"group_id": 2}, True)
+        await bot.call_api("test", group_id=2)
+        with pytest.raises(ApiRateLimited):
+            await bot.call_api("test", group_id=1)
+        assert governor.statistics().rejected == 1
+
+        # queued call waits for token
+        bot.governor = governor = ApiGovernor(api_rates={"test": 100})
+        ctx.should_call_api("test", {}, True)
+        ctx.should_call_api("test", {}, True)
+        await bot.call_api("test")
+        await bot.call_api("test")
+        assert governor.statistics().wait_time_max > 0
+
+        # concurrency limit
+        bot.governor = governor = ApiGovernor(
+            max_concurrency=1, timeout=timedelta(seconds=0.05)
+        )
+        async with governor.acquire(bot, "test", {}):
+            assert governor.statistics().running == 1
+            with pytest.raises(ApiRateLimited):
+                await bot.call_api("test")
+        ctx.should_call_api("test", {}, True)
+        await bot.call_api("test")
+
+
+@pytest.mark.anyio
+async def test_api_governor_refund(app: App):
+    async with app.test_api() as ctx:
+        bot = ctx.create_bot()
+        governor = ApiGovernor(
+            api_rates={"test": 1},
+            burst=2,
+            max_concurrency=1,
+            timeout=timedelta(seconds=0.05),
+        )
+        async with governor.acquire(bot, "test", {}):
+            # rejected by concurrency limit, reserved token is returned
+            with pytest.raises(ApiRateLimited):
+                async with governor.acquire(bot, "test", {}):
+                    pass
+            assert governor._api_buckets["test"]._tokens >= 0.9
+
+            with anyio.move_on_after(0.01):
+                async with governor.acquire(bot, "test", {}):
+                    pass
+            assert governor._api_buckets["test"]._tokens >= 0.9
+
+
+@pytest.mark.anyio
+async def test_api_governor_shared_concurrency(
+    app: App, monkeypatch: pytest.MonkeyPatch
+):
+    async with app.test_api() as ctx:
+        bot = ctx.create_bot()
+        monkeypatch.setattr(bot.config, "api_max_concurrency", 1)
+        monkeypatch.setattr(bot.config, "api_queue_timeout", timedelta(seconds=0.05))
+        bot = ctx.create_bot(self_id="first")
+        other = ctx.create_bot(self_id="second")
+        assert bot.governor
+        assert other.governor
+
+        # concurrency limit is shared by all bots
+        async with bot.governor.acquire(bot, "test", {}):
+            with pytest.raises(ApiRateLimited):
+                await other.call_api("test")
+        ctx.should_call_api("test", {}, True)
+        assert await other.call_api("test") is True
+
+
+@pytest.mark.anyio
+async def test_api_governor_prune(app: App, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr("nonebot.internal.adapter.governor._TARGET_PRUNE_SIZE", 4)
+
+    async with app.test_api() as ctx:
+        bot = ctx.create_bot()
+        governor = ApiGovernor(target_rate=1)
+        for user_id in range(4):
+            async with governor.acquire(bot, "test", {"user_id": user_id}):
+                pass
+        assert len(governor._target_buckets) == 4
+
+        # buckets still waiting for refill are kept
+        governor.target_rate = 1000
+        for user_id in range(4, 8):
+            async with governor.acquire(bot, "test", {"user_id": user_id}):
+                pass
+        assert len(governor._target_buckets) == 8
+
+        # refilled buckets are removed
+        await anyio.sleep(0.01)
+        async with governor.acquire(bot, "test", {"user_id": 8}):
+            pass
+        assert set(governor._target_buckets) == {
+            f"user_id:{user_id}" for user_id in (0, 1, 2, 3, 8)
+        }
+
+
+@pytest.mark.anyio
+async def test_bot_api_cache(app: App):
+    async def calling_api_hook(bot: Bot, api: str, data: dict[str, Any]):
+        if data.get("mock"):
+            raise MockApiException("mocked")
+
+    with pytest.MonkeyPatch.context() as m:
+        m.setattr(Bot, "_api_cache_rules", {})
+        m.setattr(Bot, "_calling_api_hook", {calling_api_hook})
+
+        Bot.cache_api("get_info", 60, invalidated_by=["set_info"])
+
+        async with app.test_api() as ctx:
+            bot = ctx.create_bot()
+
+            ctx.should_call_api("get_info", {"id": 1}, "one")
+            assert await bot.call_api("get_info", id=1) == "one"
+            assert await bot.get_info(id=1) == "one"
+
+            # concurrent misses call api only once
+            results: list[Any] = []
+
+            async def _call() -> None:
+                results.append(await bot.call_api("get_info", id=2))
+
+            ctx.should_call_api("get_info", {"id": 2}, "two")
+            async with anyio.create_task_group() as tg:
+                for _ in range(3):
+                    tg.start_soon(_call)
+            assert results == ["two"] * 3
+
+            # mocked calls bypass the cache
+            assert await bot.call_api("get_info", id=1, mock=True) == "mocked"
+            assert await bot.call_api("get_info", id=1) == "one"
+
+            # invalidated by api call
+            ctx.should_call_api("set_info", {"id": 1}, None)
+            await bot.call_api("set_info", id=1)
+            ctx.should_call_api("get_info", {"id": 1}, "new")
+            assert await bot.call_api("get_info", id=1) == "new"
+
+            # explicit invalidation
+            bot.api_cache.invalidate("get_info", id=2)
+            ctx.should_call_api("get_info", {"id": 2}, "new two")
+            assert await bot.call_api("get_info", id=2) == "new two"
+
+            stats = bot.api_cache.statistics()["get_info"]
+            assert stats.misses == 4
+            assert stats.hits == 4
+
+            bot.api_cache.invalidate()
+            assert not bot.api_cache.statistics()
+
+            # cached results are copied for each caller
+            ctx.should_call_api("get_info", {"id": 3}, {"name": "three"})
+            result = await bot.call_api("get_info", id=3)
+            result["name"] = "modified"
+            assert await bot.call_api("get_info", id=3) == {"name": "three"}
+
+            # config overrides ttl and keeps invalidation rules
+            m.setattr(bot.config, "api_cache", {"get_info": 30, "get_list": 30})
+            bot = ctx.create_bot(self_id="other")
+            assert bot.api_cache.rules["get_info"] == ApiCacheRule(
+                30, frozenset(("set_info",))
+            )
+            assert bot.api_cache.rules["get_list"] == ApiCacheRule(30)
+            assert set(bot.api_cache.rules) == {"get_info", "get_list"}
+
+            ctx.should_call_api("get_info", {"id": 1}, "one")
+            assert await bot.call_api("get_info", id=1) == "one"
+            ctx.should_call_api("set_info", {"id": 1}, None)
+            await bot.call_api("set_info", id=1)
+            ctx.should_call_api("get_info", {"id": 1}, "new")
+            assert await bot.call_api("get_info", id=1) == "new"
+
+        with pytest.raises(ValueError, match="positive"):
+            Bot.cache_api("get_info", 0)
+
+
+@pytest.mark.anyio
+async def test_send_buffer(app: App):
+    event = make_fake_event()()
+    other = make_fake_event(_session_id="other")()
+
+    async with app.test_api() as ctx:
+        bot = ctx.create_bot()
+        async with SendBuffer(bot, max_messages=2, max_length=6) as buffer:
+            await buffer.send(event, FakeMessage("a"))
+            await buffer.send(other, "x")
+            assert buffer.pending == 2
+
+            # message count limit flushes the target first
+            ctx.should_call_send(
+                event, FakeMessage("a") + "\n" + FakeMessageSegment.text("b"), None
+            )
+            await buffer.send(event, FakeMessageSegment.text("b"))
+            await buffer.send(event, "c")
+
+            # text length limit
+            ctx.should_call_send(event, "c", None)
+            await buffer.send(event, "defgh")
+
+            # oversized message is sent directly
+            ctx.should_call_send(event, "defgh", None)
+            ctx.should_call_send(event, "ijklmno", None)
+            await buffer.send(event, "ijklmno")
+            assert buffer.pending == 1
+
+            ctx.should_call_send(other, "x", None)
+        assert not buffer.pending
+
+        buffer = SendBuffer(bot, window=0)
+        await buffer.send(event, "a")
+        await anyio.sleep(0.01)
+        ctx.should_call_send(event, "a", None)
+        await buffer.send(event, "b")
+        ctx.should_call_send(event, "b", None)
+        await buffer.flush()
+
+        assert SendBuffer.from_config(bot) is None
+
+
+@pytest.mark.anyio
+async def test_send_buffer_timer(app: App):
+    event = make_fake_event()()
+    other = make_fake_event(_session_id="other")()
+
+    async with app.test_api() as ctx:
+        bot = ctx.create_bot()
+        async with anyio.create_task_group() as tg:
+            buffer = SendBuffer(bot, window=0.05, task_group=tg)
+
+            # buffered messages are sent once the window ends
+            await buffer.send(event, "a")
+            await buffer.send(event, "b")
+            ctx.should_call_send(event, "a\nb", None)
+            await anyio.sleep(0.1)
+            assert not buffer.pending
+
+            # flushed target cancels its timer
+            await buffer.send(event, "c")
+            ctx.should_call_send(event, "c", None)
+            await buffer.flush()
+            await anyio.sleep(0.1)
+
+            # send failure in timer is logged
+            await buffer.send(other, "x")
+            ctx.should_call_send(other, "x", exception=RuntimeError("failed"))
+            await anyio.sleep(0.1)
+            assert not buffer.pending
+
+
 @pytest.mark.anyio
 async def test_bot_calling_api_hook_simple(app: App):
     runned: bool = False
@@ -244,3 +524,62 @@ async def test_bot_called_api_hook_multi_mock(app: App):
         assert runned1 is True
         assert runned2 is True
         assert result == 1
+
+
+@pytest.mark.anyio
+async def test_bot_api_hook_scope(app: App):
+    calling: list[str] = []
+    called: list[str] = []
+
+    async def calling_api_hook(bot: Bot, api: str, data: dict[str, Any]):
+        calling.append(api)
+
+    async def called_api_hook(
+        bot: Bot,
+        exception: Exception | None,
+        api: str,
+        data: dict[str, Any],
+        result: Any,
+    ):
+        called.append(api)
+
+    with pytest.MonkeyPatch.context() as m:
+        m.setattr(Bot, "_calling_api_hook", set())
+        m.setattr(Bot, "_called_api_hook", set())
+        m.setattr(Bot, "_scoped_calling_api_hook", {})
+        m.setattr(Bot, "_scoped_called_api_hook", {})
+
+        assert Bot.on_calling_api(apis="set_group_ban")(calling_api_hook) is (
+            calling_api_hook
+        )
+        Bot.on_called_api(apis=["set_group_*", "delete_msg"])(called_api_hook)
+
+        async with app.test_api() as ctx:
+            bot = ctx.create_bot()
+            for api in ("send_msg", "set_group_ban", "set_group_kick", "delete_msg"):
+                ctx.should_call_api(api, {}, None)
+                await bot.call_api(api)
+
+            # unrelated api skips hook machinery
+            assert bot._get_api_hooks("send_msg") == ((), ())
+
+            # hooks registered later are picked up
+            Bot.on_calling_api(calling_api_hook)
+            ctx.should_call_api("send_msg", {}, None)
+            await bot.call_api("send_msg")
+
+            # in place modification of hook containers is detected
+            Bot._calling_api_hook.discard(calling_api_hook)
+            ctx.should_call_api("send_msg", {}, None)
+            await bot.call_api("send_msg")
+            Bot._scoped_called_api_hook[called_api_hook] = frozenset(("send_msg",))
+            ctx.should_call_api("send_msg", {}, None)
+            await bot.call_api("send_msg")
+
+    assert calling == ["set_group_ban", "send_msg"]
+    assert called == ["set_group_ban", "set_group_kick", "delete_msg", "send_msg"]
+
+    # restored hook containers are detected
+    async with app.test_api() as ctx:
+        bot = ctx.create_bot()
+        assert calling_api_hook not in bot._get_api_hooks("send_msg").calling
@@ -0,0 +1,115 @@
+from typing import ClassVar
+from typing_extensions import override
+
+from nonebug import App
+import pytest
+
+from nonebot import on_message
+from nonebot.adapters import Event, Message
+from nonebot.message import handle_event
+from nonebot.rule import keyword, startswith
+from utils import FakeMessage, make_fake_event
+
+
+class CountingEvent(Event):
+    memoize_accessors: ClassVar[bool] = True
+
+    calls: int = 0
+
+    @override
+    def get_type(self) -> str:
+        return "message"
+
+    @override
+    def get_event_name(self) -> str:
+        return "counting"
+
+    @override
+    def get_event_description(self) -> str:
+        return "counting"
+
+    @override
+    def get_user_id(self) -> str:
+        return "test"
+
+    @override
+    def get_session_id(self) -> str:
+        return "test"
+
+    @override
+    def get_message(self) -> Message:
+        self.calls += 1
+        return FakeMessage(f"text {self.calls}")
+
+    @override
+    def is_tome(self) -> bool:
+        return True
+
+
+def test_event_accessor_cache():
+    event = CountingEvent()
+
+    # not cached outside dispatch
+    assert event.get_plaintext() == "text 1"
+    assert event.get_plaintext() == "text 2"
+
+    with event.accessor_cache():
+        message = event.get_message()
+        assert event.get_message() is message
+        assert event.get_plaintext() == "text 3"
+        assert event.calls == 3
+
+        event.clear_accessor_cache()
+        assert event.get_plaintext() == "text 4"
+        assert event.get_plaintext() == "text 4"
+
+        # other events are not affected
+        other = CountingEvent()
+        assert other.get_plaintext() == "text 1"
+        assert other.get_plaintext() == "text 2"
+
+    assert event.get_plaintext() == "text 5"
+
+    # memoization is opt-in
+    plain = make_fake_event(_message=FakeMessage("text"))()
+    assert not hasattr(type(plain).get_message, "__memoized__")
+
+
+class PrefixedEvent(CountingEvent):
+    @override
+    def get_user_id(self) -> str:
+        return f"prefixed-{super().get_user_id()}"
+
+    @override
+    def get_session_id(self) -> str:
+        return super().get_user_id()
+
+
+def test_event_accessor_cache_super():
+    event = PrefixedEvent()
+
+    with event.accessor_cache():
+        assert event.get_user_id() == "prefixed-test"
+        # parent accessor called through super() is cached separately
+        assert event.get_session_id() == "test"
+        assert event.get_user_id() == "prefixed-test"
+
+
+@pytest.mark.anyio
+async def test_event_accessor_cache_dispatch(app: App):
+    handled: list[str] = []
+
+    async def _handle(event: Event) -> None:
+        handled.append(event.get_plaintext())
+
+    with app.provider.context({}):
+        on_message(startswith("text"), block=False).handle()(_handle)
+        on_message(keyword("ext"), block=False).handle()(_handle)
+
+        async with app.test_api() as ctx:
+            bot = ctx.create_bot()
+            event = CountingEvent()
+            await handle_event(bot, event)
+
+    assert handled == ["text 1", "text 1"]
+    assert event.calls == 1
@@ -230,6 +230,53 @@ def test_message_only():
     assert message.only(FakeMessageSegment.text("test")) is True
 
 
+def test_message_builder():
+    builder = FakeMessage.builder()
+    builder += "1. "
+    builder += FakeMessageSegment.text("alice")
+    builder.append(FakeMessageSegment.image("url")).extend(
+        [
+            "\n",
+            FakeMessage(
+                [FakeMessageSegment.text("2. "), FakeMessageSegment.text("bob")]
+            ),
+        ]
+    )
+
+    message = builder.build()
+    assert isinstance(message, FakeMessage)
+    assert message == FakeMessage(
+        [
+            FakeMessageSegment.text("1. alice"),
+            FakeMessageSegment.image("url"),
+            FakeMessageSegment.text("\n2. bob"),
+        ]
+    )
+
+    # builder can be reused after build
+    builder += "!"
+    assert builder.build()[-1] == FakeMessageSegment.text("\n2. bob!")
+    assert len(message) == 3
+
+    # merging does not modify the appended segments
+    head = FakeMessageSegment.text("a")
+    assert FakeMessage.builder().append(head).append("b").build() == FakeMessage(
+        FakeMessageSegment.text("ab")
+    )
+    assert head == FakeMessageSegment.text("a")
+
+    # text segments with extra data are not merged
+    styled = FakeMessageSegment("text", {"text": "b", "bold": True})
+    assert FakeMessage.builder().append("a").append(styled).build() == FakeMessage(
+        [FakeMessageSegment.text("a"), styled]
+    )
+
+    assert FakeMessage.builder().build() == FakeMessage()
+
+    with pytest.raises(TypeError, match="Unsupported type"):
+        FakeMessage.builder().append(1)  # type: ignore
+
+
 def test_message_join():
     msg = FakeMessage([FakeMessageSegment.text("test")])
     iterable = [
@@ -1,18 +1,20 @@
 from http.cookies import SimpleCookie
 import json
-from typing import Any
+from typing import Any, Literal
 
 from aiohttp import ClientSession, ClientWebSocketResponse, WSMessage, WSMsgType
 import anyio
 from nonebug import App
 import pytest
 
-from nonebot.adapters import Bot
+from nonebot.adapters import Bot, Event
+from nonebot.config import Config, Env
 from nonebot.dependencies import Dependent
 from nonebot.drivers import (
     URL,
     ASGIMixin,
     Driver,
+    EventQueue,
     HTTPClientMixin,
     HTTPServerSetup,
     Request,
@@ -24,10 +26,11 @@ from nonebot.drivers import (
 )
 from nonebot.drivers.aiohttp import Session as AiohttpSession
 from nonebot.drivers.aiohttp import WebSocket as AiohttpWebSocket
+from nonebot.drivers.none import Driver as NoneDriver
 from nonebot.exception import WebSocketClosed
 from nonebot.params import Depends
 from nonebot.utils import UNSET
-from utils import FakeAdapter
+from utils import FakeAdapter, FakeMessage, make_fake_event
 
 
 @pytest.mark.anyio
@@ -1051,3 +1054,197 @@ async def test_bot_connect_hook(app: App, driver: Driver):
             pytest.fail("dependency not run")
         if not dependency_should_be_cleaned:
             pytest.fail("dependency not cleaned")
+
+
+@pytest.mark.anyio
+async def test_event_queue(app: App):
+    driver = NoneDriver(Env(), Config(event_queue_size=1, event_queue_workers=1))
+    async with app.test_api() as ctx:
+        bot = ctx.create_bot()
+    queue = driver.event_queue
+    assert queue is not None
+
+    handled: list[Event] = []
+    release = anyio.Event()
+
+    async def handler(bot: Bot, event: Event) -> None:
+        await release.wait()
+        handled.append(event)
+
+    queue.handler = handler
+    events = [make_fake_event(_message=FakeMessage(str(i)))() for i in range(3)]
+
+    async with driver._lifespan:
+        assert await driver.submit_event(bot, events[0])
+        await anyio.sleep(0.1)
+        assert await driver.submit_event(bot, events[1])
+        assert queue.statistics().size == 1
+
+        # queue is full, submitting should block
+        with anyio.move_on_after(0.1) as scope:
+            await driver.submit_event(bot, events[2])
+        assert scope.cancelled_caught
+
+        release.set()
+        assert await driver.submit_event(bot, events[2])
+        await anyio.sleep(0.1)
+
+    assert handled == events
+    stats = queue.statistics()
+    assert stats.size == 0
+    assert stats.submitted == 4
+    assert stats.processed == 3
+    assert stats.dropped == 0
+    assert stats.wait_time_max >= stats.wait_time_avg > 0
+
+
+@pytest.mark.anyio
+async def test_event_queue_shutdown_order(app: App):
+    driver = NoneDriver(Env(), Config(event_queue_size=1, event_queue_workers=1))
+    async with app.test_api() as ctx:
+        bot = ctx.create_bot()
+    queue = driver.event_queue
+    assert queue is not None
+
+    order: list[str] = []
+
+    async def handler(bot: Bot, event: Event) -> None:
+        await anyio.sleep(0.05)
+        order.append("event")
+
+    queue.handler = handler
+
+    @driver.on_shutdown
+    async def _shutdown():
+        assert not queue.started
+        order.append("shutdown")
+
+    async with driver._lifespan:
+        assert await driver.submit_event(bot, make_fake_event()())
+
+    # pending events are handled before user shutdown hooks
+    assert order == ["event", "shutdown"]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("overflow", "expected"), [("drop_newest", [0, 1]), ("drop_oldest", [0, 2])]
+)
+async def test_event_queue_overflow(
+    app: App, overflow: Literal["drop_oldest", "drop_newest"], expected: list[int]
+):
+    async with app.test_api() as ctx:
+        bot = ctx.create_bot()
+    handled: list[Event] = []
+    release = anyio.Event()
+
+    async def handler(bot: Bot, event: Event) -> None:
+        await release.wait()
+        handled.append(event)
+
+    queue = EventQueue(handler, max_size=1, overflow=overflow)
+    events = [make_fake_event(_message=FakeMessage(str(i)))() for i in range(3)]
+
+    async with anyio.create_task_group() as tg:
+        queue.start(tg)
+        assert await queue.submit(bot, events[0])
+        await anyio.sleep(0.1)
+        assert await queue.submit(bot, events[1])
+        assert await queue.submit(bot, events[2]) is (overflow == "drop_oldest")
+        assert queue.statistics().dropped == 1
+
+        release.set()
+        await queue.close()
+
+    assert handled == [events[i] for i in expected]
+
+
+@pytest.mark.anyio
+async def test_event_queue_session(app: App):
+    async with app.test_api() as ctx:
+        bot = ctx.create_bot()
+
+    running: set[str] = set()
+    max_running = 0
+    handled: list[Event] = []
+
+    async def handler(bot: Bot, event: Event) -> None:
+        nonlocal max_running
+        session_id = event.get_session_id()
+        assert session_id not in running
+        running.add(session_id)
+        max_running = max(max_running, len(running))
+        await anyio.sleep(0.05)
+        running.remove(session_id)
+        handled.append(event)
+
+    queue = EventQueue(handler, max_size=4, workers=2, mode="session")
+    # pick another session assigned to a different lane
+    other = next(s for s in map(str, range(10)) if hash(s) % 2 != hash("a") % 2)
+    events = [
+        make_fake_event(_session_id="a", _message=FakeMessage(str(i)))()
+        for i in range(3)
+    ]
+    other_event = make_fake_event(_session_id=other)()
+
+    async with anyio.create_task_group() as tg:
+        queue.start(tg)
+        for event in events:
+            assert await queue.submit(bot, event)
+        assert await queue.submit(bot, other_event)
+        await anyio.sleep(0.5)
+        await queue.close()
+
+    assert [e for e in handled if e is not other_event] == events
+    assert max_running == 2
+    lanes = queue.lane_statistics()
+    assert len(lanes) == 2
+    assert sorted(lane.processed for lane in lanes) == [1, 3]
+    assert queue.statistics().processed == 4
+
+
+@pytest.mark.anyio
+async def test_event_queue_close(app: App):
+    async with app.test_api() as ctx:
+        bot = ctx.create_bot()
+    handled: list[Event] = []
+    release = anyio.Event()
+
+    async def handler(bot: Bot, event: Event) -> None:
+        await release.wait()
+        handled.append(event)
+
+    queue = EventQueue(handler, max_size=4)
+    events = [make_fake_event(_message=FakeMessage(str(i)))() for i in range(3)]
+
+    async with anyio.create_task_group() as tg:
+        queue.start(tg)
+        for event in events:
+            assert await queue.submit(bot, event)
+        await anyio.sleep(0.1)
+
+        # remaining events are dropped after timeout
+        await queue.close(0.1)
+        assert not queue.started
+        assert queue.statistics().dropped == 2
+        with pytest.raises(RuntimeError, match="not started"):
+            await queue.submit(bot, events[0])
+
+        release.set()
+
+    assert handled == events[:1]
+
+    # remaining events are handled before close returns
+    handled.clear()
+    release = anyio.Event()
+    queue = EventQueue(handler, max_size=4)
+    async with anyio.create_task_group() as tg:
+        queue.start(tg)
+        for event in events:
+            assert await queue.submit(bot, event)
+        tg.start_soon(queue.close)
+        await anyio.sleep(0.1)
+        release.set()
+
+    assert handled == events
+    assert queue.statistics().dropped == 0
@@ -1,14 +1,32 @@
+from datetime import datetime, timedelta
+import json
 from pathlib import Path
 import sys
 
+import anyio
 from nonebug import App
 import pytest
 
 from nonebot import get_plugin
-from nonebot.matcher import Matcher, matchers
-from nonebot.message import _check_matcher, check_and_run_matcher
+from nonebot.adapters import Event
+from nonebot.exception import RejectedException
+from nonebot.internal.matcher import (
+    ContinuationRegistry,
+    MatcherContinuation,
+    MatcherExpireScheduler,
+    expire_scheduler,
+)
+from nonebot.matcher import Matcher, MatcherSource, continuations, matchers
+from nonebot.message import (
+    _check_matcher,
+    check_and_run_matcher,
+    get_dispatch_stats,
+    handle_event,
+    reset_dispatch_stats,
+)
 from nonebot.permission import Permission, User
 from nonebot.rule import Rule
+from nonebot.typing import T_State
 from utils import FakeMessage, make_fake_event
 
 
@@ -86,6 +104,80 @@ async def test_matcher_check(app: App):
             assert await _check_matcher(test_rule_error, bot, event, {}) is False
 
 
+@pytest.mark.anyio
+async def test_dispatch_profiler(app: App, monkeypatch: pytest.MonkeyPatch):
+    async def falsy():
+        return False
+
+    event = make_fake_event(_type="test")()
+    reset_dispatch_stats()
+    with app.provider.context({}):
+        test_hit = Matcher.new(
+            source=MatcherSource(module_name="plugins.profiler", lineno=1)
+        )
+        test_skip = Matcher.new(
+            rule=Rule(falsy),
+            source=MatcherSource(module_name="plugins.profiler", lineno=2),
+        )
+
+        handled = False
+
+        @test_hit.handle()
+        async def _():
+            nonlocal handled
+            handled = True
+
+        async with app.test_api() as ctx:
+            bot = ctx.create_bot()
+
+        await check_and_run_matcher(test_hit, bot, event, {})
+        assert not get_dispatch_stats()
+
+        monkeypatch.setattr(bot.config, "dispatch_profiler", True)
+        await check_and_run_matcher(test_hit, bot, event, {})
+        await check_and_run_matcher(test_skip, bot, event, {})
+        await check_and_run_matcher(test_skip, bot, event, {})
+
+    assert handled
+    stats = json.loads(json.dumps(get_dispatch_stats()))
+    assert len(stats) == 2
+    hit_stats = stats["plugins.profiler:1"]
+    assert hit_stats["checked"] == hit_stats["hits"] == 1
+    assert hit_stats["hit_rate"] == 1.0
+    assert hit_stats["run"]["count"] == 1
+    skip_stats = stats["plugins.profiler:2"]
+    assert skip_stats["checked"] == skip_stats["skips"] == 2
+    assert skip_stats["skip_rate"] == 1.0
+    assert skip_stats["rule"]["count"] == 2
+    assert skip_stats["run"]["count"] == 0
+
+    reset_dispatch_stats()
+    assert not get_dispatch_stats()
+
+
+@pytest.mark.anyio
+async def test_expire_scheduler(app: App):
+    assert expire_scheduler.running
+    with app.provider.context({}):
+        test_expire = Matcher.new("test", expire_time=timedelta(seconds=0.1))
+        test_not_expire = Matcher.new("test", expire_time=timedelta(seconds=10))
+        assert test_expire in matchers[1]
+        assert not expire_scheduler.is_expired(test_expire)
+
+        await anyio.sleep(0.3)
+        assert test_expire not in matchers[1]
+        assert expire_scheduler.is_expired(test_expire)
+        assert test_not_expire in matchers[1]
+        assert not expire_scheduler.is_expired(test_not_expire)
+
+    # fallback to check expire time when scheduler is not running
+    scheduler = MatcherExpireScheduler()
+    scheduler.schedule(test_expire)
+    assert not scheduler.running
+    assert scheduler.is_expired(test_expire)
+    assert not scheduler.is_expired(test_not_expire)
+
+
 @pytest.mark.anyio
 async def test_matcher_handle(app: App):
     from plugins.matcher.matcher_process import test_handle
@@ -101,6 +193,52 @@ async def test_matcher_handle(app: App):
         ctx.should_finished()
 
 
+@pytest.mark.anyio
+async def test_matcher_send_buffer(app: App, monkeypatch: pytest.MonkeyPatch):
+    async def handle(matcher: Matcher):
+        await matcher.send("a")
+        await matcher.send("b")
+        await matcher.flush()
+        await matcher.send("c", at_sender=True)
+        await matcher.send("d")
+        await matcher.finish("e")
+
+    with app.provider.context({}):
+        test_buffer = Matcher.new("message", handlers=[handle])
+
+        async with app.test_api() as ctx:
+            bot = ctx.create_bot()
+            monkeypatch.setattr(bot.config, "send_buffer", True)
+            event = make_fake_event()()
+            ctx.should_call_send(event, "a\nb", None)
+            ctx.should_call_send(event, "c", None, at_sender=True)
+            ctx.should_call_send(event, "d\ne", None)
+            await check_and_run_matcher(test_buffer, bot, event, {})
+
+
+@pytest.mark.anyio
+async def test_matcher_send_buffer_flush_failed(
+    app: App, monkeypatch: pytest.MonkeyPatch
+):
+    async def handle(matcher: Matcher):
+        await matcher.send("a")
+        await matcher.reject()
+
+    with app.provider.context({}):
+        test_buffer = Matcher.new("message", handlers=[handle])
+
+        async with app.test_api() as ctx:
+            bot = ctx.create_bot()
+            monkeypatch.setattr(bot.config, "send_buffer", True)
+            event = make_fake_event()()
+            ctx.should_call_send(event, "a", exception=RuntimeError("send failed"))
+
+            # flush failure does not replace the session control exception
+            matcher = test_buffer()
+            with pytest.raises(RejectedException):
+                await matcher.simple_run(bot, event, {})
+
+
 @pytest.mark.anyio
 async def test_matcher_got(app: App):
     from plugins.matcher.matcher_process import test_got
@@ -321,6 +459,119 @@ async def test_run(app: App):
             assert len(matchers[0][0].handlers) == 0
 
 
+@pytest.mark.anyio
+async def test_handle_event_shared_state(app: App):
+    states: list[T_State] = []
+
+    async def handle(state: T_State):
+        states.append(state)
+        state["handled"] = True
+
+    async def stateful(state: T_State) -> bool:
+        state["checked"] = True
+        return True
+
+    with app.provider.context({}):
+        stateless_matcher = Matcher.new("message", handlers=[handle])
+        stateful_matcher = Matcher.new("message", Rule(stateful), handlers=[handle])
+        assert not stateless_matcher.rule.uses_state
+        assert stateful_matcher.rule.uses_state
+
+        async with app.test_api() as ctx:
+            bot = ctx.create_bot()
+            await handle_event(bot, make_fake_event()())
+
+    # each running matcher gets its own state
+    assert len(states) == 2
+    assert states[0] is not states[1]
+    checked = [state for state in states if "checked" in state]
+    assert len(checked) == 1
+    assert all(state["handled"] for state in states)
+
+
+@pytest.mark.anyio
+async def test_run_continuation(app: App, monkeypatch: pytest.MonkeyPatch):
+    received: list[str] = []
+    rejected = False
+
+    async def pause(matcher: Matcher):
+        await matcher.pause()
+
+    async def reject(matcher: Matcher, event: Event):
+        nonlocal rejected
+        if not rejected:
+            rejected = True
+            await matcher.reject()
+        received.append(event.get_plaintext())
+
+    with app.provider.context({}):
+        test_continuation = Matcher.new(
+            "message", Rule(), Permission(User(("test",))), handlers=[pause, reject]
+        )
+
+        async with app.test_api() as ctx:
+            bot = ctx.create_bot()
+            monkeypatch.setattr(bot.config, "session_continuation", True)
+            try:
+                await handle_event(bot, make_fake_event(_message=FakeMessage("1"))())
+                assert len(continuations) == 1
+                assert len(matchers) == 1
+
+                # other session should not resume the continuation
+                other_event = make_fake_event(
+                    _session_id="other", _message=FakeMessage("other")
+                )()
+                await handle_event(bot, other_event)
+                assert len(continuations) == 1
+
+                # rejected handler is suspended again
+                await handle_event(bot, make_fake_event(_message=FakeMessage("2"))())
+                assert len(continuations) == 1
+                assert not received
+
+                await handle_event(bot, make_fake_event(_message=FakeMessage("3"))())
+                assert not continuations
+                assert received == ["3"]
+                assert list(matchers.values()) == [[test_continuation]]
+            finally:
+                continuations.clear()
+
+
+def test_continuation_registry():
+    registry = ContinuationRegistry()
+    session = MatcherContinuation(Matcher, "message", Permission(User(("a",))), [], {})
+    shared = MatcherContinuation(Matcher, "", Permission(), [], {})
+    expired = MatcherContinuation(
+        Matcher,
+        "message",
+        Permission(User(("b",))),
+        [],
+        {},
+        datetime.now() - timedelta(seconds=1),
+    )
+    registry.add(session)
+    registry.add(shared)
+    assert len(registry) == 2
+    assert session in registry
+
+    assert registry.get_candidates("a") == [shared, session]
+    assert registry.get_candidates("b") == [shared]
+    assert registry.get_candidates(None) == [shared]
+
+    # expired continuations are pruned
+    registry.add(expired)
+    assert registry.get_candidates("b") == [shared]
+    assert expired not in registry
+    assert len(registry) == 2
+
+    assert registry.remove(session)
+    assert not registry.remove(session)
+    assert registry.get_candidates("a") == [shared]
+
+    registry.clear()
+    assert not registry
+
+
 @pytest.mark.anyio
 async def test_temp(app: App):
     from plugins.matcher.matcher_expire import test_temp_matcher
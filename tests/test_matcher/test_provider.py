@@ -1,6 +1,8 @@
 from nonebug import App
 
-from nonebot.matcher import DEFAULT_PROVIDER_CLASS, matchers
+from nonebot.matcher import DEFAULT_PROVIDER_CLASS, Matcher, matchers
+from nonebot.permission import Permission, User
+from nonebot.rule import command, shell_command, to_me
 
 
 def test_manager(app: App):
@@ -10,3 +12,92 @@ def test_manager(app: App):
         assert default_provider == matchers.provider
     finally:
         matchers.provider = app.provider
+
+
+def test_manager_candidates(app: App):
+    with app.provider.context({}):
+        any_matcher = Matcher.new(priority=2)
+        message_matcher = Matcher.new("message", priority=1)
+        notice_matcher = Matcher.new("notice", priority=1)
+
+        assert matchers.get_candidates("message") == (
+            (1, (message_matcher,)),
+            (2, (any_matcher,)),
+        )
+        assert matchers.get_candidates("meta_event") == ((2, (any_matcher,)),)
+        assert matchers.get_candidates() == (
+            (1, (message_matcher, notice_matcher)),
+            (2, (any_matcher,)),
+        )
+
+        message_matcher.destroy()
+        assert matchers.get_candidates("message") == ((2, (any_matcher,)),)
+
+        matchers[1].append(message_matcher)
+        assert matchers.get_candidates("message") == (
+            (1, (message_matcher,)),
+            (2, (any_matcher,)),
+        )
+
+        # attribute changes and in place replacement invalidate the index
+        message_matcher.type = "notice"
+        assert matchers.get_candidates("message") == ((2, (any_matcher,)),)
+        message_matcher.type = "message"
+
+        matchers[1][1] = notice_matcher
+        assert matchers.get_candidates("message") == ((2, (any_matcher,)),)
+
+        notice_matcher.rule = command("help")
+        assert matchers.get_candidates("notice") == ((2, (any_matcher,)),)
+
+    with app.provider.context({}):
+        assert matchers.get_candidates("message") == ()
+
+
+def test_manager_command_candidates(app: App):
+    with app.provider.context({}):
+        any_matcher = Matcher.new("message")
+        help_matcher = Matcher.new("message", command("help") & to_me())
+        shell_matcher = Matcher.new("message", shell_command("help", ("run", "x")))
+        empty_matcher = Matcher.new("message", command("help") & command(("run", "x")))
+
+        assert matchers.get_candidates("message") == ((1, (any_matcher,)),)
+        assert matchers.get_candidates("message", ("help",)) == (
+            (1, (any_matcher, help_matcher, shell_matcher)),
+        )
+        assert matchers.get_candidates("message", ("run", "x")) == (
+            (1, (any_matcher, shell_matcher)),
+        )
+        assert matchers.get_candidates("notice", ("help",)) == ()
+        assert empty_matcher not in matchers.get_candidates(None, ("help",))[0][1]
+
+
+def test_manager_session_candidates(app: App):
+    with app.provider.context({}):
+        any_matcher = Matcher.new("message")
+        session_matcher = Matcher.new(
+            "message", permission=Permission(User(("a",))), temp=True, priority=0
+        )
+        other_matcher = Matcher.new(
+            "message", permission=Permission(User(("b",))), temp=True, priority=0
+        )
+
+        assert matchers.has_session_matchers
+        assert matchers.get_candidates("message") == ((1, (any_matcher,)),)
+        assert matchers.get_candidates("message", session_id="a") == (
+            (0, (session_matcher,)),
+            (1, (any_matcher,)),
+        )
+        assert matchers.get_candidates("notice", session_id="b") == ()
+
+        session_matcher.destroy()
+        assert matchers.get_candidates("message", session_id="a") == (
+            (1, (any_matcher,)),
+        )
+        assert matchers.get_candidates("message", session_id="b") == (
+            (0, (other_matcher,)),
+            (1, (any_matcher,)),
+        )
+
+        other_matcher.destroy()
+        assert not matchers.has_session_matchers
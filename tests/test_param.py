@@ -1,11 +1,16 @@
 from contextlib import suppress
+from functools import partial
 import re
 import sys
+from typing import cast
 
+import anyio
+import anyio.lowlevel
 from exceptiongroup import BaseExceptionGroup
 from nonebug import App
 import pytest
 
+from nonebot.adapters import Event
 from nonebot.consts import (
     ARG_KEY,
     CMD_ARG_KEY,
@@ -31,10 +36,12 @@ from nonebot.params import (
     BotParam,
     DefaultParam,
     DependParam,
+    Depends,
     EventParam,
     ExceptionParam,
     MatcherParam,
     StateParam,
+    get_dependency_cache_statistics,
 )
 from utils import FakeMessage, make_fake_event
 
@@ -162,6 +169,109 @@ async def test_depend(app: App):
         ctx.should_return(1)
 
 
+@pytest.mark.anyio
+async def test_depend_cache_scope(app: App):
+    runned: list[str] = []
+
+    async def _session_config(event: Event) -> str:
+        runned.append(event.get_session_id())
+        await anyio.lowlevel.checkpoint()
+        return event.get_session_id()
+
+    def _bot_profile() -> int:
+        runned.append("bot")
+        return len(runned)
+
+    async def handler(
+        config: str = Depends(_session_config, cache_scope="session"),
+        profile: int = Depends(_bot_profile, cache_scope="bot", cache_size=1),
+    ) -> tuple[str, int]:
+        return config, profile
+
+    dependent = Dependent[tuple[str, int]].parse(
+        call=handler, allow_types=[DependParam, EventParam]
+    )
+    event_a = make_fake_event(_session_id="a")()
+    event_b = make_fake_event(_session_id="b")()
+
+    async with app.test_api() as ctx:
+        bot = ctx.create_bot()
+
+        # concurrent misses are solved only once
+        async with anyio.create_task_group() as tg:
+            for _ in range(3):
+                tg.start_soon(partial(dependent, bot=bot, event=event_a))
+        assert runned == ["a", "bot"]
+
+        assert await dependent(bot=bot, event=event_a) == ("a", 2)
+        assert await dependent(bot=bot, event=event_b) == ("b", 2)
+        assert runned == ["a", "bot", "b"]
+
+        other_bot = ctx.create_bot(self_id="other")
+        assert await dependent(bot=other_bot, event=event_a) == ("a", 5)
+
+    session_cache = cast(DependParam, dependent.params[0].field_info).scoped_cache
+    bot_cache = cast(DependParam, dependent.params[1].field_info).scoped_cache
+    assert session_cache
+    assert bot_cache
+    assert "_session_config:session" in get_dependency_cache_statistics()
+
+    session_stats = session_cache.statistics()
+    assert session_stats.misses == 3
+    assert session_stats.hits == 3
+    bot_stats = bot_cache.statistics()
+    assert bot_stats.misses == 2
+    assert bot_stats.evictions == 1
+
+    # generator dependency only supports event scope
+    def _gen():
+        yield 1
+
+    async def gen_handler(x: int = Depends(_gen, cache_scope="global")): ...
+
+    with pytest.raises(ValueError, match="event cache scope"):
+        Dependent[None].parse(call=gen_handler, allow_types=[DependParam])
+
+
+@pytest.mark.anyio
+async def test_depend_cache_scope_settings(app: App):
+    runned: list[int] = []
+
+    def _counter() -> int:
+        runned.append(1)
+        return len(runned)
+
+    async def handler(
+        short: int = Depends(_counter, cache_scope="global", cache_size=1),
+        long: int = Depends(_counter, cache_scope="global", cache_size=8),
+        same: int = Depends(_counter, cache_scope="global", cache_size=8),
+    ) -> tuple[int, int, int]:
+        return short, long, same
+
+    # differing cache settings use separate caches instead of raising
+    dependent = Dependent[tuple[int, int, int]].parse(
+        call=handler, allow_types=[DependParam]
+    )
+    short_cache = cast(DependParam, dependent.params[0].field_info).scoped_cache
+    long_cache = cast(DependParam, dependent.params[1].field_info).scoped_cache
+    same_cache = cast(DependParam, dependent.params[2].field_info).scoped_cache
+    assert short_cache is not long_cache
+    assert long_cache is same_cache
+
+    async with app.test_api() as ctx:
+        bot = ctx.create_bot()
+        event = make_fake_event()()
+        short, long, same = await dependent(bot=bot, event=event)
+        assert short != long
+        assert long == same
+        assert await dependent(bot=bot, event=event) == (short, long, same)
+        assert len(runned) == 2
+
+    statistics = get_dependency_cache_statistics()
+    assert "_counter:global:ttl=None,size=1" in statistics
+    assert "_counter:global:ttl=None,size=8" in statistics
+
+
 @pytest.mark.anyio
 @pytest.mark.skipif(
     sys.version_info < (3, 12), reason="TypeAlias requires Python 3.12 or higher"
@@ -182,6 +292,7 @@ async def test_aliased_depend(app: App):
 async def test_bot(app: App):
     from plugins.param.param_bot import (
         FooBot,
+        bot_self_id,
         generic_bot,
         generic_bot_none,
         get_bot,
@@ -211,6 +322,13 @@ async def test_bot(app: App):
     with pytest.raises(ValueError, match=UNKNOWN_PARAM):
         app.test_dependent(not_legacy_bot, allow_types=[BotParam])
 
+    async with app.test_dependent(
+        bot_self_id, allow_types=[BotParam, DependParam]
+    ) as ctx:
+        bot = ctx.create_bot()
+        ctx.pass_params(bot=bot)
+        ctx.should_return(bot.self_id)
+
     async with app.test_dependent(sub_bot, allow_types=[BotParam]) as ctx:
         bot = ctx.create_bot(base=FooBot)
         ctx.pass_params(bot=bot)
@@ -243,6 +361,29 @@ async def test_bot(app: App):
         app.test_dependent(not_bot, allow_types=[BotParam])
 
 
+def test_bot_instance_types():
+    from plugins.param.param_bot import (
+        BarBot,
+        FooBot,
+        generic_bot,
+        get_bot,
+        sub_bot,
+        union_bot,
+    )
+
+    def _get_param(call) -> BotParam:
+        dependent = Dependent.parse(call=call, allow_types=[BotParam])
+        return cast(BotParam, dependent.params[0].field_info)
+
+    assert _get_param(get_bot).checker_types is None
+    assert _get_param(sub_bot).checker_types == (FooBot,)
+    assert _get_param(union_bot).checker_types == (FooBot, BarBot)
+    # fallback to pydantic validation for complex annotations
+    generic_param = _get_param(generic_bot)
+    assert generic_param.checker is not None
+    assert generic_param.checker_types is None
+
+
 @pytest.mark.anyio
 @pytest.mark.skipif(
     sys.version_info < (3, 12), reason="TypeAlias requires Python 3.12 or higher"
@@ -263,8 +404,10 @@ async def test_event(app: App):
         event,
         event_message,
         event_plain_text,
+        event_session_id,
         event_to_me,
         event_type,
+        event_user_id,
         generic_event,
         generic_event_none,
         legacy_event,
@@ -344,6 +487,18 @@ async def test_event(app: App):
         ctx.pass_params(event=fake_event)
         ctx.should_return(fake_event.is_tome())
 
+    async with app.test_dependent(
+        event_user_id, allow_types=[EventParam, DependParam]
+    ) as ctx:
+        ctx.pass_params(event=fake_event)
+        ctx.should_return(fake_event.get_user_id())
+
+    async with app.test_dependent(
+        event_session_id, allow_types=[EventParam, DependParam]
+    ) as ctx:
+        ctx.pass_params(event=fake_event)
+        ctx.should_return(fake_event.get_session_id())
+
 
 @pytest.mark.anyio
 @pytest.mark.skipif(
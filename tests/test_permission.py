@@ -1,6 +1,8 @@
+import anyio
 from nonebug import App
 import pytest
 
+from nonebot.adapters import Bot
 from nonebot.exception import SkippedException
 from nonebot.permission import (
     MESSAGE,
@@ -17,6 +19,7 @@ from nonebot.permission import (
     SuperUser,
     User,
 )
+from nonebot.rule import checker_cost
 from utils import make_fake_event
 
 
@@ -52,6 +55,73 @@ async def test_permission(app: App):
         assert await Permission(truthy, skipped)(bot, event) is True
 
 
+@pytest.mark.anyio
+async def test_permission_short_circuit(app: App):
+    called: list[str] = []
+
+    async def expensive() -> bool:
+        called.append("expensive")
+        return True
+
+    async def skipped() -> bool:
+        called.append("skipped")
+        raise SkippedException
+
+    permission = Permission(expensive, short_circuit=True) | MESSAGE
+    assert permission.short_circuit
+    assert (NOTICE | permission).short_circuit
+    assert not (NOTICE | Permission(expensive)).short_circuit
+
+    async with app.test_api() as ctx:
+        bot = ctx.create_bot()
+
+        # message permission is cheap and passes first
+        event = make_fake_event(_type="message")()
+        assert await permission(bot, event) is True
+        assert called == []
+
+        event = make_fake_event(_type="notice")()
+        assert await permission(bot, event) is True
+        assert called == ["expensive"]
+
+        called.clear()
+        permission = Permission(skipped, short_circuit=True) | MESSAGE
+        assert await permission(bot, event) is False
+        assert called == ["skipped"]
+
+
+@pytest.mark.anyio
+async def test_permission_short_circuit_concurrent(app: App):
+    def make_checker():
+        @checker_cost(0.001)
+        async def checker() -> bool:
+            await anyio.sleep(0.001)
+            return False
+
+        return checker
+
+    async def truthy() -> bool:
+        return True
+
+    # truthy runs last until its cost is measured, then moves to the front
+    permission = Permission(
+        *(make_checker() for _ in range(5)), truthy, short_circuit=True
+    )
+    results: list[bool] = []
+
+    async def _check(bot: Bot) -> None:
+        results.append(await permission(bot, make_fake_event()()))
+
+    async with app.test_api() as ctx:
+        bot = ctx.create_bot()
+        async with anyio.create_task_group() as tg:
+            for _ in range(20):
+                tg.start_soon(_check, bot)
+                await anyio.sleep(0.001)
+
+    assert results == [True] * 20
+
+
 @pytest.mark.anyio
 @pytest.mark.parametrize(("type", "expected"), [("message", True), ("notice", False)])
 async def test_message(type: str, expected: bool):
@@ -1,9 +1,13 @@
+import gc
 import re
 from re import Match
+from typing import cast
 
+import anyio
 from nonebug import App
 import pytest
 
+from nonebot.adapters import Bot, Event
 from nonebot.consts import (
     CMD_ARG_KEY,
     CMD_KEY,
@@ -18,6 +22,7 @@ from nonebot.consts import (
     STARTSWITH_KEY,
 )
 from nonebot.exception import ParserExit, SkippedException
+from nonebot.params import Depends
 from nonebot.rule import (
     CMD_RESULT,
     TRIE_VALUE,
@@ -34,6 +39,10 @@ from nonebot.rule import (
     StartswithRule,
     ToMeRule,
     TrieRule,
+    _AhoCorasick,
+    _RegexIndex,
+    _TextIndex,
+    checker_cost,
     command,
     endswith,
     fullmatch,
@@ -80,6 +89,103 @@ async def test_rule(app: App):
         assert await Rule(truthy, skipped)(bot, event, {}) is False
 
 
+def test_rule_uses_state():
+    async def stateless(bot: Bot, event: Event) -> bool:
+        return True
+
+    async def stateful(state: T_State) -> bool:
+        return True
+
+    async def sub_stateful(value: bool = Depends(stateful)) -> bool:
+        return value
+
+    assert not Rule().uses_state
+    assert not Rule(stateless).uses_state
+    assert Rule(stateless, stateful).uses_state
+    assert Rule(sub_stateful).uses_state
+    assert startswith("a").uses_state
+
+    # checkers added later are detected
+    rule = Rule(stateless)
+    assert not rule.uses_state
+    rule.checkers.add(next(iter(Rule(stateful).checkers)))
+    assert rule.uses_state
+
+
+@pytest.mark.anyio
+async def test_rule_short_circuit(app: App):
+    called: list[str] = []
+
+    async def expensive() -> bool:
+        called.append("expensive")
+        return True
+
+    @checker_cost(0.5)
+    async def falsy() -> bool:
+        called.append("falsy")
+        return False
+
+    async def skipped() -> bool:
+        called.append("skipped")
+        raise SkippedException
+
+    rule = Rule(expensive, short_circuit=True) & to_me()
+    assert rule.short_circuit
+    assert (to_me() & rule).short_circuit
+    assert not (to_me() & Rule(expensive)).short_circuit
+
+    async with app.test_api() as ctx:
+        bot = ctx.create_bot()
+
+        # to me rule is cheap and runs first
+        event = make_fake_event(_to_me=False)()
+        assert await rule(bot, event, {}) is False
+        assert called == []
+
+        event = make_fake_event(_to_me=True)()
+        assert await rule(bot, event, {}) is True
+        assert called == ["expensive"]
+
+        # declared cost runs before unmeasured checkers
+        called.clear()
+        assert await Rule(expensive, falsy, short_circuit=True)(bot, event, {}) is False
+        assert called == ["falsy"]
+
+        called.clear()
+        assert await Rule(skipped, short_circuit=True)(bot, event, {}) is False
+        assert called == ["skipped"]
+
+
+@pytest.mark.anyio
+async def test_rule_short_circuit_concurrent(app: App):
+    def make_checker():
+        @checker_cost(0.001)
+        async def checker() -> bool:
+            await anyio.sleep(0.001)
+            return True
+
+        return checker
+
+    async def falsy() -> bool:
+        return False
+
+    # falsy runs last until its cost is measured, then moves to the front
+    rule = Rule(*(make_checker() for _ in range(5)), falsy, short_circuit=True)
+    results: list[bool] = []
+
+    async def _check(bot: Bot) -> None:
+        results.append(await rule(bot, make_fake_event()(), {}))
+
+    async with app.test_api() as ctx:
+        bot = ctx.create_bot()
+        async with anyio.create_task_group() as tg:
+            for _ in range(20):
+                tg.start_soon(_check, bot)
+                await anyio.sleep(0.001)
+
+    assert results == [False] * 20
+
+
 @pytest.mark.anyio
 async def test_trie(app: App):
     TrieRule.add_prefix("/fake-prefix", TRIE_VALUE("/", ("fake-prefix",)))
@@ -265,6 +371,58 @@ async def test_fullmatch(
         assert await dependent(event=event, state=state) == expected
 
 
+@pytest.mark.anyio
+async def test_text_rules_shared_scan(monkeypatch: pytest.MonkeyPatch):
+    scanned: list[str] = []
+    search = _AhoCorasick.search
+
+    def _search(self: _AhoCorasick, text: str) -> set[str]:
+        scanned.append(text)
+        return search(self, text)
+
+    monkeypatch.setattr(_AhoCorasick, "search", _search)
+    monkeypatch.setattr("nonebot.rule._text_index", _TextIndex())
+
+    rules = [
+        (startswith(("a", "ab")), STARTSWITH_KEY, "a"),
+        (endswith(("c", "bc")), ENDSWITH_KEY, "bc"),
+        (fullmatch("ABC\n", ignorecase=True), FULLMATCH_KEY, "abc\n"),
+        (keyword("x", "b"), KEYWORD_KEY, "b"),
+    ]
+
+    event = make_fake_event(_message=FakeMessage("abc\n"))()
+    for rule, key, expected in rules:
+        dependent = next(iter(rule.checkers))
+        state = {}
+        assert await dependent(event=event, state=state)
+        assert state[key] == expected
+
+    # plain text is scanned only once for all rules
+    assert scanned == ["abc\n"]
+
+    # rules created after the scan still get the right result
+    checker = StartswithRule(("abc",))
+    state = {}
+    assert await checker(event, state)
+    assert state[STARTSWITH_KEY] == "abc"
+
+
+@pytest.mark.anyio
+async def test_text_rules_direct_call():
+    event = make_fake_event(_message=FakeMessage("hello world"))()
+    state = {}
+    assert await StartswithRule(("hello",))(event, state)
+    assert state[STARTSWITH_KEY] == "hello"
+    assert await EndswithRule(("world",))(event, state)
+    assert state[ENDSWITH_KEY] == "world"
+    assert await FullmatchRule(("hello world",))(event, state)
+    assert state[FULLMATCH_KEY] == "hello world"
+    assert await KeywordsRule("foo", "world")(event, state)
+    assert state[KEYWORD_KEY] == "world"
+    assert await RegexRule(r"w(or)ld")(event, state)
+    assert state[REGEX_MATCHED].group(1) == "or"
+
+
 @pytest.mark.anyio
 @pytest.mark.parametrize(
     ("kws", "type", "text", "expected"),
@@ -515,6 +673,87 @@ async def test_regex(
         assert result.span() == matched.span()
 
 
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    ("pattern", "flags", "literals"),
+    [
+        (r"hello (\w+) world", 0, frozenset(("hello ",))),
+        (r"(?:foo|bar)\d+", 0, frozenset(("foo", "bar"))),
+        (r"(?:foo|\w)x", 0, frozenset(("x",))),
+        (r"(?:foo)?x+", 0, frozenset(("x",))),
+        (r"foo|\d", 0, None),
+        (r"hello", re.IGNORECASE, None),
+        (r"(?i:hello)", 0, None),
+    ],
+)
+async def test_regex_prefilter(
+    pattern: str,
+    flags: int,
+    literals: frozenset[str] | None,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    scanned: list[str] = []
+    search = _AhoCorasick.search
+
+    def _search(self: _AhoCorasick, text: str) -> set[str]:
+        scanned.append(text)
+        return search(self, text)
+
+    monkeypatch.setattr(_AhoCorasick, "search", _search)
+    monkeypatch.setattr("nonebot.rule._regex_index", _RegexIndex())
+
+    checker = RegexRule(pattern, flags)
+    assert checker._literals == literals
+
+    text = "hello key1 world foo12 xx"
+    event = make_fake_event(_message=FakeMessage(text))()
+    for rule in (regex(pattern, flags), regex(r"(?P<key>key\d)"), regex("nothing")):
+        dependent = next(iter(rule.checkers))
+        checker = cast(RegexRule, dependent.call)
+        state = {}
+        matched = re.search(checker.regex, text, checker.flags)
+        assert await dependent(event=event, state=state) is bool(matched)
+        if matched:
+            assert state[REGEX_MATCHED].group() == matched.group()
+
+    # message string is scanned only once
+    assert scanned == [text]
+
+
+def test_text_index_registry():
+    index = _TextIndex()
+    text = "hello world"
+
+    class Owner:
+        pass
+
+    owners = [Owner() for _ in range(2)]
+    index.add_prefixes(owners[0], ("hello",))
+    index.add_prefixes(owners[1], ("hi",))
+    # index is rebuilt lazily on the next scan
+    assert index._built == -1
+    scan = index.scan(text)
+    assert scan.prefixes == {"hello"}
+    assert index.scan(text) is scan
+
+    # already indexed patterns do not invalidate the index
+    generation = index.generation
+    extra = Owner()
+    assert index.add_prefixes(extra, ("hi",)) == generation
+    assert index.scan(text) is scan
+
+    # patterns of collected rules are pruned once they dominate the index
+    temporary = [Owner() for _ in range(64)]
+    for i, owner in enumerate(temporary):
+        index.add_keywords(owner, (f"key{i}",))
+    assert index.scan(f"{text} key1").keywords == {"key1"}
+    del temporary, owner
+    gc.collect()
+    assert index._keywords.stale
+    assert index.scan(f"{text} key1").keywords == set()
+    assert not index._keywords.stale
+
+
 @pytest.mark.anyio
 @pytest.mark.parametrize("expected", [True, False])
 async def test_to_me(expected: bool):
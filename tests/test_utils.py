@@ -1,23 +1,42 @@
 import copy
+from functools import partial
 import json
+import os
 import pickle
+import threading
 from typing import ClassVar, Dict, List, Literal, TypeVar, Union  # noqa: UP035
 
+import anyio
+from exceptiongroup import BaseExceptionGroup
 from pydantic import ValidationError
 import pytest
 
 from nonebot.compat import type_validate_python
+from nonebot.dependencies import Dependent
+from nonebot.params import DependParam, Depends
 from nonebot.utils import (
     UNSET,
     DataclassEncoder,
+    LRUCache,
     Unset,
     UnsetType,
     escape_tag,
     exclude_unset,
     generic_check_issubclass,
+    get_executor,
+    get_executor_statistics,
     is_async_gen_callable,
     is_coroutine_callable,
     is_gen_callable,
+    resolve_executor,
+    run_concurrently,
+    run_in_process,
+    run_sync,
+    set_executors,
+    set_inline_single_task,
+    shutdown_executors,
+    start_executors,
+    sync_executor,
 )
 from utils import FakeMessage, FakeMessageSegment
 
@@ -155,3 +174,174 @@ def test_dataclass_encoder():
         '"data": {"content": [{"type": "text", "data": {"text": "text"}}]}'
         "}"
     )
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("inline", [False, True])
+async def test_run_concurrently(monkeypatch: pytest.MonkeyPatch, inline: bool):
+    created = 0
+    create_task_group = anyio.create_task_group
+
+    def _create_task_group():
+        nonlocal created
+        created += 1
+        return create_task_group()
+
+    monkeypatch.setattr(anyio, "create_task_group", _create_task_group)
+    set_inline_single_task(inline)
+
+    called: list[int] = []
+
+    async def _append(i: int):
+        called.append(i)
+
+    async def _error():
+        raise ValueError
+
+    try:
+        await run_concurrently()
+        await run_concurrently(partial(_append, 1))
+        await run_concurrently(cheap_funcs=[partial(_append, 2)])
+        await run_concurrently(
+            partial(_append, 3), partial(_append, 4), cheap_funcs=[partial(_append, 5)]
+        )
+        assert sorted(called) == [1, 2, 3, 4, 5]
+        assert created == (1 if inline else 3)
+
+        with pytest.raises(BaseExceptionGroup) as exc_info:
+            await run_concurrently(_error)
+        assert exc_info.group_contains(ValueError)
+
+        with pytest.raises(BaseExceptionGroup) as exc_info:
+            await run_concurrently(partial(_append, 6), cheap_funcs=[_error])
+        assert exc_info.group_contains(ValueError)
+    finally:
+        set_inline_single_task(False)
+
+
+@pytest.mark.anyio
+async def test_sync_executor():
+    def _thread_id() -> int:
+        return threading.get_ident()
+
+    @sync_executor("limited")
+    def _limited() -> int:
+        return threading.get_ident()
+
+    set_executors({"limited": 1, "cheap": 0})
+    try:
+        assert resolve_executor(_thread_id) == "default"
+        assert resolve_executor(_thread_id, "cheap") == "cheap"
+        assert resolve_executor(_limited) == "limited"
+        assert get_executor("unknown") is get_executor("default")
+
+        main_thread = threading.get_ident()
+        assert await run_sync(_thread_id, executor="cheap")() == main_thread
+        assert await run_sync(_thread_id)() != main_thread
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(3):
+                tg.start_soon(run_sync(_limited))
+
+        stats = get_executor_statistics()
+        assert stats["cheap"].max_workers == 0
+        assert stats["cheap"].completed == 1
+        assert stats["default"].completed == 1
+        assert stats["limited"].max_workers == 1
+        assert stats["limited"].submitted == stats["limited"].completed == 3
+        assert stats["limited"].running == stats["limited"].waiting == 0
+
+        # dependency executor
+        def _dependency() -> int:
+            return threading.get_ident()
+
+        async def _handler(value: int = Depends(_dependency, executor="cheap")):
+            return value
+
+        dependent = Dependent[int].parse(call=_handler, allow_types=[DependParam])
+        assert await dependent() == main_thread
+        assert get_executor("cheap").statistics().completed == 2
+    finally:
+        set_executors({})
+
+
+@run_in_process
+def _process_square(value: int) -> tuple[int, int]:
+    if value < 0:
+        raise ValueError("negative value")
+    return os.getpid(), value * value
+
+
+@pytest.mark.anyio
+async def test_process_executor():
+    set_executors({"process": 1})
+    try:
+        await start_executors()
+        assert resolve_executor(_process_square) == "process"
+
+        pid, result = await run_sync(_process_square)(3)
+        assert pid != os.getpid()
+        assert result == 9
+
+        with pytest.raises(ValueError, match="negative value"):
+            await run_sync(_process_square)(-1)
+
+        # arguments must be picklable
+        with pytest.raises(TypeError, match="picklable"):
+            await run_sync(_process_square)(lambda: 1)  # type: ignore
+
+        stats = get_executor_statistics()["process"]
+        assert stats.max_workers == 1
+        assert stats.submitted == stats.completed == 2
+    finally:
+        await shutdown_executors()
+        set_executors({})
+
+
+@pytest.mark.anyio
+async def test_lru_cache():
+    cache = LRUCache[str, int](maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    # "b" is least recently used
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+    called = 0
+
+    async def _factory() -> int:
+        nonlocal called
+        called += 1
+        await anyio.sleep(0.01)
+        return called
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(3):
+            tg.start_soon(cache.get_or_create, "d", _factory)
+    assert called == 1
+    assert await cache.get_or_create("d", _factory) == 1
+
+    async def _fail() -> int:
+        raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_create("e", _fail)
+    assert cache.get("e") is None
+
+    stats = cache.statistics()
+    assert stats.hits == 5
+    assert stats.misses == 4
+    assert stats.evictions == 2
+    assert stats.size == stats.maxsize == 2
+
+    ttl_cache = LRUCache[str, int](ttl=0.01)
+    ttl_cache.set("a", 1)
+    assert ttl_cache.get("a") == 1
+    await anyio.sleep(0.02)
+    assert ttl_cache.get("a") is None
+
+    with pytest.raises(ValueError, match="positive"):
+        LRUCache(maxsize=0)